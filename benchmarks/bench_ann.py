@@ -0,0 +1,80 @@
+"""
+Recall and latency of IVFVectorStore against exact NumpyVectorStore search.
+
+Vectors are drawn around random topic centers, so neighbours cluster the way
+embeddings of related transcript chunks do. For each corpus size the IVF index is
+built by adding vectors in batches, as the pipeline's streaming indexer does. The
+benchmark then reports per-query latency and recall@k (the fraction of the exact
+top k found) at several nprobe values, next to exact search.
+
+Run from the repository root:
+    python -m benchmarks.bench_ann
+    python -m benchmarks.bench_ann --sizes 100000 1000000 --nprobe 1 4 16 64
+"""
+import argparse
+import time
+import timeit
+from typing import Any, Callable
+
+import numpy as np
+
+from src.pipeline.ann_index import IVFVectorStore
+from src.pipeline.vector_store import NumpyVectorStore
+
+
+def best(func: Callable[[], Any], repeat: int) -> float:
+    """Best time per call in milliseconds."""
+    return min(timeit.repeat(func, repeat=repeat, number=1)) * 1e3
+
+
+def clustered(rng: np.random.Generator, centers: np.ndarray, n: int, spread: float) -> np.ndarray:
+    """n vectors scattered around randomly chosen centers."""
+    points = centers[rng.integers(0, len(centers), n)]
+    return (points + spread * rng.standard_normal(points.shape)).astype(np.float32)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000], help="corpus sizes")
+    parser.add_argument("--dim", type=int, default=128, help="embedding dimension")
+    parser.add_argument("--topics", type=int, default=5_000, help="cluster centers the vectors are drawn around")
+    parser.add_argument("--spread", type=float, default=0.5, help="noise around each center")
+    parser.add_argument("--k", type=int, default=10, help="results per query")
+    parser.add_argument("--queries", type=int, default=200, help="queries per measurement")
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32], help="nprobe values")
+    parser.add_argument("--repeat", type=int, default=3, help="timing repetitions per case (best is reported)")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    centers = rng.standard_normal((args.topics, args.dim))
+    queries = clustered(rng, centers, args.queries, args.spread)
+
+    print(f"{'vectors':>9} {'search':<12} {'build s':>8} {'ms/query':>9} {f'recall@{args.k}':>10}")
+    for size in args.sizes:
+        vectors = clustered(rng, centers, size, args.spread)
+        texts = [""] * size
+
+        exact = NumpyVectorStore(embedding=None)
+        exact.add_vectors(vectors, texts)
+        expected = exact.top_k(queries, args.k)[0]
+        # One query at a time, as a lesson request searches
+        exact_ms = best(lambda: [exact.top_k(query, args.k) for query in queries], args.repeat) / args.queries
+        print(f"{size:>9} {'exact':<12} {'':>8} {exact_ms:9.3f} {1.0:10.3f}")
+        del exact
+
+        ivf = IVFVectorStore(embedding=None)
+        started = time.perf_counter()
+        for i in range(0, size, 1000):
+            ivf.add_vectors(vectors[i:i + 1000], texts[i:i + 1000])
+        build_s = time.perf_counter() - started
+        for nprobe in args.nprobe:
+            ivf.nprobe = nprobe
+            found = np.concatenate([ivf.top_k(query, args.k)[0] for query in queries])
+            recall = np.mean([len(set(a) & set(e)) / args.k for a, e in zip(found.tolist(), expected.tolist())])
+            ivf_ms = best(lambda: [ivf.top_k(query, args.k) for query in queries], args.repeat) / args.queries
+            print(f"{size:>9} {f'ivf/{nprobe}':<12} {build_s:8.1f} {ivf_ms:9.3f} {recall:10.3f}")
+        del ivf
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Compare the fixed 400-character chunker with the token-budget sentence chunker.
+
+Reports chunking time, chunk count and how full chunks are for synthetic
+transcripts of multi-hour videos, with and without punctuation (manual vs
+auto-generated captions) and in a dense script.
+
+Run from the repository root:
+    python -m benchmarks.bench_chunker
+"""
+import argparse
+import random
+import timeit
+from typing import Any, Callable, List
+
+from src.models.transcript import TranscriptSegments
+from src.pipeline.chunker import Chunker, estimate_tokens
+
+LATIN_WORDS = ["hola", "que", "tal", "estamos", "aprendiendo", "español", "con", "vídeos", "de", "cocina"]
+CJK_WORDS = ["今日", "は", "料理", "を", "作り", "ましょう", "とても", "簡単", "です", "ね"]
+
+
+def make_segments(lines: int, words: List[str], separator: str, punctuate: bool) -> TranscriptSegments:
+    """Synthetic caption lines of 3-8 words, about 2.5 seconds each."""
+    rng = random.Random(0)
+    texts, starts, durations = [], [], []
+    start = 0.0
+    for _ in range(lines):
+        text = separator.join(rng.choices(words, k=rng.randint(3, 8)))
+        if punctuate and rng.random() < 0.4:
+            text += "。" if separator == "" else "."
+        duration = rng.uniform(1.0, 4.0)
+        texts.append(text)
+        starts.append(start)
+        durations.append(duration)
+        start += duration
+    return TranscriptSegments.from_lines(texts, starts, durations)
+
+
+def best(func: Callable[[], Any], repeat: int) -> float:
+    """Best time per call in milliseconds."""
+    return min(timeit.repeat(func, repeat=repeat, number=1)) * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=5_000, help="caption lines per transcript (~3.5 hours)")
+    parser.add_argument("--max-tokens", type=int, default=128, help="token budget for the sentence chunker")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions per case (best is reported)")
+    args = parser.parse_args()
+
+    chunker = Chunker()
+    cases = [
+        ("latin, punctuated", make_segments(args.lines, LATIN_WORDS, " ", True)),
+        ("latin, no punct.", make_segments(args.lines, LATIN_WORDS, " ", False)),
+        ("cjk, punctuated", make_segments(args.lines, CJK_WORDS, "", True)),
+    ]
+
+    print(f"{'transcript':<18} {'chunker':<9} {'ms':>8} {'chunks':>7} {'mean tok':>9} {'max tok':>8}")
+    for name, segments in cases:
+        text = segments.to_text()
+        runs = [
+            ("fixed", lambda: chunker.chunk(text)),
+            ("sentence", lambda: chunker.chunk_sentences(segments, max_tokens=args.max_tokens)),
+        ]
+        for label, run in runs:
+            elapsed = best(run, args.repeat)
+            tokens = [estimate_tokens(chunk.content) for chunk in run()]
+            print(f"{name:<18} {label:<9} {elapsed:8.2f} {len(tokens):7d} "
+                  f"{sum(tokens) / len(tokens):9.1f} {max(tokens):8d}")
+
+
+if __name__ == "__main__":
+    main()
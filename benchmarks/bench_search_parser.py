@@ -0,0 +1,151 @@
+"""
+Benchmark the single-pass search page parser against the previous regex implementation.
+
+Run from the repository root:
+    python -m benchmarks.bench_search_parser
+"""
+import argparse
+import json
+import re
+import timeit
+from typing import List
+
+from src.pipeline.search_parser import parse_search_results, IncrementalSearchParser
+
+
+def legacy_extract_title_near_video_id(html_content: str, video_id: str) -> str:
+    """Title lookup used before the single-pass parser (rescans the whole page per ID)."""
+    patterns = [
+        rf'"title"\s*:\s*{{\s*"runs"\s*:\s*\[\s*{{\s*"text"\s*:\s*"([^"]+?)"\s*}}\s*\]\s*}}\s*,\s*"videoId"\s*:\s*"{re.escape(video_id)}"',
+        rf'"videoId"\s*:\s*"{re.escape(video_id)}"\s*,\s*"title"\s*:\s*{{\s*"runs"\s*:\s*\[\s*{{\s*"text"\s*:\s*"([^"]+?)"',
+        rf'href="/watch\?v={re.escape(video_id)}"[^>]*>\s*([^<]+?)\s*</a>',
+    ]
+    for pattern in patterns:
+        match = re.search(pattern, html_content, re.DOTALL)
+        if match:
+            return match.group(1)
+    return "Unknown Title"
+
+
+def legacy_extract_video_ids(html_content: str, max_results: int) -> List[tuple]:
+    """Extraction used before the single-pass parser."""
+    video_data = []
+    json_match = re.search(r'var ytInitialData = ({.*?});', html_content, re.DOTALL)
+    if json_match:
+        try:
+            data = json.loads(json_match.group(1))
+            contents = data.get('contents', {}).get('twoColumnSearchResultsRenderer', {}).get('primaryContents', {}).get('sectionListRenderer', {}).get('contents', [])
+            for section in contents:
+                for item in section.get('itemSectionRenderer', {}).get('contents', []):
+                    video_renderer = item.get('videoRenderer', {})
+                    if video_renderer:
+                        video_id = video_renderer.get('videoId')
+                        title = video_renderer.get('title', {}).get('runs', [{}])[0].get('text', 'Unknown Title')
+                        if video_id:
+                            video_data.append((video_id, title))
+                            if len(video_data) >= max_results:
+                                return video_data
+        except Exception:
+            pass
+
+    if not video_data:
+        patterns = [
+            r'"/watch\?v=([a-zA-Z0-9_-]{11})"',
+            r'"videoId":"([a-zA-Z0-9_-]{11})"',
+            r'/vi/([a-zA-Z0-9_-]{11})/',
+        ]
+        seen = set()
+        for pattern in patterns:
+            for match in re.findall(pattern, html_content):
+                if match not in seen:
+                    seen.add(match)
+                    video_data.append((match, legacy_extract_title_near_video_id(html_content, match)))
+                    if len(video_data) >= max_results:
+                        return video_data
+
+    return video_data[:max_results]
+
+
+def make_video_renderer(index: int) -> dict:
+    """A videoRenderer roughly shaped like the real thing, thumbnails and all."""
+    video_id = f"vid{index:08d}"
+    return {
+        "videoRenderer": {
+            "videoId": video_id,
+            "thumbnail": {"thumbnails": [
+                {"url": f"https://i.ytimg.com/vi/{video_id}/hq{size}.jpg", "width": size, "height": size}
+                for size in (120, 240, 360, 480)
+            ]},
+            "title": {"runs": [{"text": f"Synthetic video number {index}"}]},
+            "descriptionSnippet": {"runs": [{"text": "lorem ipsum dolor sit amet " * 20}]},
+            "ownerText": {"runs": [{"text": f"Channel {index % 17}"}]},
+            "viewCountText": {"simpleText": f"{index * 131} views"},
+            "navigationEndpoint": {"commandMetadata": {"webCommandMetadata": {"url": f"/watch?v={video_id}"}}},
+            "trackingParams": "x" * 400,
+        }
+    }
+
+
+def make_search_page(n_results: int, padding_bytes: int, with_initial_data: bool = True) -> str:
+    """Build a synthetic search results page of roughly the requested size."""
+    data = {
+        "contents": {"twoColumnSearchResultsRenderer": {"primaryContents": {"sectionListRenderer": {"contents": [
+            {"itemSectionRenderer": {"contents": [make_video_renderer(i) for i in range(n_results)]}}
+        ]}}}}
+    }
+    blob = json.dumps(data, separators=(",", ":"))
+    padding = "<script>var ytcfg = {};" + ("/* filler */ " * (padding_bytes // 13)) + "</script>"
+    if with_initial_data:
+        script = f"<script>var ytInitialData = {blob};</script>"
+    else:
+        # Same renderers, but not assigned to ytInitialData - forces the fallback scan
+        script = f"<script>var somethingElse = {blob};</script>"
+    return f"<html><head>{padding}</head><body>{script}{padding}</body></html>"
+
+
+def bench(label: str, html: str, max_results: int, repeat: int) -> None:
+    """Time both implementations on one page and print a result row."""
+    expected = legacy_extract_video_ids(html, max_results)
+    actual = parse_search_results(html, max_results)
+    assert [video_id for video_id, _ in actual] == [video_id for video_id, _ in expected], label
+
+    legacy = min(timeit.repeat(lambda: legacy_extract_video_ids(html, max_results), number=1, repeat=repeat))
+    current = min(timeit.repeat(lambda: parse_search_results(html, max_results), number=1, repeat=repeat))
+    print(f"{label:<34} {len(html) / 1e6:>7.2f} MB {max_results:>5} {legacy * 1e3:>11.2f} ms "
+          f"{current * 1e3:>11.2f} ms {legacy / current:>8.1f}x")
+
+
+def bytes_read_when_streaming(html: str, max_results: int, chunk_size: int = 16 * 1024) -> int:
+    """How much of the page a streaming search reads before it can stop."""
+    body = html.encode("utf-8")
+    parser = IncrementalSearchParser(max_results)
+    for start in range(0, len(body), chunk_size):
+        if parser.feed(body[start:start + chunk_size].decode("utf-8", errors="replace")):
+            return start + chunk_size
+    return len(body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions per case (best is reported)")
+    args = parser.parse_args()
+
+    print(f"{'case':<34} {'size':>10} {'k':>5} {'legacy':>14} {'single-pass':>14} {'speedup':>9}")
+    for n_results, padding in ((20, 500_000), (20, 2_000_000), (100, 4_000_000)):
+        for max_results in (3, 10):
+            for with_initial_data in (True, False):
+                html = make_search_page(n_results, padding, with_initial_data)
+                label = f"{n_results} results, {'ytInitialData' if with_initial_data else 'fallback'}"
+                bench(label, html, max_results, args.repeat)
+
+    print(f"\n{'streamed download':<34} {'size':>10} {'k':>5} {'bytes read':>14} {'of page':>9}")
+    for n_results, padding in ((20, 500_000), (100, 4_000_000)):
+        html = make_search_page(n_results, padding)
+        for max_results in (3, 10):
+            read = bytes_read_when_streaming(html, max_results)
+            print(f"{f'{n_results} results, ytInitialData':<34} {len(html) / 1e6:>7.2f} MB {max_results:>5} "
+                  f"{read / 1e6:>11.2f} MB {read / len(html):>9.0%}")
+
+
+if __name__ == "__main__":
+    main()
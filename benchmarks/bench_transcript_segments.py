@@ -0,0 +1,86 @@
+"""
+Compare TranscriptSegments with the list-of-dicts transcript returned by to_raw_data().
+
+Reports memory held, time-range query latency and cache serialization cost for
+synthetic transcripts of multi-hour videos.
+
+Run from the repository root:
+    python -m benchmarks.bench_transcript_segments
+"""
+import argparse
+import json
+import random
+import timeit
+import tracemalloc
+import zlib
+from typing import Any, Callable, Dict, List, Tuple
+
+from src.models.transcript import TranscriptSegments
+
+WORDS = ["hola", "que", "tal", "estamos", "aprendiendo", "español", "con", "vídeos", "de", "cocina"]
+
+
+def make_raw_data(lines: int) -> List[Dict[str, Any]]:
+    """Synthetic caption lines of 3-8 words, about 2.5 seconds each."""
+    rng = random.Random(0)
+    entries = []
+    start = 0.0
+    for _ in range(lines):
+        duration = round(rng.uniform(1.0, 4.0), 3)
+        entries.append({"text": " ".join(rng.choices(WORDS, k=rng.randint(3, 8))),
+                        "start": round(start, 3), "duration": duration})
+        start += duration
+    return entries
+
+
+def measure_memory(build: Callable[[], Any]) -> Tuple[Any, int]:
+    """Bytes allocated and still held by the object build() returns."""
+    tracemalloc.start()
+    obj = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size
+
+
+def best(func: Callable[[], Any], repeat: int, number: int) -> float:
+    """Best time per call in microseconds."""
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions per case (best is reported)")
+    args = parser.parse_args()
+
+    print(f"{'lines':>7} {'dicts MB':>9} {'columnar MB':>12} {'ratio':>6} "
+          f"{'range dicts':>12} {'range cols':>11} {'ser json':>9} {'ser cols':>9} {'de json':>9} {'de cols':>9}")
+    for lines in (5_000, 20_000, 60_000):
+        source = make_raw_data(lines)
+        # Decode from JSON so every dict owns fresh str and float objects, as after a fetch
+        encoded = json.dumps(source)
+        raw, raw_bytes = measure_memory(lambda: json.loads(encoded))
+        segments, seg_bytes = measure_memory(lambda: TranscriptSegments.from_raw_data(raw))
+
+        # A five-minute window in the middle of the video
+        middle = raw[lines // 2]["start"]
+        window = (middle, middle + 300.0)
+        range_dicts = best(lambda: [e for e in raw if e["start"] < window[1] and e["start"] + e["duration"] > window[0]],
+                           args.repeat, 20)
+        range_cols = best(lambda: segments.time_slice(*window), args.repeat, 2000)
+
+        json_blob = zlib.compress(json.dumps([[e["text"], e["start"], e["duration"]] for e in raw]).encode(), 6)
+        cols_blob = zlib.compress(segments.to_bytes(), 6)
+        ser_json = best(lambda: zlib.compress(json.dumps([[e["text"], e["start"], e["duration"]] for e in raw]).encode(), 6),
+                        args.repeat, 3)
+        ser_cols = best(lambda: zlib.compress(segments.to_bytes(), 6), args.repeat, 3)
+        de_json = best(lambda: [{"text": t, "start": s, "duration": d}
+                                for t, s, d in json.loads(zlib.decompress(json_blob))], args.repeat, 3)
+        de_cols = best(lambda: TranscriptSegments.from_bytes(zlib.decompress(cols_blob)), args.repeat, 3)
+
+        print(f"{lines:>7} {raw_bytes / 1e6:>9.2f} {seg_bytes / 1e6:>12.2f} {raw_bytes / seg_bytes:>5.1f}x "
+              f"{range_dicts:>10.0f}us {range_cols:>9.1f}us {ser_json / 1e3:>7.1f}ms {ser_cols / 1e3:>7.1f}ms "
+              f"{de_json / 1e3:>7.1f}ms {de_cols / 1e3:>7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Compare NumpyVectorStore with langchain_core's InMemoryVectorStore, which it replaced.
+
+The baseline is langchain_core.vectorstores.InMemoryVectorStore itself, filled
+through add_documents with an embedding model that returns precomputed vectors
+and searched with similarity_search_by_vector, so it pays for its own list
+storage, cosine_similarity helper and Document objects. Reports add time,
+single-query latency and per-query latency for a batch of queries at 1k, 100k
+and 1M vectors. The baseline is skipped above --legacy-max vectors, where its
+list storage no longer fits in a few GB of memory.
+
+Run from the repository root:
+    python -m benchmarks.bench_vector_store
+"""
+import argparse
+import time
+import timeit
+from typing import Any, Callable, List
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import InMemoryVectorStore
+
+from src.pipeline.vector_store import NumpyVectorStore
+
+
+class FixedEmbeddings(Embeddings):
+    """Embedding model that returns precomputed vectors, as lists like OpenAIEmbeddings does."""
+
+    def __init__(self, texts: List[str], vectors: np.ndarray):
+        self.vectors = dict(zip(texts, vectors.tolist()))
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self.vectors[text] for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.vectors[text]
+
+
+def best(func: Callable[[], Any], repeat: int, number: int = 1) -> float:
+    """Best time per call in milliseconds."""
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number * 1e3
+
+
+def timed(func: Callable[[], Any]) -> float:
+    """Wall time of one call in milliseconds."""
+    started = time.perf_counter()
+    func()
+    return (time.perf_counter() - started) * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dim", type=int, default=128, help="embedding dimension")
+    parser.add_argument("--k", type=int, default=3, help="results per query")
+    parser.add_argument("--batch", type=int, default=64, help="queries per batched search")
+    parser.add_argument("--legacy-max", type=int, default=100_000, help="largest size to run the baseline at")
+    parser.add_argument("--repeat", type=int, default=3, help="timing repetitions per case (best is reported)")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    queries = rng.standard_normal((args.batch, args.dim)).astype(np.float32)
+
+    print(f"{'vectors':>9} {'store':<9} {'add ms':>9} {'query ms':>9} {'batched ms/q':>13} {'matrix MB':>10}")
+    for size in (1_000, 100_000, 1_000_000):
+        vectors = rng.standard_normal((size, args.dim)).astype(np.float32)
+        texts = [f"chunk {i}" for i in range(size)]
+
+        store = NumpyVectorStore(embedding=None)
+        # Add in batches, as the pipeline's streaming indexer does
+        add_ms = timed(lambda: [store.add_vectors(vectors[i:i + 1000], texts[i:i + 1000])
+                                for i in range(0, size, 1000)])
+        query_ms = best(lambda: store.top_k(queries[0], args.k), args.repeat, number=5)
+        batched_ms = best(lambda: store.top_k(queries, args.k), args.repeat) / args.batch
+        print(f"{size:>9} {'numpy':<9} {add_ms:9.1f} {query_ms:9.3f} {batched_ms:13.4f} {store.nbytes / 1e6:10.1f}")
+
+        # Both stores must agree on the nearest neighbours
+        expected = [str(i) for i in store.top_k(queries[0], args.k)[0][0]]
+        del store
+
+        if size <= args.legacy_max:
+            legacy = InMemoryVectorStore(embedding=FixedEmbeddings(texts, vectors))
+            documents = [Document(page_content=text) for text in texts]
+            ids = [str(i) for i in range(size)]
+            add_ms = timed(lambda: legacy.add_documents(documents, ids=ids))
+            query = queries[0].tolist()
+            assert [doc.id for doc in legacy.similarity_search_by_vector(query, k=args.k)] == expected
+            query_ms = best(lambda: legacy.similarity_search_by_vector(query, k=args.k), args.repeat)
+            print(f"{size:>9} {'langchain':<9} {add_ms:9.1f} {query_ms:9.3f} {'':>13} {'':>10}")
+            del legacy, documents
+
+
+if __name__ == "__main__":
+    main()
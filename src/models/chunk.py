@@ -1,6 +1,105 @@
-from dataclasses import dataclass
+import hashlib
+from typing import Any, Dict, Optional
+
 
-@dataclass
 class Chunk:
-    content: str
-    
\ No newline at end of file
+    """
+    A piece of transcript text with its provenance.
+
+    Chunks are slotted, so a large multi-video index doesn't pay for a
+    per-instance __dict__. A chunk either owns its text (content) or refers to a
+    range of its parent transcript's text (source[char_start:char_end]), in which
+    case the text is sliced out only when content is read.
+    """
+
+    __slots__ = ("_content", "_source", "_content_hash", "video_id", "language",
+                 "char_start", "char_end", "start_time", "end_time", "segment_start", "segment_end")
+
+    def __init__(self, content: Optional[str] = None, *,
+                 video_id: Optional[str] = None, language: Optional[str] = None,
+                 char_start: Optional[int] = None, char_end: Optional[int] = None,
+                 start_time: Optional[float] = None, end_time: Optional[float] = None,
+                 segment_start: Optional[int] = None, segment_end: Optional[int] = None,
+                 source: Optional[str] = None):
+        """
+        Create a chunk.
+
+        Args:
+            content: Chunk text. May be omitted when source and char offsets are given.
+            video_id: YouTube video ID the text came from
+            language: Language code of the transcript
+            char_start: Offset of the text in the parent transcript text
+            char_end: End offset (exclusive) of the text in the parent transcript text
+            start_time: Video time in seconds where the chunk starts
+            end_time: Video time in seconds where the chunk ends
+            segment_start: Index of the first transcript line the chunk overlaps
+            segment_end: Index after the last transcript line the chunk overlaps
+            source: Parent transcript text to slice content from lazily
+        """
+        if content is None and (source is None or char_start is None or char_end is None):
+            raise ValueError("Chunk needs content, or source with char_start and char_end")
+        self._content = content
+        self._source = source if content is None else None
+        self._content_hash = None
+        self.video_id = video_id
+        self.language = language
+        self.char_start = char_start
+        self.char_end = char_end
+        self.start_time = start_time
+        self.end_time = end_time
+        self.segment_start = segment_start
+        self.segment_end = segment_end
+
+    @property
+    def content(self) -> str:
+        """The chunk text, sliced from the parent transcript if the chunk doesn't own it."""
+        if self._content is not None:
+            return self._content
+        return self._source[self.char_start:self.char_end]
+
+    @property
+    def content_hash(self) -> str:
+        """SHA-256 hex digest of the text, for keying embedding and rewrite caches."""
+        if self._content_hash is None:
+            self._content_hash = hashlib.sha256(self.content.encode("utf-8")).hexdigest()
+        return self._content_hash
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Seconds of video the chunk covers, or None for untimed chunks."""
+        if self.start_time is None or self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+
+    def to_metadata(self) -> Dict[str, Any]:
+        """Provenance as a flat dict, for vector store metadata."""
+        return {
+            "video_id": self.video_id,
+            "language": self.language,
+            "char_start": self.char_start,
+            "char_end": self.char_end,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "segment_start": self.segment_start,
+            "segment_end": self.segment_end,
+            "content_hash": self.content_hash,
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Chunk):
+            return NotImplemented
+        return self.content == other.content and self._provenance() == other._provenance()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in self._provenance().items() if value is not None)
+        return f"Chunk(content={self.content!r}{', ' + fields if fields else ''})"
+
+    def _provenance(self) -> Dict[str, Any]:
+        return {
+            "video_id": self.video_id, "language": self.language,
+            "char_start": self.char_start, "char_end": self.char_end,
+            "start_time": self.start_time, "end_time": self.end_time,
+            "segment_start": self.segment_start, "segment_end": self.segment_end,
+        }
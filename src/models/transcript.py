@@ -0,0 +1,285 @@
+import json
+import struct
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+import numpy as np
+
+
+class TranscriptSegments:
+    """
+    Columnar, array-backed transcript.
+
+    Caption lines are stored as two float64 arrays (start, duration) and one UTF-8
+    text buffer in which line i spans bytes offsets[i]:offsets[i + 1] - 1, with lines
+    separated by newlines. That makes to_text() a single decode of the buffer, and
+    slicing by index or time returns a view that shares the arrays and the buffer
+    instead of copying them. A transcript costs 24 bytes per line plus its UTF-8
+    text, versus roughly 300 bytes per line for a list of dicts.
+    """
+
+    __slots__ = ("video_id", "language", "language_code", "is_generated",
+                 "starts", "durations", "_offsets", "_buffer")
+
+    # magic, format version, metadata length, line count, text length (bytes)
+    _HEADER = struct.Struct("<4sBIQQ")
+    _MAGIC = b"TSEG"
+    _VERSION = 1
+
+    def __init__(self, starts: np.ndarray, durations: np.ndarray, offsets: np.ndarray,
+                 buffer: Union[bytes, memoryview],
+                 video_id: str = "", language: str = "", language_code: str = "",
+                 is_generated: bool = False):
+        """
+        Wrap existing columns. Use from_lines, from_raw_data or from_fetched to build one.
+
+        Args:
+            starts: Start time of each line in seconds, sorted ascending
+            durations: Duration of each line in seconds
+            offsets: len(starts) + 1 byte offsets of each line into buffer
+            buffer: UTF-8 lines joined by newlines, with a trailing newline
+            video_id: YouTube video ID
+            language: Human-readable language name
+            language_code: Language code (e.g., 'en')
+            is_generated: Whether the transcript is auto-generated
+        """
+        if not (len(starts) == len(durations) == len(offsets) - 1):
+            raise ValueError("starts, durations and offsets must describe the same number of lines")
+        self.starts = starts
+        self.durations = durations
+        self._offsets = offsets
+        self._buffer = buffer
+        self.video_id = video_id
+        self.language = language
+        self.language_code = language_code
+        self.is_generated = is_generated
+
+    @classmethod
+    def from_lines(cls, texts: Iterable[str], starts: Iterable[float], durations: Iterable[float],
+                   **metadata) -> "TranscriptSegments":
+        """
+        Build a transcript from parallel sequences of line texts, starts and durations.
+
+        Args:
+            texts: Text of each caption line
+            starts: Start time of each line in seconds
+            durations: Duration of each line in seconds
+            **metadata: video_id, language, language_code, is_generated
+
+        Returns:
+            TranscriptSegments holding the lines
+        """
+        encoded = [text.encode("utf-8") for text in texts]
+        lengths = np.fromiter((len(line) + 1 for line in encoded), dtype=np.int64, count=len(encoded))
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        buffer = b"\n".join(encoded) + b"\n" if encoded else b""
+        return cls(
+            np.asarray(list(starts), dtype=np.float64),
+            np.asarray(list(durations), dtype=np.float64),
+            offsets, buffer, **metadata
+        )
+
+    @classmethod
+    def from_raw_data(cls, entries: Iterable[Dict[str, Any]], **metadata) -> "TranscriptSegments":
+        """
+        Build a transcript from a list of {'text', 'start', 'duration'} dicts.
+
+        Args:
+            entries: Caption lines as returned by to_raw_data()
+            **metadata: video_id, language, language_code, is_generated
+
+        Returns:
+            TranscriptSegments holding the lines
+        """
+        entries = list(entries)
+        return cls.from_lines(
+            (entry["text"] for entry in entries),
+            (entry["start"] for entry in entries),
+            (entry["duration"] for entry in entries),
+            **metadata
+        )
+
+    @classmethod
+    def from_fetched(cls, fetched_transcript) -> "TranscriptSegments":
+        """
+        Build a transcript from a youtube_transcript_api FetchedTranscript.
+
+        Args:
+            fetched_transcript: Transcript as returned by Transcript.fetch
+
+        Returns:
+            TranscriptSegments holding the same lines and metadata
+        """
+        snippets = fetched_transcript.snippets
+        return cls.from_lines(
+            (snippet.text for snippet in snippets),
+            (snippet.start for snippet in snippets),
+            (snippet.duration for snippet in snippets),
+            video_id=fetched_transcript.video_id,
+            language=fetched_transcript.language,
+            language_code=fetched_transcript.language_code,
+            is_generated=fetched_transcript.is_generated,
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict[str, Any], "TranscriptSegments"]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("TranscriptSegments only supports contiguous slices")
+            return self._view(start, max(start, stop))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("transcript line index out of range")
+        return {"text": self.text_at(index), "start": float(self.starts[index]),
+                "duration": float(self.durations[index])}
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TranscriptSegments):
+            return NotImplemented
+        return (self._metadata() == other._metadata()
+                and np.array_equal(self.starts, other.starts)
+                and np.array_equal(self.durations, other.durations)
+                and self.texts() == other.texts())
+
+    def __repr__(self) -> str:
+        return (f"TranscriptSegments(video_id={self.video_id!r}, language_code={self.language_code!r}, "
+                f"lines={len(self)}, span={self.span():.1f}s)")
+
+    @property
+    def ends(self) -> np.ndarray:
+        """End time of each line in seconds."""
+        return self.starts + self.durations
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the columns and the text buffer."""
+        return self.starts.nbytes + self.durations.nbytes + self._offsets.nbytes + len(self._buffer_span())
+
+    def text_at(self, index: int) -> str:
+        """Return the text of one line."""
+        return str(self._buffer[self._offsets[index]:self._offsets[index + 1] - 1], "utf-8")
+
+    def texts(self) -> List[str]:
+        """Return the text of every line."""
+        offsets = self._offsets.tolist()
+        buffer = self._buffer
+        return [str(buffer[offsets[i]:offsets[i + 1] - 1], "utf-8") for i in range(len(self))]
+
+    def to_text(self) -> str:
+        """Return the lines joined by newlines, as TextFormatter does."""
+        return str(self._buffer_span()[:-1], "utf-8") if len(self) else ""
+
+    def to_raw_data(self) -> List[Dict[str, Any]]:
+        """Return the lines as {'text', 'start', 'duration'} dicts, like FetchedTranscript.to_raw_data."""
+        return [
+            {"text": text, "start": start, "duration": duration}
+            for text, start, duration in zip(self.texts(), self.starts.tolist(), self.durations.tolist())
+        ]
+
+    def span(self) -> float:
+        """Seconds from the start of the first line to the end of the last one."""
+        if not len(self):
+            return 0.0
+        return float(self.starts[-1] + self.durations[-1] - self.starts[0])
+
+    def index_at(self, seconds: float) -> int:
+        """
+        Find the line playing at a timestamp.
+
+        Args:
+            seconds: Timestamp in seconds
+
+        Returns:
+            Index of the last line starting at or before the timestamp, or -1 if the
+            timestamp is before the first line
+        """
+        return int(np.searchsorted(self.starts, seconds, side="right")) - 1
+
+    def time_slice(self, start: float, end: float) -> "TranscriptSegments":
+        """
+        Return the lines that overlap [start, end) as a zero-copy view.
+
+        Args:
+            start: Range start in seconds
+            end: Range end in seconds
+
+        Returns:
+            TranscriptSegments view of the overlapping lines
+        """
+        first = max(self.index_at(start), 0)
+        if first < len(self) and self.starts[first] + self.durations[first] <= start:
+            # The line before start has already finished
+            first += 1
+        last = int(np.searchsorted(self.starts, end, side="left"))
+        return self._view(first, max(first, last))
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize to a compact binary form: a header, the raw arrays and the UTF-8 text.
+
+        Returns:
+            Bytes accepted by from_bytes
+        """
+        metadata = json.dumps(self._metadata(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        base = self._offsets[0]
+        text = self._buffer_span()
+        return b"".join((
+            self._HEADER.pack(self._MAGIC, self._VERSION, len(metadata), len(self), len(text)),
+            metadata,
+            np.ascontiguousarray(self.starts, dtype="<f8").tobytes(),
+            np.ascontiguousarray(self.durations, dtype="<f8").tobytes(),
+            np.ascontiguousarray(self._offsets - base, dtype="<i8").tobytes(),
+            text,
+        ))
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, memoryview]) -> "TranscriptSegments":
+        """
+        Deserialize bytes produced by to_bytes without copying the arrays or the text.
+
+        Args:
+            data: Serialized transcript
+
+        Returns:
+            TranscriptSegments rebuilt from the bytes
+        """
+        magic, version, metadata_length, count, text_length = cls._HEADER.unpack_from(data)
+        if magic != cls._MAGIC or version != cls._VERSION:
+            raise ValueError("unknown transcript segment format")
+
+        position = cls._HEADER.size
+        metadata = json.loads(bytes(data[position:position + metadata_length]))
+        position += metadata_length
+        starts = np.frombuffer(data, dtype="<f8", count=count, offset=position)
+        position += starts.nbytes
+        durations = np.frombuffer(data, dtype="<f8", count=count, offset=position)
+        position += durations.nbytes
+        offsets = np.frombuffer(data, dtype="<i8", count=count + 1, offset=position)
+        position += offsets.nbytes
+        if position + text_length != len(data):
+            raise ValueError("truncated transcript segment data")
+        buffer = memoryview(data)[position:position + text_length]
+        return cls(starts, durations, offsets, buffer, **metadata)
+
+    def _view(self, first: int, last: int) -> "TranscriptSegments":
+        """Lines first:last sharing this transcript's arrays and text buffer."""
+        return TranscriptSegments(
+            self.starts[first:last], self.durations[first:last], self._offsets[first:last + 1], self._buffer,
+            **self._metadata()
+        )
+
+    def _buffer_span(self) -> Union[bytes, memoryview]:
+        """The part of the text buffer covered by this transcript, including the trailing newline."""
+        return self._buffer[self._offsets[0]:self._offsets[-1]]
+
+    def _metadata(self) -> Dict[str, Any]:
+        return {"video_id": self.video_id, "language": self.language,
+                "language_code": self.language_code, "is_generated": self.is_generated}
@@ -0,0 +1,219 @@
+import logging
+from typing import Optional, List, Any, Tuple
+
+import numpy as np
+
+from src.pipeline.vector_store import NumpyVectorStore
+
+logger = logging.getLogger(__name__)
+
+# Rows scored against the centroids at once, bounding the size of the score matrix
+_ASSIGN_BATCH = 8192
+
+
+def spherical_kmeans(data: np.ndarray, n_clusters: int, iterations: int = 10,
+                     rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Cluster unit vectors by cosine similarity (k-means with normalized centroids).
+
+    Args:
+        data: Unit vectors of shape (n, dim), n >= n_clusters
+        n_clusters: Number of centroids
+        iterations: Lloyd iterations
+        rng: Random generator for the initial centroids and reseeding empty clusters
+
+    Returns:
+        Unit centroids of shape (n_clusters, dim)
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    centroids = data[rng.choice(len(data), n_clusters, replace=False)].copy()
+    for _ in range(iterations):
+        labels = nearest_centroids(data, centroids)
+        counts = np.bincount(labels, minlength=n_clusters)
+        order = np.argsort(labels, kind="stable")
+        filled = np.flatnonzero(counts)
+        starts = (np.cumsum(counts) - counts)[filled]
+        centroids[filled] = np.add.reduceat(data[order], starts, axis=0)
+        # Restart empty clusters from random points so no centroid is wasted
+        empty = np.flatnonzero(counts == 0)
+        if len(empty):
+            centroids[empty] = data[rng.choice(len(data), len(empty), replace=False)]
+        NumpyVectorStore._normalize(centroids)
+    return centroids
+
+
+def nearest_centroids(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Index of the most similar centroid for each vector, scored in batches."""
+    labels = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), _ASSIGN_BATCH):
+        batch = vectors[start:start + _ASSIGN_BATCH]
+        labels[start:start + len(batch)] = np.argmax(batch @ centroids.T, axis=1)
+    return labels
+
+
+class IVFVectorStore(NumpyVectorStore):
+    """
+    NumpyVectorStore with an inverted-file (IVF) index for approximate search.
+
+    Stored vectors are clustered with spherical k-means. A query is scored
+    against the centroids, then only against the vectors of its nprobe most
+    similar clusters, so its cost grows with nprobe * n / nlist rather than n.
+    Raising nprobe improves recall at the cost of latency, and can be done at
+    any time without rebuilding the index.
+
+    Searches are exact until min_train_size vectors are stored. After training,
+    added vectors are assigned to their nearest centroid. Vectors not assigned
+    yet are always scored, so a concurrent search never misses them. The
+    centroids are retrained once the store grows retrain_growth times past the
+    last training, keeping clusters near n / nlist vectors as the corpus grows.
+    The index is not part of snapshots and is rebuilt when a snapshot is loaded.
+    """
+
+    # Training sample size per centroid; more points barely move the centroids
+    TRAIN_POINTS_PER_LIST = 32
+
+    def __init__(self, embedding: Any, nprobe: int = 8, nlist: Optional[int] = None,
+                 min_train_size: int = 10_000, retrain_growth: float = 4.0,
+                 kmeans_iterations: int = 10, seed: int = 0, initial_capacity: int = 1024):
+        """
+        Initialize an empty store.
+
+        Args:
+            embedding: Object with embed_documents and embed_query (e.g., OpenAIEmbeddings)
+            nprobe: Clusters searched per query
+            nlist: Number of clusters. None picks about 4 * sqrt(n) at each training.
+            min_train_size: Vectors stored before the index is first trained; smaller
+                stores are searched exactly
+            retrain_growth: Growth factor since the last training that triggers retraining
+            kmeans_iterations: Lloyd iterations per training
+            seed: Seed for sampling and centroid initialization
+            initial_capacity: Rows allocated when the first vectors are added
+        """
+        super().__init__(embedding, initial_capacity=initial_capacity)
+        if nprobe < 1:
+            raise ValueError(f"nprobe must be at least 1, got {nprobe}")
+        if nlist is not None and nlist < 1:
+            raise ValueError(f"nlist must be at least 1, got {nlist}")
+        if retrain_growth <= 1:
+            raise ValueError(f"retrain_growth must be greater than 1, got {retrain_growth}")
+        self.nprobe = nprobe
+        self.nlist = nlist
+        self.min_train_size = max(1, min_train_size)
+        self.retrain_growth = retrain_growth
+        self.kmeans_iterations = kmeans_iterations
+
+        self._rng = np.random.default_rng(seed)
+        self._centroids: Optional[np.ndarray] = None
+        # Row indices of each cluster, and their lengths
+        self._lists: List[np.ndarray] = []
+        self._list_sizes = np.zeros(0, dtype=np.int64)
+        # Rows below this are in a cluster list; the rest are scored exhaustively
+        self._indexed = 0
+        self._trained_size = 0
+
+    @property
+    def trained(self) -> bool:
+        """Whether searches use the index rather than scoring every vector."""
+        return self._centroids is not None
+
+    def add_vectors(self, vectors: Any, texts: List[str],
+                    metadatas: Optional[List[Any]] = None) -> List[str]:
+        """Add precomputed embeddings and assign them to clusters; see NumpyVectorStore.add_vectors."""
+        ids = super().add_vectors(vectors, texts, metadatas)
+        with self._lock:
+            self._update_index()
+        return ids
+
+    @classmethod
+    def load(cls, path: str, embedding: Any, **kwargs: Any) -> "IVFVectorStore":
+        """Open a snapshot and build its index; see NumpyVectorStore.load."""
+        store = super().load(path, embedding, **kwargs)
+        with store._lock:
+            store._update_index()
+        return store
+
+    def top_k(self, queries: Any, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Approximate row indices and cosine similarities of the k nearest stored vectors per query.
+
+        Each query scores its nprobe most similar clusters, and more if they hold
+        fewer than k vectors between them, so every query gets k results.
+
+        Args:
+            queries: Array-like of shape (n_queries, dim)
+            k: Number of results per query
+
+        Returns:
+            Tuple of (indices, scores), both of shape (n_queries, min(k, len(self))),
+            sorted by descending score
+        """
+        with self._lock:
+            centroids, matrix, size = self._centroids, self._matrix, self._size
+            lists, list_sizes, indexed = list(self._lists), self._list_sizes.copy(), self._indexed
+        if centroids is None:
+            return super().top_k(queries, k)
+
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32)).copy()
+        self._normalize(queries)
+        k = min(k, size)
+        indices = np.empty((len(queries), max(k, 0)), dtype=np.int64)
+        scores = np.empty((len(queries), max(k, 0)), dtype=np.float32)
+        if k <= 0:
+            return indices, scores
+
+        unindexed = np.arange(indexed, size)
+        cluster_orders = np.argsort(-(queries @ centroids.T), axis=1)
+        for i, (query, clusters) in enumerate(zip(queries, cluster_orders)):
+            # Probe enough clusters to have at least k candidates
+            reachable = np.cumsum(list_sizes[clusters]) + len(unindexed)
+            probe = max(self.nprobe, int(np.searchsorted(reachable, k)) + 1)
+            rows = np.concatenate([lists[c] for c in clusters[:probe]] + [unindexed])
+            row_scores = matrix[rows] @ query
+            if k < len(rows):
+                best = np.argpartition(-row_scores, k - 1)[:k]
+            else:
+                best = np.arange(len(rows))
+            best = best[np.argsort(-row_scores[best], kind="stable")]
+            indices[i] = rows[best]
+            scores[i] = row_scores[best]
+        return indices, scores
+
+    def _update_index(self) -> None:
+        """Train, retrain or extend the index to cover every stored vector. Caller holds the lock."""
+        size = self._size
+        if size < self.min_train_size:
+            return
+        if self._centroids is None or size >= self._trained_size * self.retrain_growth:
+            self._train()
+        elif self._indexed < size:
+            rows = np.arange(self._indexed, size)
+            labels = nearest_centroids(self._matrix[rows], self._centroids)
+            for cluster, cluster_rows in self._group(rows, labels):
+                self._lists[cluster] = np.concatenate([self._lists[cluster], cluster_rows])
+            self._list_sizes += np.bincount(labels, minlength=len(self._centroids))
+            self._indexed = size
+
+    def _train(self) -> None:
+        """Cluster a sample of the stored vectors and rebuild every list. Caller holds the lock."""
+        size = self._size
+        nlist = min(self.nlist or max(1, int(round(4 * np.sqrt(size)))), size)
+        sample = self._rng.choice(size, min(size, nlist * self.TRAIN_POINTS_PER_LIST), replace=False)
+        vectors = self._matrix[:size]
+        centroids = spherical_kmeans(vectors[np.sort(sample)], nlist, self.kmeans_iterations, self._rng)
+
+        labels = nearest_centroids(vectors, centroids)
+        lists = [np.zeros(0, dtype=np.int64) for _ in range(nlist)]
+        for cluster, cluster_rows in self._group(np.arange(size), labels):
+            lists[cluster] = cluster_rows
+        self._centroids = centroids
+        self._lists = lists
+        self._list_sizes = np.bincount(labels, minlength=nlist)
+        self._indexed = self._trained_size = size
+        logger.info(f"Trained IVF index: {size} vectors in {nlist} clusters")
+
+    @staticmethod
+    def _group(rows: np.ndarray, labels: np.ndarray) -> List[Tuple[int, np.ndarray]]:
+        """Split rows by cluster label, as (label, rows in ascending order) pairs."""
+        order = np.argsort(labels, kind="stable")
+        present, starts = np.unique(labels[order], return_index=True)
+        return list(zip(present.tolist(), np.split(rows[order], starts[1:])))
@@ -0,0 +1,142 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional, List, Dict, Any, Union, Callable
+
+from src.pipeline.yt_fetch import YTFetch
+
+
+class AsyncYTFetch:
+    """
+    Coroutine wrapper that runs YTFetch calls on a bounded thread pool.
+
+    Every method is a coroutine, so callers can schedule fetches with
+    asyncio.gather from an event loop without blocking it. This is not a native
+    async client: youtube_transcript_api and requests are blocking, and the
+    project has no async HTTP client dependency, so each call occupies one of
+    max_concurrency worker threads while its request is in flight. Fetches in
+    flight are therefore bounded by the thread count, not by an event loop;
+    further calls wait in the pool's queue. Search parsing, caching, rate
+    limiting and error handling are shared with the wrapped YTFetch.
+    """
+
+    def __init__(self, fetcher: Optional[YTFetch] = None, max_concurrency: int = 16, **fetcher_kwargs):
+        """
+        Initialize AsyncYTFetch.
+
+        Args:
+            fetcher: Existing YTFetch to wrap. If None, one is created from fetcher_kwargs.
+            max_concurrency: Maximum number of YouTube calls in flight at once, and
+                the number of worker threads
+            **fetcher_kwargs: Passed to YTFetch when no fetcher is given (proxies, cache, ...)
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        # Size the connection pool for the concurrency we allow
+        fetcher_kwargs.setdefault("max_concurrency", max_concurrency)
+        self.fetcher = fetcher or YTFetch(**fetcher_kwargs)
+        self.max_concurrency = max_concurrency
+
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="async-ytfetch")
+
+    async def __aenter__(self) -> "AsyncYTFetch":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Release the worker threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def transcribe(self, url: str, target_language: Optional[str] = None,
+                         format_as_text: bool = True) -> Union[str, List[Dict[str, Any]]]:
+        """
+        Fetch transcript from YouTube video.
+
+        Args:
+            url: YouTube video URL
+            target_language: Language code (e.g., 'en', 'es', 'fr'). If None, uses first available.
+            format_as_text: If True, returns formatted string. If False, returns raw transcript data.
+
+        Returns:
+            Transcript as string (default) or list of transcript entries with timestamps
+        """
+        return await self._run(self.fetcher.transcribe, url, target_language=target_language,
+                               format_as_text=format_as_text)
+
+    async def get_available_languages(self, url: str) -> List[Dict[str, Any]]:
+        """Get list of available transcript languages for a video."""
+        return await self._run(self.fetcher.get_available_languages, url)
+
+    async def transcribe_with_translation(self, url: str, target_language: str,
+                                          format_as_text: bool = True) -> Union[str, List[Dict[str, Any]]]:
+        """
+        Fetch transcript and translate it to target language using YouTube's translation feature.
+
+        Args:
+            url: YouTube video URL
+            target_language: Language code to translate to (e.g., 'es', 'fr', 'de')
+            format_as_text: If True, returns formatted string. If False, returns raw transcript data.
+
+        Returns:
+            Translated transcript as string (default) or list of transcript entries with timestamps
+        """
+        return await self._run(self.fetcher.transcribe_with_translation, url, target_language,
+                               format_as_text=format_as_text)
+
+    async def transcribe_translations(self, url: str, target_languages: List[str], source_language: str = 'en',
+                                      format_as_text: bool = True) -> Dict[str, Dict[str, Any]]:
+        """
+        Translate one video's transcript into several languages from a single listing.
+
+        Args:
+            url: YouTube video URL
+            target_languages: Language codes to translate to (e.g., ['es', 'fr', 'de'])
+            source_language: Language code of the transcript to translate from (default: 'en')
+            format_as_text: If True, transcripts are formatted strings. If False, raw transcript data.
+
+        Returns:
+            Dict mapping each target language to a result dict, as YTFetch.transcribe_translations
+        """
+        return await self._run(self.fetcher.transcribe_translations, url, target_languages,
+                               source_language=source_language, format_as_text=format_as_text)
+
+    async def search_and_transcribe(self, query: str, k: int = 5,
+                                    target_language: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        Search YouTube and transcribe the top k results concurrently.
+
+        Args:
+            query: Search query string
+            k: Number of videos to transcribe (default: 5)
+            target_language: Language code for transcripts (e.g., 'en', 'es', 'fr')
+
+        Returns:
+            List of dictionaries in search-rank order, with the same keys as
+            YTFetch.search_and_transcribe
+        """
+        search_results = await self._search_youtube(query, max_results=k)
+        return await asyncio.gather(*(
+            self._run(self.fetcher._transcribe_entry, video, target_language)
+            for video in search_results
+        ))
+
+    async def _search_youtube(self, query: str, max_results: int = 5) -> List[Dict[str, str]]:
+        """
+        Search YouTube and return video information.
+
+        Args:
+            query: Search query
+            max_results: Maximum number of results to return
+
+        Returns:
+            List of dicts with 'title', 'url', and 'video_id' keys
+        """
+        return await self._run(self.fetcher._search_youtube, query, max_results=max_results)
+
+    async def _run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking YTFetch call on the worker pool; calls beyond max_concurrency queue there."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
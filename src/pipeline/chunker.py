@@ -1,6 +1,52 @@
-from typing import List
+from typing import Iterator, List, Tuple, Union
+
+import numpy as np
 
 from src.models.chunk import Chunk
+from src.models.transcript import TranscriptSegments
+
+# Rough tokenizer-agnostic estimate: one token per CJK character, four characters
+# per token for alphabetic scripts
+CHARS_PER_TOKEN = 4.0
+
+# Code point ranges written without spaces, where each character is roughly a token:
+# CJK punctuation, kana, CJK ideographs, Hangul syllables, compatibility ideographs
+# and full-width forms
+_DENSE_RANGES = ((0x3000, 0x30FF), (0x3400, 0x4DBF), (0x4E00, 0x9FFF),
+                 (0xAC00, 0xD7AF), (0xF900, 0xFAFF), (0xFF00, 0xFFEF))
+
+# Sentence terminators; the ASCII ones only end a sentence before whitespace
+_TERMINATORS = np.array([ord(c) for c in ".!?…"], dtype=np.uint32)
+_DENSE_TERMINATORS = np.array([ord(c) for c in "。！？"], dtype=np.uint32)
+_WHITESPACE = np.array([ord(c) for c in " \t\n\r\u3000"], dtype=np.uint32)
+
+
+def _code_points(text: str) -> np.ndarray:
+    """The text as an array of Unicode code points, one per character."""
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+
+def _dense_mask(code_points: np.ndarray) -> np.ndarray:
+    """True for characters of scripts written without spaces between words."""
+    mask = np.zeros(len(code_points), dtype=bool)
+    for low, high in _DENSE_RANGES:
+        mask |= (code_points >= low) & (code_points <= high)
+    return mask
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate how many embedding tokens a text costs.
+    
+    Args:
+        text: Text to measure
+        
+    Returns:
+        Approximate token count: one per CJK character plus one per four other characters
+    """
+    code_points = _code_points(text)
+    dense = int(np.count_nonzero(_dense_mask(code_points)))
+    return int(np.ceil(dense + (len(code_points) - dense) / CHARS_PER_TOKEN))
 
 
 class Chunker:
@@ -23,6 +69,154 @@ class Chunker:
         chunks = []
         for i in range(0, len(input), 400):
             chunk_content = input[i:i + 400]
-            chunks.append(Chunk(content=chunk_content))
+            chunks.append(Chunk(content=chunk_content, char_start=i, char_end=i + len(chunk_content)))
+        
+        return chunks
+
+    def chunk_sentences(self, input: Union[str, TranscriptSegments], max_tokens: int = 128,
+                        overlap_tokens: int = 0, lazy: bool = False) -> List[Chunk]:
+        """
+        Pack whole sentences into chunks of up to max_tokens estimated tokens.
+        
+        Sentences end at ., !, ? or … followed by whitespace, or at 。！？. A sentence
+        longer than the budget (auto-generated captions often have no punctuation at
+        all) is split between words, or between characters in CJK text. Boundaries
+        and token counts are computed with NumPy over the whole text at once, so only
+        the loop over finished chunks runs in Python.
+        
+        Args:
+            input: Text, or timed transcript segments to chunk with their timing
+            max_tokens: Token budget per chunk, as estimated by estimate_tokens
+            overlap_tokens: Up to this many tokens of trailing sentences are repeated
+                at the start of the next chunk
+            lazy: If True, chunks reference the transcript text and slice their
+                content on access instead of holding a copy
+            
+        Returns:
+            List of Chunk objects with their character range in the text. When input
+            is TranscriptSegments, each chunk also carries the video ID, language, time
+            range and [segment_start, segment_end) range of the lines it overlaps.
+        """
+        return list(self.iter_chunks(input, max_tokens=max_tokens, overlap_tokens=overlap_tokens, lazy=lazy))
+
+    def iter_chunks(self, input: Union[str, TranscriptSegments], max_tokens: int = 128,
+                    overlap_tokens: int = 0, lazy: bool = False) -> Iterator[Chunk]:
+        """
+        Yield the chunks of chunk_sentences one at a time.
+        
+        Each chunk's text and timing are built only when it is requested, so a
+        consumer can start embedding the first chunks before the rest exist.
+        
+        Args:
+            input: Text, or timed transcript segments to chunk with their timing
+            max_tokens: Token budget per chunk, as estimated by estimate_tokens
+            overlap_tokens: Up to this many tokens of trailing sentences are repeated
+                at the start of the next chunk
+            lazy: If True, chunks reference the transcript text and slice their
+                content on access instead of holding a copy
+            
+        Returns:
+            Iterator over Chunk objects, in transcript order
+        """
+        # Validate now rather than on the first next()
+        if max_tokens <= 0:
+            raise ValueError(f"max_tokens must be positive, got {max_tokens}")
+        if not 0 <= overlap_tokens < max_tokens:
+            raise ValueError(f"overlap_tokens must be in [0, max_tokens), got {overlap_tokens}")
+        return self._iter_sentence_chunks(input, max_tokens, overlap_tokens, lazy)
+
+    def _iter_sentence_chunks(self, input: Union[str, TranscriptSegments], max_tokens: int,
+                              overlap_tokens: int, lazy: bool) -> Iterator[Chunk]:
+        """Generator behind iter_chunks."""
+        segments = input if isinstance(input, TranscriptSegments) else None
+        text = segments.to_text() if segments is not None else input
+        if not text:
+            return
+        
+        code_points = _code_points(text)
+        dense = _dense_mask(code_points)
+        # token_at[i] is the estimated token count of text[:i]
+        token_at = np.zeros(len(code_points) + 1)
+        np.cumsum(np.where(dense, 1.0, 1.0 / CHARS_PER_TOKEN), out=token_at[1:])
+        
+        bounds = self._split_points(code_points, dense, token_at, max_tokens)
+        
+        if segments is not None:
+            # Character offset of each line in text (lines are joined by single newlines)
+            line_lengths = np.fromiter((len(line) + 1 for line in segments.texts()), dtype=np.int64,
+                                       count=len(segments))
+            line_starts = np.concatenate(([0], np.cumsum(line_lengths)[:-1]))
+            ends = segments.ends
+        
+        for start, end in self._pack(bounds, token_at[bounds], max_tokens, overlap_tokens):
+            content = text[start:end]
+            stripped = content.strip()
+            if not stripped:
+                continue
+            # Narrow the span to the stripped text, so it slices back to exactly the content
+            # and edge whitespace doesn't pull in a line
+            start += len(content) - len(content.lstrip())
+            end = start + len(stripped)
+            chunk = Chunk(
+                content=None if lazy else stripped,
+                source=text if lazy else None,
+                char_start=start,
+                char_end=end,
+            )
+            if segments is not None:
+                first = int(np.searchsorted(line_starts, start, side="right")) - 1
+                last = int(np.searchsorted(line_starts, end - 1, side="right"))
+                chunk.video_id = segments.video_id or None
+                chunk.language = segments.language_code or None
+                chunk.start_time = float(segments.starts[first])
+                chunk.end_time = float(ends[first:last].max())
+                chunk.segment_start = first
+                chunk.segment_end = last
+            yield chunk
+
+    @staticmethod
+    def _pack(bounds: np.ndarray, bound_tokens: np.ndarray, max_tokens: int,
+              overlap_tokens: int) -> Iterator[Tuple[int, int]]:
+        """Greedily group the pieces between bounds into (start, end) character spans within budget."""
+        first = 0
+        last = len(bounds) - 1
+        while first < last:
+            # Furthest boundary within budget, but always take at least one piece
+            end = int(np.searchsorted(bound_tokens, bound_tokens[first] + max_tokens + 1e-9, side="right")) - 1
+            end = min(max(end, first + 1), last)
+            yield int(bounds[first]), int(bounds[end])
+            if end == last:
+                return
+            if overlap_tokens:
+                restart = int(np.searchsorted(bound_tokens, bound_tokens[end] - overlap_tokens - 1e-9, side="left"))
+                # Shorten the overlap if it would leave no room for the next new piece
+                room = int(np.searchsorted(bound_tokens, bound_tokens[end + 1] - max_tokens - 1e-9, side="left"))
+                first = min(max(restart, room, first + 1), end)
+            else:
+                first = end
+
+    @staticmethod
+    def _split_points(code_points: np.ndarray, dense: np.ndarray, token_at: np.ndarray,
+                      max_tokens: int) -> np.ndarray:
+        """
+        Character offsets where a chunk may start: sentence starts, plus word starts
+        inside sentences that are over budget on their own. Includes 0 and len(text).
+        """
+        length = len(code_points)
+        space = np.isin(code_points, _WHITESPACE)
+        next_is_space = np.append(space[1:], True)
+        ends = ((np.isin(code_points, _TERMINATORS) & next_is_space)
+                | np.isin(code_points, _DENSE_TERMINATORS))
+        sentences = np.unique(np.concatenate(([0], np.flatnonzero(ends) + 1, [length])))
+        
+        too_long = np.diff(token_at[sentences]) > max_tokens
+        if not too_long.any():
+            return sentences
         
-        return chunks
\ No newline at end of file
+        # Word starts, and every character boundary inside CJK text
+        previous_space = np.insert(space[:-1], 0, True)
+        previous_dense = np.insert(dense[:-1], 0, False)
+        words = np.flatnonzero((previous_space & ~space) | dense | previous_dense)
+        sentence_of_word = np.searchsorted(sentences, words, side="right") - 1
+        inside_long = too_long[np.minimum(sentence_of_word, len(too_long) - 1)]
+        return np.union1d(sentences, words[inside_long])
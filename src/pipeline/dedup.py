@@ -0,0 +1,161 @@
+import hashlib
+import re
+import threading
+from collections import defaultdict
+from typing import Iterable, Iterator, List, Dict, Any, Set, Tuple
+
+import numpy as np
+
+from src.models.chunk import Chunk
+
+FINGERPRINT_BITS = 64
+
+_WORD = re.compile(r"\w+")
+
+
+def normalize_text(text: str) -> str:
+    """Casefold and keep only word characters, so punctuation and spacing don't matter."""
+    return " ".join(_WORD.findall(text.casefold()))
+
+
+def _shingles(normalized: str, size: int) -> List[str]:
+    """Overlapping word n-grams, or character n-grams for text written without spaces."""
+    words = normalized.split()
+    if len(words) == 1 and len(normalized) > size:
+        # CJK and similar scripts: shingle characters instead
+        words = list(normalized)
+    if len(words) <= size:
+        return [" ".join(words)]
+    return [" ".join(words[i:i + size]) for i in range(len(words) - size + 1)]
+
+
+def simhash(text: str, shingle_size: int = 2) -> int:
+    """
+    Compute a 64-bit SimHash fingerprint of a text.
+
+    Texts that share most of their shingles get fingerprints that differ in few
+    bits, so near-duplicates can be found by Hamming distance.
+
+    Args:
+        text: Text to fingerprint
+        shingle_size: Words (or CJK characters) per shingle
+
+    Returns:
+        Fingerprint as a non-negative int below 2**64
+    """
+    shingles = _shingles(normalize_text(text), shingle_size)
+    digests = b"".join(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest() for s in shingles)
+    bits = np.unpackbits(np.frombuffer(digests, dtype=np.uint8)).reshape(len(shingles), FINGERPRINT_BITS)
+    # Each bit is set if most shingle hashes have it set
+    majority = bits.sum(axis=0, dtype=np.int64) * 2 > len(shingles)
+    return int.from_bytes(np.packbits(majority).tobytes(), "big")
+
+
+class ChunkDeduplicator:
+    """
+    Drops exact and near-duplicate chunks before they are embedded.
+
+    Exact duplicates are found by hashing normalized text. Near-duplicates are
+    chunks whose SimHash fingerprints differ in at most max_distance bits. To avoid
+    comparing against every kept chunk, fingerprints are split into max_distance + 1
+    bands: two fingerprints within max_distance bits must agree exactly on at least
+    one band, so only chunks sharing a band are compared.
+    """
+
+    def __init__(self, max_distance: int = 8, shingle_size: int = 2):
+        """
+        Initialize the deduplicator.
+
+        Args:
+            max_distance: Largest Hamming distance between fingerprints that counts as a
+                near-duplicate; 0 disables near-duplicate detection. At the default of 8,
+                chunks of ~100 words differing in a few words match, while unrelated
+                chunks are typically 20 or more bits apart.
+            shingle_size: Words (or CJK characters) per shingle for SimHash
+        """
+        if not 0 <= max_distance < FINGERPRINT_BITS // 2:
+            raise ValueError(f"max_distance must be in [0, {FINGERPRINT_BITS // 2}), got {max_distance}")
+        self.max_distance = max_distance
+        self.shingle_size = shingle_size
+
+        # (shift, mask) of max_distance + 1 disjoint bit ranges covering the fingerprint
+        edges = [FINGERPRINT_BITS * i // (max_distance + 1) for i in range(max_distance + 2)]
+        self._bands: List[Tuple[int, int]] = [
+            (low, (1 << (high - low)) - 1) for low, high in zip(edges, edges[1:])
+        ]
+        self._exact: Set[bytes] = set()
+        self._buckets: List[Dict[int, List[int]]] = [defaultdict(list) for _ in self._bands]
+        self._lock = threading.Lock()
+
+        self.kept = 0
+        self.exact_duplicates = 0
+        self.near_duplicates = 0
+
+    def is_duplicate(self, text: str) -> bool:
+        """
+        Check a text against those seen so far and remember it if it is new.
+
+        Args:
+            text: Chunk text
+
+        Returns:
+            True if the text duplicates or nearly duplicates an earlier one
+        """
+        normalized = normalize_text(text)
+        digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+        fingerprint = simhash(text, self.shingle_size) if self.max_distance and normalized else None
+
+        with self._lock:
+            if digest in self._exact:
+                self.exact_duplicates += 1
+                return True
+            if fingerprint is not None and self._has_near_duplicate(fingerprint):
+                self.near_duplicates += 1
+                return True
+
+            self._exact.add(digest)
+            if fingerprint is not None:
+                for buckets, (shift, mask) in zip(self._buckets, self._bands):
+                    buckets[(fingerprint >> shift) & mask].append(fingerprint)
+            self.kept += 1
+            return False
+
+    def filter(self, chunks: Iterable[Chunk]) -> Iterator[Chunk]:
+        """
+        Yield only the chunks that are not duplicates of earlier ones.
+
+        Args:
+            chunks: Chunks in transcript order; consumed lazily
+
+        Returns:
+            Iterator over the first occurrence of each distinct chunk
+        """
+        for chunk in chunks:
+            if not self.is_duplicate(chunk.content):
+                yield chunk
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report how many chunks were dropped.
+
+        Returns:
+            Dict with 'seen', 'kept', 'exact_duplicates', 'near_duplicates' and
+            'embeddings_saved' (every dropped chunk is one embedding not computed)
+        """
+        with self._lock:
+            saved = self.exact_duplicates + self.near_duplicates
+            return {
+                "seen": self.kept + saved,
+                "kept": self.kept,
+                "exact_duplicates": self.exact_duplicates,
+                "near_duplicates": self.near_duplicates,
+                "embeddings_saved": saved,
+            }
+
+    def _has_near_duplicate(self, fingerprint: int) -> bool:
+        """Whether a kept fingerprint sharing a band is within max_distance bits."""
+        for buckets, (shift, mask) in zip(self._buckets, self._bands):
+            for candidate in buckets.get((fingerprint >> shift) & mask, ()):
+                if bin(candidate ^ fingerprint).count("1") <= self.max_distance:
+                    return True
+        return False
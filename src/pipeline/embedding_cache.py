@@ -0,0 +1,209 @@
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+from typing import Optional, List, Dict, Any, Iterable
+
+import numpy as np
+
+from src.pipeline.transcript_cache import DEFAULT_CACHE_DIR
+from src.pipeline.ttl_cache import TTLCache
+
+# SQLite's default limit on bound parameters is 999
+_LOOKUP_BATCH = 500
+
+
+def embedding_key(model: str, text: str, kind: str = "document") -> str:
+    """
+    Content address of an embedding.
+
+    Args:
+        model: Embedding model name
+        text: Embedded text
+        kind: 'document' or 'query'; kept apart for models that embed them differently
+
+    Returns:
+        SHA-256 hex digest of the model, kind and text
+    """
+    return hashlib.sha256(f"{model}\0{kind}\0{text}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Persistent store of embedding vectors keyed by embedding_key.
+
+    Vectors are kept as float32 blobs in a SQLite database, fronted by an in-memory
+    LRU of the most recently used ones. The store is safe to share between threads,
+    and between processes through SQLite's own locking.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_memory_entries: int = 10000):
+        """
+        Open (or create) the store.
+
+        Args:
+            path: SQLite database file (default: <DEFAULT_CACHE_DIR>/embeddings.sqlite3),
+                or ':memory:' for a store that lives only as long as this object
+            max_memory_entries: Number of vectors kept in the in-memory LRU
+        """
+        self.path = path or os.path.join(DEFAULT_CACHE_DIR, "embeddings.sqlite3")
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        self._memory = TTLCache(max_entries=max_memory_entries, ttl_seconds=None)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, np.ndarray]:
+        """
+        Look up vectors, from memory first and then from disk.
+
+        Args:
+            keys: Keys from embedding_key
+
+        Returns:
+            Dict of the keys that were found, mapped to float32 vectors
+        """
+        found: Dict[str, np.ndarray] = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            vector = self._memory.get(key)
+            if vector is None:
+                missing.append(key)
+            else:
+                found[key] = vector
+        memory_hits = len(found)
+
+        rows = []
+        with self._lock:
+            for i in range(0, len(missing), _LOOKUP_BATCH):
+                batch = missing[i:i + _LOOKUP_BATCH]
+                rows.extend(self._connection.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))})", batch
+                ))
+        for key, blob in rows:
+            vector = np.frombuffer(blob, dtype="<f4")
+            self._memory.put(key, vector)
+            found[key] = vector
+
+        with self._lock:
+            self.memory_hits += memory_hits
+            self.disk_hits += len(rows)
+            self.misses += len(missing) - len(rows)
+        return found
+
+    def put_many(self, vectors: Dict[str, Any]) -> None:
+        """
+        Store vectors in memory and on disk.
+
+        Args:
+            vectors: Keys from embedding_key mapped to embedding vectors
+        """
+        rows = []
+        for key, vector in vectors.items():
+            vector = np.asarray(vector, dtype="<f4")
+            self._memory.put(key, vector)
+            rows.append((key, vector.tobytes()))
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows)
+
+    def stats(self) -> Dict[str, int]:
+        """Return memory hits, disk hits, misses and the number of stored vectors."""
+        with self._lock:
+            entries = self._connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            return {"memory_hits": self.memory_hits, "disk_hits": self.disk_hits, "misses": self.misses,
+                    "entries": entries}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+class CachedEmbeddings:
+    """
+    Embeddings wrapper that only sends uncached texts to the underlying model.
+
+    Implements the same embed_documents/embed_query interface as langchain's
+    Embeddings, so it can be passed anywhere an OpenAIEmbeddings is expected.
+    Repeated texts within a call are embedded once, and misses are sent in
+    batches of batch_size.
+    """
+
+    def __init__(self, embeddings: Any, model: str, cache: Optional[EmbeddingCache] = None,
+                 batch_size: int = 256):
+        """
+        Wrap an embeddings object.
+
+        Args:
+            embeddings: Object with embed_documents and embed_query (e.g., OpenAIEmbeddings)
+            model: Model name, part of every cache key so models never share vectors
+            cache: Vector store to use (default: EmbeddingCache at its default path)
+            batch_size: Maximum texts per call to the underlying embed_documents
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        self.embeddings = embeddings
+        self.model = model
+        self.cache = cache if cache is not None else EmbeddingCache()
+        self.batch_size = batch_size
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts, serving cached vectors and embedding the rest in batches.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One embedding per text, in order
+        """
+        keys = [embedding_key(self.model, text) for text in texts]
+        vectors = self.cache.get_many(keys)
+
+        # Each distinct uncached text is embedded once
+        pending = {key: text for key, text in zip(keys, texts) if key not in vectors}
+        pending_keys = list(pending)
+        for i in range(0, len(pending_keys), self.batch_size):
+            batch_keys = pending_keys[i:i + self.batch_size]
+            embedded = self.embeddings.embed_documents([pending[key] for key in batch_keys])
+            new_vectors = dict(zip(batch_keys, embedded))
+            self.cache.put_many(new_vectors)
+            vectors.update(new_vectors)
+
+        return [np.asarray(vectors[key], dtype=np.float32).tolist() for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        """
+        Embed a search query, from the cache when the same query was embedded before.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Query embedding
+        """
+        key = embedding_key(self.model, text, kind="query")
+        vector = self.cache.get_many([key]).get(key)
+        if vector is None:
+            vector = self.embeddings.embed_query(text)
+            self.cache.put_many({key: vector})
+        return np.asarray(vector, dtype=np.float32).tolist()
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Async version of embed_documents; runs it in the default executor."""
+        return await asyncio.get_running_loop().run_in_executor(None, self.embed_documents, texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """Async version of embed_query; runs it in the default executor."""
+        return await asyncio.get_running_loop().run_in_executor(None, self.embed_query, text)
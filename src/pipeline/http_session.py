@@ -0,0 +1,192 @@
+import random
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from requests.utils import select_proxy
+from urllib3.util.retry import Retry
+
+from src.pipeline.rate_limiter import RateLimiter
+
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# YouTube's innertube endpoints are read-only POSTs, so retrying them is safe
+RETRY_METHODS = frozenset({"GET", "HEAD", "POST"})
+
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+
+
+class JitteredRetry(Retry):
+    """Retry policy with exponential backoff and jitter.
+
+    Each sleep is drawn uniformly from [backoff / 2, backoff] so that clients
+    throttled at the same moment don't retry in lockstep. A Retry-After header
+    on the response still takes precedence over the computed backoff, but only
+    statuses in status_forcelist are retried: urllib3 would otherwise retry any
+    413/429/503 that carries Retry-After.
+
+    urllib3 retries inside a single adapter send, so on_retry, if set, is called
+    after every backoff sleep, right before the retry goes out. PooledHTTPAdapter
+    uses it to take a rate-limit token for each attempt.
+    """
+
+    def __init__(self, *args: Any, on_retry: Optional[Callable[[], None]] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.on_retry = on_retry
+
+    def new(self, **kw: Any) -> "JitteredRetry":
+        # urllib3 derives a new Retry for every attempt; keep the hook on all of them
+        kw.setdefault("on_retry", self.on_retry)
+        return super().new(**kw)
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        return random.uniform(backoff / 2, backoff) if backoff > 0 else 0.0
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        # Callers leave 429 out of the forcelist to retry it elsewhere, with or without Retry-After
+        return (status_code in (self.status_forcelist or ())
+                and super().is_retry(method, status_code, has_retry_after))
+
+    def sleep(self, response=None) -> None:
+        super().sleep(response)
+        if self.on_retry is not None:
+            self.on_retry()
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that records connection reuse per host and optionally paces requests.
+
+    With a rate limiter, every attempt waits for a token: the first before the
+    request is sent, and each retry of a 429/5xx or connection error (through
+    JitteredRetry.on_retry) before it goes out, so retries never bypass the limit.
+    """
+
+    def __init__(self, *args, rate_limiter: Optional[RateLimiter] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter
+        self._stats_lock = threading.Lock()
+        self._requests_by_host: Dict[str, int] = defaultdict(int)
+        # (url, proxy) of the request this thread is sending, for retries to acquire against
+        self._sending = threading.local()
+        if rate_limiter is not None and isinstance(self.max_retries, JitteredRetry):
+            self.max_retries = self.max_retries.new(on_retry=self._acquire_for_retry)
+
+    def send(self, request, **kwargs):
+        host = urlparse(request.url).hostname or ""
+        with self._stats_lock:
+            self._requests_by_host[host] += 1
+        if self.rate_limiter is None:
+            return super().send(request, **kwargs)
+
+        target = (request.url, select_proxy(request.url, kwargs.get("proxies")))
+        self.rate_limiter.acquire(*target)
+        self._sending.target = target
+        try:
+            return super().send(request, **kwargs)
+        finally:
+            self._sending.target = None
+
+    def _acquire_for_retry(self) -> None:
+        """Wait for a rate-limit token before urllib3 retries the request being sent."""
+        target = getattr(self._sending, "target", None)
+        if target is not None:
+            self.rate_limiter.acquire(*target)
+
+    def connection_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Report connection reuse per host.
+
+        Returns:
+            Dict mapping host to 'requests' (sent through this adapter), 'http_requests'
+            (attempts on the wire, including retries), 'connections' (new connections
+            opened, i.e. TCP/TLS handshakes) and 'reused' (attempts that went over an
+            existing keep-alive connection)
+        """
+        stats: Dict[str, Dict[str, int]] = {}
+        with self._stats_lock:
+            for host, count in self._requests_by_host.items():
+                stats[host] = {"requests": count, "http_requests": 0, "connections": 0, "reused": 0}
+
+        managers = [self.poolmanager, *self.proxy_manager.values()]
+        for manager in managers:
+            for key in list(manager.pools.keys()):
+                pool = manager.pools.get(key)
+                if pool is None:
+                    continue
+                host_stats = stats.setdefault(
+                    pool.host, {"requests": 0, "http_requests": 0, "connections": 0, "reused": 0}
+                )
+                host_stats["http_requests"] += pool.num_requests
+                host_stats["connections"] += pool.num_connections
+
+        for host_stats in stats.values():
+            host_stats["reused"] = max(host_stats["http_requests"] - host_stats["connections"], 0)
+        return stats
+
+
+def configure_session(session: Session,
+                      pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                      max_retries: int = DEFAULT_MAX_RETRIES,
+                      backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+                      rate_limiter: Optional[RateLimiter] = None,
+                      status_forcelist: Iterable[int] = RETRY_STATUS_CODES) -> PooledHTTPAdapter:
+    """
+    Mount a pooled, retrying adapter on an existing session for both http and https.
+
+    Args:
+        session: Session to configure
+        pool_maxsize: Maximum keep-alive connections kept per host; should be at
+            least the number of concurrent requests to avoid discarding connections
+        max_retries: Retries for connection errors and 429/5xx responses
+        backoff_factor: Base of the exponential backoff between retries, in seconds
+        rate_limiter: Limiter every request waits on before it is sent
+        status_forcelist: Response statuses retried with backoff. Leave out 429 when
+            a layer above retries throttled requests on another IP or proxy instead.
+
+    Returns:
+        The mounted adapter, which exposes connection_stats()
+    """
+    retry = JitteredRetry(
+        total=max_retries,
+        status_forcelist=frozenset(status_forcelist),
+        allowed_methods=RETRY_METHODS,
+        backoff_factor=backoff_factor,
+        respect_retry_after_header=True,
+        # Hand the final response back so callers can raise_for_status as usual
+        raise_on_status=False,
+    )
+    adapter = PooledHTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retry, rate_limiter=rate_limiter)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return adapter
+
+
+def build_session(pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                  max_retries: int = DEFAULT_MAX_RETRIES,
+                  backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+                  session: Optional[Session] = None,
+                  rate_limiter: Optional[RateLimiter] = None) -> Session:
+    """
+    Create a session with a tuned connection pool and retry/backoff policy.
+
+    Args:
+        pool_maxsize: Maximum keep-alive connections kept per host
+        max_retries: Retries for connection errors and 429/5xx responses
+        backoff_factor: Base of the exponential backoff between retries, in seconds
+        session: Existing session to configure instead of creating a new one
+        rate_limiter: Limiter every request waits on before it is sent
+
+    Returns:
+        The configured session
+    """
+    session = session if session is not None else Session()
+    configure_session(session, pool_maxsize=pool_maxsize, max_retries=max_retries,
+                      backoff_factor=backoff_factor, rate_limiter=rate_limiter)
+    return session
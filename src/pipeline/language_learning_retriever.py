@@ -1,10 +1,23 @@
 #src/pipeline/language_learning_retriever.py
 import os
+import logging
+import sqlite3
 from typing import List, Dict, Optional
+from urllib.parse import quote
 from langchain_openai import OpenAIEmbeddings, ChatOpenAI
-from langchain_core.vectorstores import InMemoryVectorStore
 from langchain_core.messages import HumanMessage
 
+from src.pipeline.ann_index import IVFVectorStore
+from src.pipeline.embedding_cache import EmbeddingCache, CachedEmbeddings
+from src.pipeline.namespace_index import NamespaceIndexes
+from src.pipeline.transcript_cache import DEFAULT_CACHE_DIR
+from src.pipeline.vector_store import NumpyVectorStore
+
+logger = logging.getLogger(__name__)
+
+# Namespace used when callers don't partition their content
+DEFAULT_NAMESPACE = "default"
+
 LANGUAGE_INSTRUCTION_MAP = {
     # English
     "en": "Write your entire response in English only.",
@@ -126,13 +139,30 @@ class LanguageLearningRetriever:
         # etc...
     }
     
-    def __init__(self, embedding_model: str = "text-embedding-3-small", llm_model: str = "gpt-3.5-turbo"):
+    def __init__(self, embedding_model: str = "text-embedding-3-small", llm_model: str = "gpt-3.5-turbo",
+                 embedding_cache: Optional[EmbeddingCache] = None, cache_embeddings: bool = True,
+                 max_namespaces: int = 8, max_indexed_chunks: Optional[int] = 100_000,
+                 snapshot_dir: Optional[str] = None, use_snapshots: bool = True,
+                 approximate_search: bool = False, nprobe: int = 8):
         """
         Initialize the retriever with embeddings and language model.
         
         Args:
             embedding_model: OpenAI embedding model to use
             llm_model: OpenAI language model for rewriting
+            embedding_cache: Store for embedding vectors (default: the shared on-disk store)
+            cache_embeddings: If False, every text is sent to the embedding API
+            max_namespaces: Number of namespaces (e.g., videos) kept indexed before
+                the least recently used is evicted
+            max_indexed_chunks: Total chunks kept indexed across namespaces before
+                least recently used namespaces are evicted. None disables the limit.
+            snapshot_dir: Directory of saved namespace indexes
+                (default: <DEFAULT_CACHE_DIR>/indexes/<embedding_model>)
+            use_snapshots: If False, indexes are never saved to or loaded from disk
+            approximate_search: Search large namespaces (e.g., whole playlists) with an
+                IVF index instead of scoring every chunk
+            nprobe: Clusters searched per query with approximate_search; higher is
+                slower but finds more of the exact nearest chunks
         """
         # Check for API key
         if not os.getenv("OPENAI_API_KEY"):
@@ -140,8 +170,29 @@ class LanguageLearningRetriever:
         
         # Initialize components
         self.embeddings = OpenAIEmbeddings(model=embedding_model)
+        if cache_embeddings:
+            # Only texts never embedded before (by any session) reach the API
+            try:
+                self.embeddings = CachedEmbeddings(
+                    self.embeddings, embedding_model,
+                    cache=embedding_cache if embedding_cache is not None else EmbeddingCache()
+                )
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Embedding cache disabled: {str(e)}")
         self.llm = ChatOpenAI(model=llm_model, temperature=0.3)
-        self.vectorstore = None
+        # One vector store per namespace, so searches never mix videos; each keeps its
+        # vectors in a single matrix searched with one product, or through an IVF index
+        self.store_class = IVFVectorStore if approximate_search else NumpyVectorStore
+        self.store_options = {"nprobe": nprobe} if approximate_search else {}
+        self.indexes = NamespaceIndexes(
+            lambda: self.store_class(embedding=self.embeddings, **self.store_options),
+            max_namespaces=max_namespaces,
+            max_entries=max_indexed_chunks
+        )
+        # Snapshots are only valid for the model that embedded them
+        self.snapshot_dir = None
+        if use_snapshots:
+            self.snapshot_dir = snapshot_dir or os.path.join(DEFAULT_CACHE_DIR, "indexes", embedding_model)
         
         # CEFR level descriptions for prompts
         self.cefr_descriptions = {
@@ -150,24 +201,97 @@ class LanguageLearningRetriever:
             "B2": "upper-intermediate level with varied vocabulary and complex sentences"
         }
     
-    def add_content(self, texts: List[str], metadatas: Optional[List[Dict]] = None):
+    def add_content(self, texts: List[str], metadatas: Optional[List[Dict]] = None,
+                    namespace: str = DEFAULT_NAMESPACE):
         """
         Add educational content to the vector store.
         
         Args:
             texts: List of text chunks
             metadatas: Optional metadata (language, topic, source, etc.)
+            namespace: Index to add to, e.g. namespace_for(video_id, language)
+        """
+        vectorstore = self.indexes.get_or_create(namespace)
+        vectorstore.add_texts(texts, metadatas=metadatas)
+        self.indexes.record(namespace, len(texts))
+    
+    def has_content(self, namespace: str = DEFAULT_NAMESPACE) -> bool:
+        """Whether a namespace is indexed and can be searched, loading its snapshot if needed."""
+        return namespace in self.indexes or self.load_snapshot(namespace)
+    
+    def save_snapshot(self, namespace: str) -> Optional[str]:
+        """
+        Save a namespace's index to disk, so later sessions and other processes can load it.
+        
+        Args:
+            namespace: Namespace to save
+            
+        Returns:
+            Snapshot path, or None if snapshots are disabled or the namespace isn't indexed
+            
+        Raises:
+            OSError: If the snapshot can't be written
+        """
+        vectorstore = self.indexes.get(namespace)
+        if self.snapshot_dir is None or vectorstore is None:
+            return None
+        path = self._snapshot_path(namespace)
+        size = vectorstore.save(path)
+        logger.info(f"Saved index snapshot for {namespace} ({size} bytes)")
+        return path
+    
+    def load_snapshot(self, namespace: str) -> bool:
+        """
+        Load a namespace's index from its snapshot, replacing any in-memory index.
+        
+        The snapshot is memory-mapped rather than read, so this is nearly instant
+        and processes serving the same video share its pages.
+        
+        Args:
+            namespace: Namespace to load
+            
+        Returns:
+            True if a snapshot was loaded
+        """
+        if self.snapshot_dir is None:
+            return False
+        path = self._snapshot_path(namespace)
+        try:
+            vectorstore = self.store_class.load(path, embedding=self.embeddings, **self.store_options)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable index snapshot {path}: {str(e)}")
+            return False
+        if not len(vectorstore):
+            return False
+        self.indexes.put(namespace, vectorstore, len(vectorstore))
+        logger.info(f"Loaded index snapshot for {namespace} ({len(vectorstore)} chunks)")
+        return True
+    
+    def _snapshot_path(self, namespace: str) -> str:
+        """Snapshot file of a namespace; the name is escaped so any namespace is a safe file name."""
+        return os.path.join(self.snapshot_dir, f"{quote(namespace, safe='')}.nvs")
+    
+    def drop(self, namespace: str) -> bool:
+        """
+        Free a namespace's index.
+        
+        Args:
+            namespace: Namespace to drop. A bare video ID drops that video's
+                namespaces in every language.
+            
+        Returns:
+            True if anything was dropped
         """
-        if self.vectorstore is None:
-            self.vectorstore = InMemoryVectorStore.from_texts(
-                texts,
-                embedding=self.embeddings,
-                metadatas=metadatas
-            )
-        else:
-            self.vectorstore.add_texts(texts, metadatas=metadatas)
+        dropped = self.indexes.drop(namespace)
+        for existing in self.indexes.namespaces():
+            if existing.startswith(f"{namespace}:"):
+                dropped = self.indexes.drop(existing) or dropped
+        return dropped
     
-    def search_and_rewrite(self, language: str, topic: str, cefr_level: str, top_k: Optional[int] = 3) -> List[Dict]:
+    def search_and_rewrite(self, language: str, topic: str, cefr_level: str, top_k: Optional[int] = 3,
+                           namespace: str = DEFAULT_NAMESPACE) -> List[Dict]:
         """
         Search for content and rewrite it for the specified CEFR level.
         
@@ -175,12 +299,16 @@ class LanguageLearningRetriever:
             language: Target language (e.g., "Spanish", "French")
             topic: Topic to search for
             cefr_level: Target CEFR level (A2, B1, or B2)
+            namespace: Index to search; other namespaces are never scored
             
         Returns:
             List of dictionaries with original and rewritten content
         """
-        if self.vectorstore is None:
-            raise ValueError("No content has been added to the store yet")
+        vectorstore = self.indexes.get(namespace)
+        if vectorstore is None and self.load_snapshot(namespace):
+            vectorstore = self.indexes.get(namespace)
+        if vectorstore is None:
+            raise ValueError(f"No content has been added to namespace '{namespace}' yet")
         
         if cefr_level not in self.cefr_descriptions:
             raise ValueError(f"Invalid CEFR level. Must be one of: {list(self.cefr_descriptions.keys())}")
@@ -191,7 +319,7 @@ class LanguageLearningRetriever:
         # TODO: check if the topic is in a different language to the embedding, and translate it to match the language stored in the embeddings
         
         # Retrieve top 3 chunks
-        results = self.vectorstore.similarity_search(query, k=top_k)
+        results = vectorstore.similarity_search(query, k=top_k)
         
         # Rewrite each chunk for the target CEFR level
         rewritten_results = []
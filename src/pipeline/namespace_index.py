@@ -0,0 +1,142 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+def namespace_for(video_id: str, language: str) -> str:
+    """Namespace holding one video's chunks in one language."""
+    return f"{video_id}:{language}"
+
+
+class NamespaceIndexes:
+    """
+    A set of independent vector indexes, one per namespace, with LRU eviction.
+
+    Each namespace (typically one video in one language, see namespace_for) gets
+    its own store, so a search only scores that namespace's vectors. Least recently
+    used namespaces are evicted once there are more than max_namespaces, or once the
+    total number of indexed entries exceeds max_entries. The namespace being added
+    to is never evicted.
+    """
+
+    def __init__(self, create: Callable[[], Any], max_namespaces: int = 8,
+                 max_entries: Optional[int] = 100_000):
+        """
+        Initialize the indexes.
+
+        Args:
+            create: Returns a new, empty store for a namespace
+            max_namespaces: Maximum number of namespaces kept
+            max_entries: Maximum number of entries across all namespaces. None disables the limit.
+        """
+        if max_namespaces < 1:
+            raise ValueError(f"max_namespaces must be at least 1, got {max_namespaces}")
+        self.create = create
+        self.max_namespaces = max_namespaces
+        self.max_entries = max_entries
+
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        # namespace -> [store, entry count], least recently used first
+        self._indexes: "OrderedDict[str, List[Any]]" = OrderedDict()
+        self._total_entries = 0
+
+    def __contains__(self, namespace: str) -> bool:
+        with self._lock:
+            return namespace in self._indexes
+
+    def get(self, namespace: str) -> Optional[Any]:
+        """Return a namespace's store and mark it recently used, or None if it doesn't exist."""
+        with self._lock:
+            entry = self._indexes.get(namespace)
+            if entry is None:
+                return None
+            self._indexes.move_to_end(namespace)
+            return entry[0]
+
+    def get_or_create(self, namespace: str) -> Any:
+        """Return a namespace's store, creating an empty one if needed, and mark it recently used."""
+        with self._lock:
+            entry = self._indexes.get(namespace)
+            if entry is None:
+                entry = self._indexes[namespace] = [self.create(), 0]
+                self._evict(keep=namespace)
+            self._indexes.move_to_end(namespace)
+            return entry[0]
+
+    def put(self, namespace: str, store: Any, entries: int) -> None:
+        """
+        Install an already filled store for a namespace, replacing any existing one.
+
+        Args:
+            namespace: Namespace to install
+            store: The namespace's store (e.g., loaded from a snapshot)
+            entries: Number of entries in the store
+        """
+        with self._lock:
+            previous = self._indexes.pop(namespace, None)
+            if previous is not None:
+                self._total_entries -= previous[1]
+            self._indexes[namespace] = [store, entries]
+            self._total_entries += entries
+            self._evict(keep=namespace)
+
+    def record(self, namespace: str, added: int) -> None:
+        """
+        Account for entries added to a namespace's store, evicting other namespaces if over budget.
+
+        Args:
+            namespace: Namespace that grew
+            added: Number of entries added
+        """
+        with self._lock:
+            entry = self._indexes.get(namespace)
+            if entry is None:
+                return
+            entry[1] += added
+            self._total_entries += added
+            self._evict(keep=namespace)
+
+    def drop(self, namespace: str) -> bool:
+        """
+        Remove a namespace and free its store.
+
+        Returns:
+            True if the namespace existed
+        """
+        with self._lock:
+            entry = self._indexes.pop(namespace, None)
+            if entry is None:
+                return False
+            self._total_entries -= entry[1]
+            return True
+
+    def namespaces(self) -> List[str]:
+        """Namespaces currently held, least recently used first."""
+        with self._lock:
+            return list(self._indexes)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of namespaces, entries per namespace, total entries and evictions."""
+        with self._lock:
+            return {
+                "namespaces": len(self._indexes),
+                "entries": self._total_entries,
+                "entries_by_namespace": {namespace: entry[1] for namespace, entry in self._indexes.items()},
+                "evictions": self.evictions,
+            }
+
+    def _evict(self, keep: str) -> None:
+        """Drop least recently used namespaces, other than keep, until within limits. Caller holds the lock."""
+        while len(self._indexes) > 1 and (
+            len(self._indexes) > self.max_namespaces
+            or (self.max_entries is not None and self._total_entries > self.max_entries)
+        ):
+            victim = next(namespace for namespace in self._indexes if namespace != keep)
+            self._total_entries -= self._indexes.pop(victim)[1]
+            self.evictions += 1
+            logger.info(f"Evicted vector index for {victim}")
@@ -0,0 +1,142 @@
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any
+
+from youtube_transcript_api import (
+    TranscriptsDisabled, NoTranscriptFound, VideoUnavailable, VideoUnplayable, InvalidVideoId
+)
+
+from src.pipeline.ttl_cache import TTLCache
+
+# Reasons a video or language is remembered as unavailable
+TRANSCRIPTS_DISABLED = "transcripts_disabled"
+NO_TRANSCRIPT = "no_transcript"
+VIDEO_UNAVAILABLE = "video_unavailable"
+LANGUAGE_UNAVAILABLE = "language_unavailable"
+
+
+@dataclass
+class NegativeEntry:
+    """A remembered failure for a video, or for one language of a video."""
+    reason: str
+    message: str
+    available_languages: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def classify_error(error: Exception) -> Optional[str]:
+    """
+    Map a youtube_transcript_api error to a negative-cache reason.
+
+    Returns:
+        The reason, or None for errors that may be transient (network errors,
+        rate limiting, IP blocks) and must not be cached
+    """
+    if isinstance(error, TranscriptsDisabled):
+        return TRANSCRIPTS_DISABLED
+    if isinstance(error, NoTranscriptFound):
+        return NO_TRANSCRIPT
+    if isinstance(error, (VideoUnavailable, VideoUnplayable, InvalidVideoId)):
+        return VIDEO_UNAVAILABLE
+    return None
+
+
+class NegativeCache:
+    """
+    Short-lived in-memory cache of videos and languages known to be unavailable.
+
+    Repeat requests for a video without transcripts, or for a language the video
+    doesn't have, fail straight from memory instead of listing the video again.
+    Entries expire after ttl_seconds so newly added captions are picked up.
+    """
+
+    def __init__(self, ttl_seconds: float = 600, max_entries: int = 4096):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: How long a failure is remembered
+            max_entries: Maximum number of remembered failures before LRU eviction
+        """
+        self._cache = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._lock = threading.Lock()
+        self._hits_by_reason: Counter = Counter()
+        self._misses = 0
+
+    def check_video(self, video_id: str, count: bool = True) -> Optional[NegativeEntry]:
+        """
+        Return the remembered failure for a video, or None.
+
+        Args:
+            video_id: YouTube video ID
+            count: Record the lookup in stats(). Pass False for a second lookup
+                made while serving a request that was already counted.
+        """
+        entry = self._cache.get(video_id)
+        return self._count(entry) if count else entry
+
+    def check_language(self, video_id: str, language_code: str, count: bool = True) -> Optional[NegativeEntry]:
+        """Return the remembered failure for a video or for one of its languages, or None; see check_video."""
+        entry = self._cache.get(video_id) or self._cache.get((video_id, language_code))
+        return self._count(entry) if count else entry
+
+    def record_video(self, video_id: str, reason: str, message: str) -> None:
+        """
+        Remember that a video has no usable transcripts.
+
+        Args:
+            video_id: YouTube video ID
+            reason: One of TRANSCRIPTS_DISABLED, NO_TRANSCRIPT or VIDEO_UNAVAILABLE
+            message: Error message to repeat on later requests
+        """
+        self._cache.put(video_id, NegativeEntry(reason, message))
+
+    def record_language(self, video_id: str, language_code: str,
+                        available_languages: List[Dict[str, Any]]) -> None:
+        """
+        Remember that a video has no transcript in a language.
+
+        Args:
+            video_id: YouTube video ID
+            language_code: Language that is unavailable
+            available_languages: Languages the video does have, as from describe_transcripts
+        """
+        self._cache.put(
+            (video_id, language_code),
+            NegativeEntry(LANGUAGE_UNAVAILABLE, f"No transcript in language '{language_code}'",
+                          list(available_languages))
+        )
+
+    def clear(self) -> None:
+        """Forget every failure and reset the counters."""
+        self._cache.clear()
+        with self._lock:
+            self._hits_by_reason.clear()
+            self._misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report how many requests were answered from the cache.
+
+        Returns:
+            Dict with 'hits' (requests that skipped the network), 'misses',
+            'hits_by_reason' and 'entries'
+        """
+        with self._lock:
+            hits_by_reason = dict(self._hits_by_reason)
+            misses = self._misses
+        return {
+            "hits": sum(hits_by_reason.values()),
+            "misses": misses,
+            "hits_by_reason": hits_by_reason,
+            "entries": len(self._cache),
+        }
+
+    def _count(self, entry: Optional[NegativeEntry]) -> Optional[NegativeEntry]:
+        """Record a lookup result in the counters and pass it through."""
+        with self._lock:
+            if entry is None:
+                self._misses += 1
+            else:
+                self._hits_by_reason[entry.reason] += 1
+        return entry
@@ -1,9 +1,17 @@
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Iterator
 import logging
 import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from youtube_transcript_api import TranscriptList
+from src.models.chunk import Chunk
 from src.pipeline.yt_fetch import YTFetch
+from src.pipeline.transcript_cache import TranscriptCache
+from src.pipeline.negative_cache import NegativeCache
 from src.pipeline.chunker import Chunker
+from src.pipeline.dedup import ChunkDeduplicator
 from src.pipeline.language_learning_retriever import LanguageLearningRetriever
+from src.pipeline.namespace_index import namespace_for
 
 logger = logging.getLogger(__name__)
 
@@ -36,12 +44,38 @@ class RetrievalError(PipelineError):
 
 
 class Pipeline:
-    def __init__(self):
+    # Estimated tokens per retrieval chunk, and tokens repeated between neighbouring chunks
+    CHUNK_MAX_TOKENS = 128
+    CHUNK_OVERLAP_TOKENS = 16
+    # Chunks per retriever.add_content call when streaming embeddings
+    EMBED_BATCH_SIZE = 32
+
+    def __init__(self, transcript_cache: Optional[TranscriptCache] = None,
+                 negative_cache: Optional[NegativeCache] = None,
+                 stream_embeddings: bool = True,
+                 deduplicate: bool = True):
         self.yt_fetch = None
         self.chunker = None
         self.retriever = None
+        # Embed chunks in batches while the rest are still being chunked
+        self.stream_embeddings = stream_embeddings
+        # Drop repeated and near-identical chunks (intros, music, repeated captions) before embedding
+        self.deduplicate = deduplicate
+        self.last_dedup_stats: Optional[Dict[str, int]] = None
+        self.transcript_cache = transcript_cache or self._default_transcript_cache()
+        # Remembers videos without transcripts and missing languages between requests
+        self.negative_cache = negative_cache or NegativeCache()
         logger.info("Pipeline initialized")
 
+    @staticmethod
+    def _default_transcript_cache() -> Optional[TranscriptCache]:
+        """Create the shared on-disk transcript cache, or None if the cache dir is unusable"""
+        try:
+            return TranscriptCache()
+        except OSError as e:
+            logger.warning(f"Transcript cache disabled: {str(e)}")
+            return None
+
     def _validate_inputs(self, url: str, language: str, topic: str, level: str, n_chunks: int) -> None:
         """Validate input parameters"""
         if not url or not isinstance(url, str):
@@ -65,7 +99,7 @@ class Pipeline:
         try:
             if not self.yt_fetch:
                 logger.info("Initializing YTFetch component")
-                self.yt_fetch = YTFetch()
+                self.yt_fetch = YTFetch(transcript_cache=self.transcript_cache, negative_cache=self.negative_cache)
                 logger.info("YTFetch component initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize YTFetch: {str(e)}")
@@ -100,26 +134,34 @@ class Pipeline:
         Returns:
             Tuple of (is_available, available_languages_list)
         """
+        is_available, available_languages, _ = self._list_languages(url, target_language)
+        return is_available, available_languages
+
+    def _list_languages(self, url: str, target_language: str) -> Tuple[bool, List[Dict[str, any]], Optional[TranscriptList]]:
+        """
+        List the video's transcripts once and check the target language against them.
+        
+        Args:
+            url: YouTube video URL
+            target_language: Language code to check (e.g., 'en', 'es', 'fr')
+            
+        Returns:
+            Tuple of (is_available, available_languages_list, transcript_list). The
+            transcript list can be reused to fetch the transcript without listing again;
+            it is None if listing failed or the language is known to be unavailable.
+        """
         try:
             # Ensure YTFetch is initialized
             if not self.yt_fetch:
-                self.yt_fetch = YTFetch()
+                self.yt_fetch = YTFetch(transcript_cache=self.transcript_cache, negative_cache=self.negative_cache)
             
-            # Get available languages
-            available_languages = self.yt_fetch.get_available_languages(url)
-            
-            # Check if target language is available
-            is_available = any(
-                lang.get('language_code') == target_language 
-                for lang in available_languages
-            )
-            
-            return is_available, available_languages
+            # List once and check the target language; repeat misses come from the negative cache
+            return self.yt_fetch.check_language(url, target_language)
             
         except Exception as e:
             logger.error(f"Error checking language availability: {str(e)}")
             # Return empty list if we can't check
-            return False, []
+            return False, [], None
 
     def generate_simplified_lesson(
         self,
@@ -172,7 +214,7 @@ class Pipeline:
 
         # Check language availability BEFORE any expensive operations
         logger.info(f"Checking language availability for {language}")
-        is_available, available_languages = self.check_language_availability(url, language)
+        is_available, available_languages, transcript_list = self._list_languages(url, language)
         
         if not is_available:
             # Construct helpful error message
@@ -185,20 +227,94 @@ class Pipeline:
             logger.warning(error_msg)
             raise LanguageNotAvailableError(error_msg, available_languages)
 
+        # Index the video once per language; later lessons on it search the existing index
+        namespace = namespace_for(transcript_list.video_id, language)
+        if self.retriever.has_content(namespace):
+            logger.info(f"Reusing indexed content for {namespace}")
+        else:
+            self._index_transcript(url, transcript_list, language, namespace)
+
+        # Search and rewrite content
+        try:
+            logger.info(f"Searching and rewriting content for topic: {topic}, level: {level}")
+            results = self.retriever.search_and_rewrite(
+                language=language,
+                topic=topic,
+                cefr_level=level,
+                top_k=n_chunks,
+                namespace=namespace
+            )
+            
+            if not results:
+                logger.warning("No results returned from search_and_rewrite")
+                return []
+                
+            logger.info(f"Successfully generated {len(results)} simplified lessons")
+            
+            # Validate result format
+            for i, result in enumerate(results):
+                if not isinstance(result, dict):
+                    raise RetrievalError(f"Result {i} is not a dictionary: {type(result)}")
+                    
+                required_fields = ["original", "rewritten"]
+                missing_fields = [field for field in required_fields if field not in result]
+                if missing_fields:
+                    logger.warning(
+                        f"Result {i} missing fields: {missing_fields}. "
+                        f"Available fields: {list(result.keys())}"
+                    )
+                
+                # Surface the chunk's position in the video so players can seek to it
+                metadata = result.get("metadata") or {}
+                start_time = metadata.get("start_time")
+                end_time = metadata.get("end_time")
+                result["start_time"] = start_time
+                result["duration"] = (
+                    end_time - start_time if start_time is not None and end_time is not None else None
+                )
+            
+            return results
+            
+        except AttributeError as e:
+            logger.error(f"Retriever method error: {str(e)}")
+            raise RetrievalError(f"Retriever search_and_rewrite method failed: {str(e)}") from e
+        except Exception as e:
+            logger.error(f"Failed to search and rewrite content: {str(e)}")
+            logger.debug(f"Traceback: {traceback.format_exc()}")
+            raise RetrievalError(f"Failed to search and rewrite content: {str(e)}") from e
+
+    def _index_transcript(self, url: str, transcript_list: TranscriptList, language: str, namespace: str) -> None:
+        """
+        Fetch, chunk and embed a video's transcript into the retriever namespace.
+        
+        Args:
+            url: YouTube video URL
+            transcript_list: Listing from the language check, reused to fetch the transcript
+            language: Language code of the transcript to index
+            namespace: Retriever namespace to fill
+            
+        Raises:
+            YouTubeFetchError: If fetching the transcript fails
+            ChunkingError: If text chunking fails
+            RetrievalError: If adding chunks to the retriever fails
+        """
         # Fetch and transcribe YouTube video
         transcribed = None
         try:
             logger.info(f"Fetching and transcribing video from URL: {url}")
-            transcribed = self.yt_fetch.transcribe(
-                url=url, 
-                target_language=language, 
-                format_as_text=True
+            # Reuse the transcript list from the availability check - no second listing.
+            # Keep the timed segments so chunks can point back into the video.
+            transcribed = self.yt_fetch.transcribe_segments_from_list(
+                transcript_list,
+                target_language=language
             )
             
-            if not transcribed:
+            if not len(transcribed):
                 raise YouTubeFetchError("Transcription returned empty result")
                 
-            logger.info(f"Successfully transcribed video. Text length: {len(transcribed)} characters")
+            logger.info(
+                f"Successfully transcribed video. {len(transcribed)} lines, {transcribed.span():.0f} seconds"
+            )
             
         except AttributeError as e:
             logger.error(f"YTFetch method error: {str(e)}")
@@ -210,17 +326,15 @@ class Pipeline:
                 f"Failed to fetch/transcribe video from {url}: {str(e)}"
             ) from e
 
-        # Chunk the transcribed text
-        chunks = None
+        # Pack whole sentences up to the token budget, keeping each chunk's time range,
+        # and add the chunks to the retriever as they are produced
         try:
             logger.info("Starting text chunking")
-            chunks = self.chunker.chunk(input=transcribed)
-            
-            if not chunks:
-                raise ChunkingError("Chunker returned empty result")
-                
-            logger.info(f"Successfully created {len(chunks)} chunks")
-            
+            chunks = self.chunker.iter_chunks(
+                transcribed,
+                max_tokens=self.CHUNK_MAX_TOKENS,
+                overlap_tokens=self.CHUNK_OVERLAP_TOKENS
+            )
         except AttributeError as e:
             logger.error(f"Chunker method error: {str(e)}")
             raise ChunkingError(f"Chunker chunk method failed: {str(e)}") from e
@@ -229,17 +343,102 @@ class Pipeline:
             logger.debug(f"Traceback: {traceback.format_exc()}")
             raise ChunkingError(f"Failed to chunk transcribed text: {str(e)}") from e
 
-        # Extract text content and add to retriever
+        deduplicator = ChunkDeduplicator() if self.deduplicate else None
+        if deduplicator is not None:
+            chunks = deduplicator.filter(chunks)
+
         try:
-            logger.info("Extracting text content from chunks")
-            texts = [c.content for c in chunks]
+            added = self._index_chunks(chunks, namespace)
+        except PipelineError:
+            # Don't leave a partial index that later lessons would reuse
+            self.retriever.drop(namespace)
+            raise
+        logger.info(f"Added {added} chunks to retriever")
+        # Later lessons on this video, in any process, load the index instead of re-embedding
+        try:
+            self.retriever.save_snapshot(namespace)
+        except OSError as e:
+            logger.warning(f"Failed to save index snapshot for {namespace}: {str(e)}")
+        if deduplicator is not None:
+            self.last_dedup_stats = deduplicator.stats()
+            logger.info(
+                f"Skipped {self.last_dedup_stats['exact_duplicates']} duplicate and "
+                f"{self.last_dedup_stats['near_duplicates']} near-duplicate chunks; "
+                f"{self.last_dedup_stats['embeddings_saved']} embeddings saved"
+            )
+
+    def _index_chunks(self, chunks: Iterator[Chunk], namespace: str) -> int:
+        """
+        Add chunks to the retriever as they are produced.
+        
+        When streaming, every EMBED_BATCH_SIZE chunks are handed to a background
+        thread for embedding while the next batch is chunked; at most one batch
+        waits behind the one being embedded. Otherwise all chunks are produced
+        first and added in a single call.
+        
+        Args:
+            chunks: Chunks to add, typically a Chunker.iter_chunks generator
+            namespace: Retriever namespace to add them to
             
-            if not texts:
-                raise RetrievalError("No text content found in chunks")
-                
-            logger.info(f"Adding {len(texts)} texts to retriever")
-            self.retriever.add_content(texts=texts)
+        Returns:
+            Number of chunks added
             
+        Raises:
+            ChunkingError: If producing chunks fails or yields no chunks
+            RetrievalError: If adding chunks to the retriever fails
+        """
+        if not self.stream_embeddings:
+            batch = next(self._batches(chunks, batch_size=None), [])
+            if batch:
+                self._add_batch(batch, namespace)
+            else:
+                raise ChunkingError("Chunker returned empty result")
+            return len(batch)
+        
+        added = 0
+        pending: deque = deque()
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pipeline-embed")
+        try:
+            for batch in self._batches(chunks, batch_size=self.EMBED_BATCH_SIZE):
+                while len(pending) >= 2:
+                    pending.popleft().result()
+                logger.debug(f"Queueing {len(batch)} chunks for embedding")
+                pending.append(executor.submit(self._add_batch, batch, namespace))
+                added += len(batch)
+            while pending:
+                pending.popleft().result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        
+        if not added:
+            raise ChunkingError("Chunker returned empty result")
+        return added
+
+    @staticmethod
+    def _batches(chunks: Iterator[Chunk], batch_size: Optional[int]) -> Iterator[List[Chunk]]:
+        """Group chunks into lists of batch_size (all in one list if None), as ChunkingErrors on failure."""
+        batch = []
+        try:
+            for chunk in chunks:
+                batch.append(chunk)
+                if batch_size and len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+        except Exception as e:
+            logger.error(f"Failed to chunk text: {str(e)}")
+            logger.debug(f"Traceback: {traceback.format_exc()}")
+            raise ChunkingError(f"Failed to chunk transcribed text: {str(e)}") from e
+        if batch:
+            yield batch
+
+    def _add_batch(self, chunks: List[Chunk], namespace: str) -> None:
+        """Embed one batch of chunks into the retriever, with their provenance as metadata."""
+        try:
+            texts = [c.content for c in chunks]
+            # Provenance lets results point back to the video, language and time range
+            metadatas = [c.to_metadata() for c in chunks]
+            logger.info(f"Adding {len(texts)} texts to retriever")
+            self.retriever.add_content(texts=texts, metadatas=metadatas, namespace=namespace)
         except AttributeError as e:
             logger.error(f"Chunk content extraction error: {str(e)}")
             raise RetrievalError(
@@ -250,45 +449,6 @@ class Pipeline:
             logger.debug(f"Traceback: {traceback.format_exc()}")
             raise RetrievalError(f"Failed to add content to retriever: {str(e)}") from e
 
-        # Search and rewrite content
-        try:
-            logger.info(f"Searching and rewriting content for topic: {topic}, level: {level}")
-            results = self.retriever.search_and_rewrite(
-                language=language,
-                topic=topic,
-                cefr_level=level,
-                top_k=n_chunks
-            )
-            
-            if not results:
-                logger.warning("No results returned from search_and_rewrite")
-                return []
-                
-            logger.info(f"Successfully generated {len(results)} simplified lessons")
-            
-            # Validate result format
-            for i, result in enumerate(results):
-                if not isinstance(result, dict):
-                    raise RetrievalError(f"Result {i} is not a dictionary: {type(result)}")
-                    
-                required_fields = ["original", "rewritten"]
-                missing_fields = [field for field in required_fields if field not in result]
-                if missing_fields:
-                    logger.warning(
-                        f"Result {i} missing fields: {missing_fields}. "
-                        f"Available fields: {list(result.keys())}"
-                    )
-            
-            return results
-            
-        except AttributeError as e:
-            logger.error(f"Retriever method error: {str(e)}")
-            raise RetrievalError(f"Retriever search_and_rewrite method failed: {str(e)}") from e
-        except Exception as e:
-            logger.error(f"Failed to search and rewrite content: {str(e)}")
-            logger.debug(f"Traceback: {traceback.format_exc()}")
-            raise RetrievalError(f"Failed to search and rewrite content: {str(e)}") from e
-
     def cleanup(self) -> None:
         """Clean up resources"""
         try:
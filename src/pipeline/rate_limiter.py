@@ -0,0 +1,234 @@
+import hashlib
+import os
+import struct
+import threading
+import time
+from collections import defaultdict
+from typing import Optional, Dict, Any, Tuple
+from urllib.parse import urlparse
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+# Requests per second and burst allowed per (host, proxy) by the shared limiter
+DEFAULT_RATE = 5.0
+DEFAULT_BURST = 10
+# Set to a directory to share rate limits between processes on this machine
+RATE_LIMIT_DIR = os.getenv("RAG_SHADOW_TUTOR_RATE_LIMIT_DIR")
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Callers reserve tokens up front and sleep outside the lock, so waiting threads
+    are served in the order they arrived and never hold the lock while sleeping.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity, i.e. how many requests may go out back to back
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+        self.rate = rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def reserve(self, tokens: int = 1) -> float:
+        """
+        Take tokens from the bucket, going into debt if it is empty.
+
+        Returns:
+            Seconds the caller must wait before sending
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, wait = self._take(self._tokens, now - self._updated, tokens)
+            self._updated = now
+            return wait
+
+    def acquire(self, tokens: int = 1) -> float:
+        """
+        Block until tokens are available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def _take(self, available: float, elapsed: float, tokens: int) -> Tuple[float, float]:
+        """Refill for the elapsed time, then take tokens. Returns (tokens left, wait)."""
+        available = min(float(self.burst), available + max(elapsed, 0.0) * self.rate) - tokens
+        return available, (-available / self.rate if available < 0 else 0.0)
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    Token bucket whose state lives in a small file, shared by every process that opens it.
+
+    The file holds the token count and the wall-clock time it was last updated and
+    is protected with an advisory lock (fcntl.flock), so it only works on POSIX.
+    """
+
+    _STATE = struct.Struct("<dd")
+
+    def __init__(self, path: str, rate: float, burst: int):
+        """
+        Initialize the bucket, creating its state file if needed.
+
+        Args:
+            path: State file; processes using the same path share one bucket
+            rate: Tokens added per second
+            burst: Bucket capacity
+        """
+        if fcntl is None:
+            raise RuntimeError("FileTokenBucket requires fcntl, which is not available on this platform")
+        super().__init__(rate, burst)
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # Open without truncating so an existing bucket keeps its state
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    def reserve(self, tokens: int = 1) -> float:
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                data = os.pread(self._fd, self._STATE.size, 0)
+                now = time.time()
+                if len(data) == self._STATE.size:
+                    available, updated = self._STATE.unpack(data)
+                else:
+                    available, updated = float(self.burst), now
+                available, wait = self._take(available, now - updated, tokens)
+                os.pwrite(self._fd, self._STATE.pack(available, now), 0)
+                return wait
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """Close the state file."""
+        os.close(self._fd)
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter with one token bucket per (host, proxy).
+
+    Requests to the same host through different proxies are paced independently,
+    because YouTube throttles per IP. Buckets are created on first use. With
+    shared_dir set, buckets are files in that directory and the limits hold across
+    every process using the same directory. Waiting time is recorded per key so
+    queueing delay can be monitored.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST,
+                 shared_dir: Optional[str] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Requests per second allowed for each (host, proxy)
+            burst: Requests that may go out back to back before pacing starts
+            shared_dir: Directory for cross-process bucket files (default: process-local)
+        """
+        # Validate once up front rather than on first use
+        TokenBucket(rate, burst)
+        self.rate = rate
+        self.burst = burst
+        self.shared_dir = shared_dir
+
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._stats: Dict[Tuple[str, str], Dict[str, float]] = defaultdict(
+            lambda: {"requests": 0, "delayed": 0, "total_wait": 0.0, "max_wait": 0.0}
+        )
+
+    def acquire(self, url: str, proxy: Optional[str] = None) -> float:
+        """
+        Block until a request to url (optionally through proxy) may be sent.
+
+        Args:
+            url: Request URL; only the host is used
+            proxy: Proxy URL the request goes through, if any
+
+        Returns:
+            Seconds spent waiting
+        """
+        key = (urlparse(url).hostname or "", self._proxy_label(proxy))
+        wait = self._bucket(key).acquire()
+
+        with self._lock:
+            stats = self._stats[key]
+            stats["requests"] += 1
+            if wait > 0:
+                stats["delayed"] += 1
+                stats["total_wait"] += wait
+                stats["max_wait"] = max(stats["max_wait"], wait)
+        return wait
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Report queueing delay per host and proxy.
+
+        Returns:
+            Dict mapping "host" or "host via proxy" to 'requests', 'delayed' (requests
+            that had to wait), 'total_wait', 'mean_wait' and 'max_wait' (seconds)
+        """
+        with self._lock:
+            report = {}
+            for (host, proxy), stats in self._stats.items():
+                label = f"{host} via {proxy}" if proxy else host
+                report[label] = dict(stats, mean_wait=stats["total_wait"] / stats["requests"])
+            return report
+
+    def _bucket(self, key: Tuple[str, str]) -> TokenBucket:
+        """Get or create the bucket for a (host, proxy) key."""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if self.shared_dir:
+                    name = hashlib.sha1("\x00".join(key).encode("utf-8")).hexdigest() + ".bucket"
+                    bucket = FileTokenBucket(os.path.join(self.shared_dir, name), self.rate, self.burst)
+                else:
+                    bucket = TokenBucket(self.rate, self.burst)
+                self._buckets[key] = bucket
+            return bucket
+
+    @staticmethod
+    def _proxy_label(proxy: Optional[str]) -> str:
+        """Identify a proxy by host and port, leaving its credentials out of keys and stats."""
+        if not proxy:
+            return ""
+        parsed = urlparse(proxy)
+        return f"{parsed.hostname}:{parsed.port}" if parsed.port else (parsed.hostname or proxy)
+
+
+_shared_limiter: Optional[RateLimiter] = None
+_shared_limiter_lock = threading.Lock()
+
+
+def shared_rate_limiter() -> RateLimiter:
+    """
+    Return the process-wide rate limiter used by every YTFetch by default.
+
+    Set RAG_SHADOW_TUTOR_RATE_LIMIT_DIR to also share it between processes.
+    """
+    global _shared_limiter
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter(shared_dir=RATE_LIMIT_DIR)
+        return _shared_limiter
@@ -0,0 +1,115 @@
+import logging
+import threading
+from typing import List, Dict, Any, Callable, Tuple
+
+from src.pipeline.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a search query so trivially different spellings share a cache entry."""
+    return " ".join(query.casefold().split())
+
+
+class SearchCache:
+    """
+    In-memory cache of YouTube search results with stale-while-revalidate.
+
+    Results younger than ttl_seconds are served as-is. Results older than that but
+    within stale_seconds more are still returned immediately, while a background
+    thread fetches a fresh copy. Entries are keyed by normalized query and max_results.
+    """
+
+    def __init__(self, ttl_seconds: float = 3600, stale_seconds: float = 24 * 3600,
+                 max_entries: int = 512):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Age until which results are served without refreshing
+            stale_seconds: Extra time stale results are still served while refreshing
+            max_entries: Maximum number of cached searches before LRU eviction
+        """
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self._cache = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds + stale_seconds)
+
+        self.stale_hits = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+        self._lock = threading.Lock()
+        self._refreshing = set()
+
+    def get_or_fetch(self, query: str, max_results: int,
+                     fetch: Callable[[], List[Dict[str, str]]]) -> List[Dict[str, str]]:
+        """
+        Return cached results for a search, fetching or refreshing them as needed.
+
+        Args:
+            query: Search query
+            max_results: Maximum number of results requested
+            fetch: Performs the actual search; called inline on a miss and in a
+                background thread to refresh stale entries
+
+        Returns:
+            List of dicts with 'title', 'url', and 'video_id' keys
+        """
+        key = (normalize_query(query), max_results)
+        entry = self._cache.get_with_age(key)
+
+        if entry is None:
+            results = fetch()
+            self._store(key, results)
+            return self._copy(results)
+
+        results, age = entry
+        if age >= self.ttl_seconds:
+            with self._lock:
+                self.stale_hits += 1
+                start_refresh = key not in self._refreshing
+                self._refreshing.add(key)
+            if start_refresh:
+                threading.Thread(target=self._refresh, args=(key, fetch), daemon=True,
+                                 name="search-cache-refresh").start()
+        return self._copy(results)
+
+    def clear(self) -> None:
+        """Remove every cached search and reset the counters."""
+        self._cache.clear()
+        with self._lock:
+            self.stale_hits = self.refreshes = self.refresh_errors = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters, including stale hits and background refreshes."""
+        stats = self._cache.stats()
+        with self._lock:
+            stats.update(stale_hits=self.stale_hits, refreshes=self.refreshes,
+                         refresh_errors=self.refresh_errors)
+        return stats
+
+    def _refresh(self, key: Tuple[str, int], fetch: Callable[[], List[Dict[str, str]]]) -> None:
+        """Re-run a search in the background and replace the stale entry."""
+        try:
+            self._store(key, fetch())
+            with self._lock:
+                self.refreshes += 1
+        except Exception as e:
+            # Keep serving the stale results; the next stale hit will try again
+            logger.warning(f"Could not refresh cached search {key[0]!r}: {e}")
+            with self._lock:
+                self.refresh_errors += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _store(self, key: Tuple[str, int], results: List[Dict[str, str]]) -> None:
+        """Cache a non-empty result list; empty pages are usually consent or error pages."""
+        if results:
+            self._cache.put(key, self._copy(results))
+
+    @staticmethod
+    def _copy(results: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """Copy results so callers can't mutate cached entries."""
+        return [dict(result) for result in results]
@@ -0,0 +1,280 @@
+import json
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+
+UNKNOWN_TITLE = "Unknown Title"
+
+# Assignments YouTube uses to embed the initial search data in the results page
+_INITIAL_DATA_MARKERS = ('var ytInitialData', 'window["ytInitialData"]')
+_ASSIGNMENT = re.compile(r'\s*=\s*')
+_VIDEO_RENDERER_KEY = '"videoRenderer"'
+_KEY_SEPARATOR = re.compile(r'\s*:\s*')
+
+# Literal prefixes that introduce a video ID in the fallback scan
+_VIDEO_ID_MARKERS = ('"/watch?v=', '"videoId":"', '/vi/')
+# Character that must follow the 11-character ID for each marker above
+_ID_TERMINATORS = ('"', '"', '/')
+_VIDEO_ID = re.compile(r'[a-zA-Z0-9_-]{11}')
+
+# How far around a video ID the fallback looks for its title
+_TITLE_WINDOW = 1024
+
+_decoder = json.JSONDecoder()
+
+
+def find_initial_data_offset(html_content: str, start: int = 0) -> int:
+    """
+    Find where the ytInitialData JSON object starts in a search results page.
+
+    Args:
+        html_content: HTML content from YouTube search
+        start: Offset to start searching from
+
+    Returns:
+        Offset of the opening brace, or -1 if the page has no initial data
+    """
+    for marker in _INITIAL_DATA_MARKERS:
+        index = html_content.find(marker, start)
+        while index >= 0:
+            assignment = _ASSIGNMENT.match(html_content, index + len(marker))
+            if assignment and html_content.startswith("{", assignment.end()):
+                return assignment.end()
+            index = html_content.find(marker, index + len(marker))
+    return -1
+
+
+def renderer_title(video_renderer: Dict) -> str:
+    """Extract the display title from a decoded videoRenderer object."""
+    title = video_renderer.get("title") or {}
+    runs = title.get("runs") or [{}]
+    return runs[0].get("text") or title.get("simpleText") or UNKNOWN_TITLE
+
+
+def iter_video_id_mentions(html_content: str) -> Iterator[Tuple[int, str]]:
+    """
+    Yield every video ID mention in document order.
+
+    Each marker is located with str.find and the three streams are merged by
+    offset, so the document is walked once without a slow regex alternation.
+
+    Args:
+        html_content: HTML content from YouTube search
+
+    Yields:
+        Tuples of (offset, video_id)
+    """
+    next_offsets = [html_content.find(marker) for marker in _VIDEO_ID_MARKERS]
+    while True:
+        candidates = [(offset, i) for i, offset in enumerate(next_offsets) if offset >= 0]
+        if not candidates:
+            return
+        offset, i = min(candidates)
+        id_start = offset + len(_VIDEO_ID_MARKERS[i])
+        next_offsets[i] = html_content.find(_VIDEO_ID_MARKERS[i], id_start)
+
+        match = _VIDEO_ID.match(html_content, id_start)
+        if match and html_content.startswith(_ID_TERMINATORS[i], match.end()):
+            yield offset, match.group()
+
+
+def find_title_near(html_content: str, video_id: str, offset: int) -> Optional[str]:
+    """
+    Look for a video's title in a small window around one mention of its ID.
+
+    Args:
+        html_content: HTML content
+        video_id: Video ID to search near
+        offset: Offset of the mention
+
+    Returns:
+        Title string, or None if no title pattern matches inside the window
+    """
+    window = html_content[max(0, offset - _TITLE_WINDOW):offset + _TITLE_WINDOW]
+    if video_id not in window:
+        return None
+
+    escaped_id = re.escape(video_id)
+    patterns = [
+        # …"title":{"runs":[{"text":"THE TITLE"}],"accessibility…
+        rf'"title"\s*:\s*{{\s*"runs"\s*:\s*\[\s*{{\s*"text"\s*:\s*"([^"]+?)"\s*}}\s*\]\s*}}\s*,\s*"videoId"\s*:\s*"{escaped_id}"',
+
+        # …"videoId":"<id>", "title":{"runs":[{"text":"THE TITLE"}]…
+        rf'"videoId"\s*:\s*"{escaped_id}"\s*,\s*"title"\s*:\s*{{\s*"runs"\s*:\s*\[\s*{{\s*"text"\s*:\s*"([^"]+?)"',
+
+        # Fallback:   <a href="/watch?v=<id>" … > TITLE </a>
+        rf'href="/watch\?v={escaped_id}"[^>]*>\s*([^<]+?)\s*</a>',
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, window)
+        if match:
+            return match.group(1)
+
+    return None
+
+
+def scan_video_ids(html_content: str, max_results: int) -> List[Tuple[str, str]]:
+    """
+    Fallback extraction of video IDs and nearby titles in a single pass.
+
+    Titles are only looked up in a window around each mention, so the cost stays
+    proportional to the page size instead of page size times number of IDs.
+
+    Args:
+        html_content: HTML content from YouTube search
+        max_results: Maximum number of results to extract
+
+    Returns:
+        List of tuples (video_id, title) in order of first appearance
+    """
+    titles: Dict[str, Optional[str]] = {}
+
+    for offset, video_id in iter_video_id_mentions(html_content):
+        if video_id not in titles:
+            if len(titles) >= max_results:
+                continue
+            titles[video_id] = None
+        if titles[video_id] is None:
+            titles[video_id] = find_title_near(html_content, video_id, offset)
+
+        # Stop once every result we are going to return has a title
+        if len(titles) >= max_results and all(titles.values()):
+            break
+
+    return [(video_id, title or UNKNOWN_TITLE) for video_id, title in titles.items()]
+
+
+class IncrementalSearchParser:
+    """
+    Extract search results from a page that arrives in chunks.
+
+    Text is fed as it is downloaded; each videoRenderer is decoded as soon as it is
+    complete, so a streaming caller can stop reading once max_results are found.
+    Pages without usable ytInitialData fall back to scan_video_ids on close().
+    """
+
+    # Give up waiting for a renderer to complete after this many buffered characters
+    MAX_PENDING_CHARS = 1024 * 1024
+
+    def __init__(self, max_results: int):
+        """
+        Initialize the parser.
+
+        Args:
+            max_results: Maximum number of results to extract
+        """
+        self.max_results = max_results
+        self.results: List[Tuple[str, str]] = []
+        self._seen = set()
+        # Everything fed so far, kept for the fallback scan
+        self._chunks: List[str] = []
+        # Unconsumed text; self._pos marks how far it has been scanned
+        self._buffer = ""
+        self._pos = 0
+        self._in_initial_data = False
+
+    @property
+    def done(self) -> bool:
+        """Whether max_results have been found and no more input is needed."""
+        return len(self.results) >= self.max_results
+
+    def feed(self, text: str) -> bool:
+        """
+        Add the next piece of the page and extract any newly completed results.
+
+        Args:
+            text: Next chunk of decoded HTML
+
+        Returns:
+            True once max_results have been found
+        """
+        if self.done:
+            return True
+        self._chunks.append(text)
+        if self._pos:
+            # Drop the already-scanned prefix so the buffer stays small
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        self._buffer += text
+        self._scan(final=False)
+        return self.done
+
+    def close(self) -> List[Tuple[str, str]]:
+        """
+        Finish parsing after the last chunk.
+
+        Returns:
+            List of tuples (video_id, title)
+        """
+        if not self.done:
+            self._scan(final=True)
+        if self.results or self.max_results <= 0:
+            return self.results
+        return scan_video_ids("".join(self._chunks), self.max_results)
+
+    def _scan(self, final: bool) -> None:
+        """Advance through the buffer, decoding every complete videoRenderer."""
+        buffer = self._buffer
+
+        if not self._in_initial_data:
+            offset = find_initial_data_offset(buffer, self._pos)
+            if offset < 0:
+                # Keep enough of the tail to match a marker split across chunks
+                self._pos = max(self._pos, len(buffer) - 64)
+                return
+            self._in_initial_data = True
+            self._pos = offset
+
+        while not self.done:
+            index = buffer.find(_VIDEO_RENDERER_KEY, self._pos)
+            if index < 0:
+                self._pos = max(self._pos, len(buffer) - len(_VIDEO_RENDERER_KEY))
+                return
+            key_end = index + len(_VIDEO_RENDERER_KEY)
+            separator = _KEY_SEPARATOR.match(buffer, key_end)
+            if separator is None or not buffer.startswith("{", separator.end()):
+                if not final and not buffer[key_end:].strip(" \t\r\n:"):
+                    # Cut off between the key and its value - wait for the next chunk
+                    self._pos = index
+                    return
+                # "videoRenderer" used as something other than an object key
+                self._pos = key_end
+                continue
+
+            start = separator.end()
+            try:
+                video_renderer, end = _decoder.raw_decode(buffer, start)
+            except ValueError:
+                if not final and len(buffer) - index < self.MAX_PENDING_CHARS:
+                    # Probably cut off mid-object - wait for the next chunk
+                    self._pos = index
+                    return
+                self._pos = start
+                continue
+
+            self._pos = end
+            if isinstance(video_renderer, dict):
+                video_id = video_renderer.get("videoId")
+                if video_id and video_id not in self._seen:
+                    self._seen.add(video_id)
+                    self.results.append((video_id, renderer_title(video_renderer)))
+
+
+def parse_search_results(html_content: str, max_results: int) -> List[Tuple[str, str]]:
+    """
+    Extract video IDs and titles from YouTube search results HTML.
+
+    Decodes videoRenderer objects incrementally from the ytInitialData blob and
+    falls back to a single scan for bare video IDs when the page has no usable
+    initial data.
+
+    Args:
+        html_content: HTML content from YouTube search
+        max_results: Maximum number of results to extract
+
+    Returns:
+        List of tuples (video_id, title)
+    """
+    parser = IncrementalSearchParser(max_results)
+    parser.feed(html_content)
+    return parser.close()
@@ -0,0 +1,322 @@
+import hashlib
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Iterable, Union
+
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+
+from src.models.transcript import TranscriptSegments
+
+# Root directory for everything the tutor caches on disk
+DEFAULT_CACHE_DIR = os.getenv(
+    "RAG_SHADOW_TUTOR_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "rag-shadow-tutor")
+)
+
+
+class TranscriptCache:
+    """
+    Persistent on-disk cache of fetched YouTube transcripts.
+
+    Entries are keyed by (video_id, language_code, is_generated) and stored one per
+    file as zlib-compressed TranscriptSegments bytes. Entries older than the TTL are treated as misses and
+    the least recently used entries are evicted once the cache exceeds max_bytes.
+    """
+
+    FILE_SUFFIX = ".ytc"
+    # magic, format version, created_at (unix seconds)
+    _HEADER = struct.Struct("<4sBd")
+    _MAGIC = b"YTC1"
+    # Version 1 stored JSON; such files are treated as corrupt and refetched
+    _VERSION = 2
+
+    def __init__(self, cache_dir: Optional[str] = None,
+                 ttl_seconds: Optional[float] = 7 * 24 * 3600,
+                 max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize the cache and index any entries already on disk.
+
+        Args:
+            cache_dir: Directory for cache files (default: <DEFAULT_CACHE_DIR>/transcripts)
+            ttl_seconds: Maximum age of an entry before it is refetched. None disables expiry.
+            max_bytes: Upper bound on the total size of cache files before LRU eviction
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+
+        self.cache_dir = cache_dir or os.path.join(DEFAULT_CACHE_DIR, "transcripts")
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        # file name -> size in bytes, least recently used first
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_index()
+
+    def get(self, video_id: str, language_code: str, is_generated: bool) -> Optional[FetchedTranscript]:
+        """
+        Return the cached transcript for an exact key, or None on a miss.
+
+        Args:
+            video_id: YouTube video ID
+            language_code: Transcript language code (e.g., 'en', 'es')
+            is_generated: Whether the transcript is auto-generated
+
+        Returns:
+            FetchedTranscript rebuilt from the cache, or None
+        """
+        return self._to_fetched(self.get_segments(video_id, language_code, is_generated))
+
+    def get_segments(self, video_id: str, language_code: str, is_generated: bool) -> Optional[TranscriptSegments]:
+        """Like get, but return the columnar TranscriptSegments without building snippet objects."""
+        return self._get(self._file_name(video_id, language_code, is_generated))
+
+    def lookup(self, video_id: str, language_codes: Iterable[str]) -> Optional[FetchedTranscript]:
+        """
+        Find a cached transcript using the same priority as TranscriptList.find_transcript.
+
+        Each language code is tried in order, preferring manually created transcripts
+        over generated ones. Counts as a single hit or miss.
+
+        Args:
+            video_id: YouTube video ID
+            language_codes: Language codes in descending priority
+
+        Returns:
+            FetchedTranscript rebuilt from the cache, or None
+        """
+        return self._to_fetched(self.lookup_segments(video_id, language_codes))
+
+    def lookup_segments(self, video_id: str, language_codes: Iterable[str]) -> Optional[TranscriptSegments]:
+        """Like lookup, but return the columnar TranscriptSegments without building snippet objects."""
+        for language_code in language_codes:
+            for is_generated in (False, True):
+                transcript = self._read(self._file_name(video_id, language_code, is_generated))
+                if transcript is not None:
+                    with self._lock:
+                        self.hits += 1
+                    return transcript
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, transcript: Union[FetchedTranscript, TranscriptSegments]) -> None:
+        """
+        Store a fetched transcript, evicting least recently used entries if needed.
+
+        Args:
+            transcript: Transcript as returned by Transcript.fetch, or TranscriptSegments
+        """
+        self._write(
+            self._file_name(transcript.video_id, transcript.language_code, transcript.is_generated), transcript
+        )
+
+    def clear(self) -> None:
+        """Remove every cached transcript and reset the counters."""
+        with self._lock:
+            for name in list(self._entries):
+                self._remove_locked(name)
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current cache size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+            }
+
+    def _get(self, name: str) -> Optional[TranscriptSegments]:
+        """Read an entry by file name, counting a hit or a miss."""
+        transcript = self._read(name)
+        with self._lock:
+            if transcript is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return transcript
+
+    def _write(self, name: str, transcript: Union[FetchedTranscript, TranscriptSegments]) -> None:
+        """Serialize a transcript to the named cache file and account for its size."""
+        if not isinstance(transcript, TranscriptSegments):
+            transcript = TranscriptSegments.from_fetched(transcript)
+        payload = transcript.to_bytes()
+        data = self._HEADER.pack(self._MAGIC, self._VERSION, time.time()) + zlib.compress(payload, 6)
+
+        path = os.path.join(self.cache_dir, name)
+
+        # Write atomically so concurrent readers never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._total_bytes -= self._entries.pop(name, 0)
+            self._entries[name] = len(data)
+            self._total_bytes += len(data)
+            self._evict_locked()
+
+    def _read(self, name: str) -> Optional[TranscriptSegments]:
+        """Read and decode a cache file, dropping it if it is expired or corrupt."""
+        path = os.path.join(self.cache_dir, name)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                self._total_bytes -= self._entries.pop(name, 0)
+            return None
+
+        try:
+            magic, version, created_at = self._HEADER.unpack_from(data)
+            if magic != self._MAGIC or version != self._VERSION:
+                raise ValueError("unknown cache file format")
+            if self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds:
+                with self._lock:
+                    self._remove_locked(name)
+                return None
+            segments = TranscriptSegments.from_bytes(zlib.decompress(data[self._HEADER.size:]))
+        except (ValueError, struct.error, zlib.error):
+            with self._lock:
+                self._remove_locked(name)
+            return None
+
+        # Touch the file so LRU order survives restarts
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            if name in self._entries:
+                self._entries.move_to_end(name)
+            else:
+                # Written by another process since we built the index
+                self._entries[name] = len(data)
+                self._total_bytes += len(data)
+
+        return segments
+
+    @staticmethod
+    def _to_fetched(segments: Optional[TranscriptSegments]) -> Optional[FetchedTranscript]:
+        """Rebuild the youtube_transcript_api object for callers that expect one."""
+        if segments is None:
+            return None
+        return FetchedTranscript(
+            snippets=[FetchedTranscriptSnippet(**entry) for entry in segments.to_raw_data()],
+            video_id=segments.video_id,
+            language=segments.language,
+            language_code=segments.language_code,
+            is_generated=segments.is_generated,
+        )
+
+    def _load_index(self) -> None:
+        """Index existing cache files, least recently used first."""
+        found = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith(self.FILE_SUFFIX):
+                stat = entry.stat()
+                found.append((stat.st_mtime, entry.name, stat.st_size))
+
+        with self._lock:
+            for _, name, size in sorted(found):
+                self._entries[name] = size
+                self._total_bytes += size
+            self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        """Drop least recently used entries until the cache fits in max_bytes."""
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            name = next(iter(self._entries))
+            self._remove_locked(name)
+            self.evictions += 1
+
+    def _remove_locked(self, name: str) -> None:
+        """Forget an entry and delete its file. Caller must hold the lock."""
+        self._total_bytes -= self._entries.pop(name, 0)
+        try:
+            os.remove(os.path.join(self.cache_dir, name))
+        except FileNotFoundError:
+            pass
+
+    @classmethod
+    def _file_name(cls, video_id: str, language_code: str, is_generated: bool) -> str:
+        """Build a filesystem-safe file name for a cache key."""
+        key = f"{video_id}\x00{language_code}\x00{int(is_generated)}"
+        return hashlib.sha1(key.encode("utf-8")).hexdigest() + cls.FILE_SUFFIX
+
+
+class TranslationCache(TranscriptCache):
+    """
+    Persistent on-disk cache of YouTube machine translations.
+
+    Same storage format, TTL and eviction as TranscriptCache, but entries are keyed by
+    (video_id, source_language, target_language). A translated transcript reports
+    itself as generated in the target language, so sharing a key space with
+    TranscriptCache would mix translations up with real generated captions.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None,
+                 ttl_seconds: Optional[float] = 7 * 24 * 3600,
+                 max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize the cache and index any entries already on disk.
+
+        Args:
+            cache_dir: Directory for cache files (default: <DEFAULT_CACHE_DIR>/translations)
+            ttl_seconds: Maximum age of an entry before it is refetched. None disables expiry.
+            max_bytes: Upper bound on the total size of cache files before LRU eviction
+        """
+        super().__init__(cache_dir or os.path.join(DEFAULT_CACHE_DIR, "translations"),
+                         ttl_seconds=ttl_seconds, max_bytes=max_bytes)
+
+    def get_translation(self, video_id: str, source_language: str,
+                        target_language: str) -> Optional[FetchedTranscript]:
+        """
+        Return a cached translation, or None on a miss.
+
+        Args:
+            video_id: YouTube video ID
+            source_language: Language code of the transcript that was translated
+            target_language: Language code it was translated to
+
+        Returns:
+            FetchedTranscript rebuilt from the cache, or None
+        """
+        return self._to_fetched(self._get(self._translation_file_name(video_id, source_language, target_language)))
+
+    def put_translation(self, source_language: str, transcript: FetchedTranscript) -> None:
+        """
+        Store a fetched translation.
+
+        Args:
+            source_language: Language code of the transcript that was translated
+            transcript: Translated transcript; its language_code is the target language
+        """
+        self._write(
+            self._translation_file_name(transcript.video_id, source_language, transcript.language_code),
+            transcript
+        )
+
+    @classmethod
+    def _translation_file_name(cls, video_id: str, source_language: str, target_language: str) -> str:
+        """Build a filesystem-safe file name for a translation key."""
+        key = f"{video_id}\x00{source_language}\x00{target_language}\x00translation"
+        return hashlib.sha1(key.encode("utf-8")).hexdigest() + cls.FILE_SUFFIX
@@ -0,0 +1,109 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Hashable, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory LRU cache whose entries expire after a time-to-live.
+
+    Each entry may override the default TTL. Expired entries are dropped lazily
+    when they are read and the least recently used entries are evicted once the
+    cache holds max_entries.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: Optional[float] = 3600):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept before LRU eviction
+            ttl_seconds: Default lifetime of an entry. None disables expiry.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        self._lock = threading.Lock()
+        # key -> (value, stored_at, expires_at), least recently used first
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float, Optional[float]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for key, or default if it is missing or expired."""
+        entry = self.get_with_age(key)
+        return default if entry is None else entry[0]
+
+    def get_with_age(self, key: Hashable) -> Optional[Tuple[Any, float]]:
+        """
+        Look up a live entry.
+
+        Returns:
+            Tuple of (value, seconds since it was stored), or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            now = time.monotonic()
+            if entry is not None and entry[2] is not None and now >= entry[2]:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0], now - entry[1]
+
+    def put(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Store a value, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl_seconds: Lifetime of this entry (default: the cache's ttl_seconds)
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        now = time.monotonic()
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (value, now, None if ttl is None else now + ttl)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove an entry and return its value."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "entries": len(self._entries),
+            }
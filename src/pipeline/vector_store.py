@@ -0,0 +1,322 @@
+import json
+import mmap
+import os
+import struct
+import threading
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Tuple, Sequence, Union
+
+import numpy as np
+
+
+@dataclass
+class StoredDocument:
+    """A search hit, with the same page_content/metadata attributes as a langchain Document."""
+    page_content: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+class _EncodedStrings(Sequence):
+    """Read-only sequence of strings stored as UTF-8 in one buffer, decoded on access."""
+
+    def __init__(self, buffer: Union[bytes, memoryview], offsets: np.ndarray):
+        self._buffer = buffer
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return str(self._buffer[self._offsets[index]:self._offsets[index + 1]], "utf-8")
+
+
+class _EncodedMetadatas(_EncodedStrings):
+    """Read-only sequence of metadata dicts stored as JSON, parsed on access."""
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return json.loads(super().__getitem__(index))
+
+
+class NumpyVectorStore:
+    """
+    In-memory vector store backed by one contiguous float32 matrix.
+
+    Vectors are L2-normalized when added, so cosine similarity is a single
+    matrix-vector product over all rows, and the top k are picked with
+    argpartition instead of a full sort. The matrix grows by doubling, so adding
+    n vectors costs amortized O(n) copies. It implements the parts of langchain's
+    VectorStore used by LanguageLearningRetriever (add_texts, similarity_search).
+
+    A store can be saved to a snapshot file and loaded back with mmap: the matrix
+    is used in place from the page cache and texts and metadata are decoded only
+    for search hits, so loading takes about as long as opening the file, and
+    processes loading the same snapshot share its pages.
+    """
+
+    # magic, format version, dimension, vector count, text bytes, metadata bytes
+    _HEADER = struct.Struct("<4sB3xIQQQ")
+    _MAGIC = b"NVS1"
+    _VERSION = 1
+    # The matrix starts at this offset so it is aligned for vectorized reads
+    _DATA_OFFSET = 64
+
+    def __init__(self, embedding: Any, initial_capacity: int = 1024):
+        """
+        Initialize an empty store.
+
+        Args:
+            embedding: Object with embed_documents and embed_query (e.g., OpenAIEmbeddings)
+            initial_capacity: Rows allocated when the first vectors are added
+        """
+        if initial_capacity < 1:
+            raise ValueError(f"initial_capacity must be at least 1, got {initial_capacity}")
+        self.embedding = embedding
+        self.initial_capacity = initial_capacity
+
+        self._lock = threading.Lock()
+        self._matrix: Optional[np.ndarray] = None
+        self._size = 0
+        # Lists, or encoded sequences when loaded from a snapshot
+        self._texts: Sequence[str] = []
+        self._metadatas: Sequence[Dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def dim(self) -> Optional[int]:
+        """Embedding dimension, or None before anything is added."""
+        return None if self._matrix is None else self._matrix.shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated for the embedding matrix, including spare capacity."""
+        return 0 if self._matrix is None else self._matrix.nbytes
+
+    def add_texts(self, texts: List[str], metadatas: Optional[List[Dict[str, Any]]] = None) -> List[str]:
+        """
+        Embed texts and add them to the store.
+
+        Args:
+            texts: Texts to embed and store
+            metadatas: Optional metadata dict per text
+
+        Returns:
+            IDs of the added texts
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+        return self.add_vectors(self.embedding.embed_documents(texts), texts, metadatas)
+
+    def add_vectors(self, vectors: Any, texts: List[str],
+                    metadatas: Optional[List[Dict[str, Any]]] = None) -> List[str]:
+        """
+        Add precomputed embeddings.
+
+        Args:
+            vectors: Array-like of shape (len(texts), dim)
+            texts: Text of each vector
+            metadatas: Optional metadata dict per text
+
+        Returns:
+            IDs of the added texts
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2 or len(vectors) != len(texts):
+            raise ValueError(f"Expected {len(texts)} vectors, got an array of shape {vectors.shape}")
+        if metadatas is not None and len(metadatas) != len(texts):
+            raise ValueError(f"Expected {len(texts)} metadatas, got {len(metadatas)}")
+
+        with self._lock:
+            if self._matrix is not None and vectors.shape[1] != self._matrix.shape[1]:
+                raise ValueError(f"Expected vectors of dimension {self._matrix.shape[1]}, got {vectors.shape[1]}")
+            start = self._size
+            end = start + len(vectors)
+            self._reserve(end, vectors.shape[1])
+            rows = self._matrix[start:end]
+            rows[:] = vectors
+            self._normalize(rows)
+            if not isinstance(self._texts, list):
+                # First append to a loaded snapshot: decode it into ordinary lists
+                self._texts = list(self._texts)
+                self._metadatas = list(self._metadatas)
+            self._texts.extend(texts)
+            self._metadatas.extend(dict(m) for m in metadatas or [{} for _ in texts])
+            self._size = end
+        return [str(i) for i in range(start, end)]
+
+    def similarity_search(self, query: str, k: int = 4) -> List[StoredDocument]:
+        """
+        Find the stored texts most similar to a query.
+
+        Args:
+            query: Query text
+            k: Number of results
+
+        Returns:
+            Up to k documents, most similar first
+        """
+        return [doc for doc, _ in self.similarity_search_with_score(query, k)]
+
+    def similarity_search_with_score(self, query: str, k: int = 4) -> List[Tuple[StoredDocument, float]]:
+        """Like similarity_search, with each document's cosine similarity."""
+        return self.similarity_search_by_vectors([self.embedding.embed_query(query)], k)[0]
+
+    def similarity_search_by_vectors(self, queries: Any, k: int = 4) -> List[List[Tuple[StoredDocument, float]]]:
+        """
+        Search for several query embeddings at once with one matrix product.
+
+        Args:
+            queries: Array-like of shape (n_queries, dim)
+            k: Number of results per query
+
+        Returns:
+            For each query, up to k (document, cosine similarity) pairs, most similar first
+        """
+        indices, scores = self.top_k(queries, k)
+        return [
+            [(StoredDocument(self._texts[i], dict(self._metadatas[i])), float(score))
+             for i, score in zip(row_indices, row_scores)]
+            for row_indices, row_scores in zip(indices.tolist(), scores.tolist())
+        ]
+
+    def top_k(self, queries: Any, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Row indices and cosine similarities of the k nearest stored vectors per query.
+
+        Args:
+            queries: Array-like of shape (n_queries, dim)
+            k: Number of results per query
+
+        Returns:
+            Tuple of (indices, scores), both of shape (n_queries, min(k, len(self))),
+            sorted by descending score
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        # Rows below size are never rewritten, so the snapshot can be searched outside the lock
+        with self._lock:
+            matrix, size = self._matrix, self._size
+        k = min(k, size)
+        if k <= 0:
+            return np.empty((len(queries), 0), dtype=np.int64), np.empty((len(queries), 0), dtype=np.float32)
+
+        queries = queries.copy()
+        self._normalize(queries)
+        scores = queries @ matrix[:size].T
+        if k < size:
+            candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            candidates = np.broadcast_to(np.arange(size), scores.shape)
+        candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1, kind="stable")
+        return np.take_along_axis(candidates, order, axis=1), np.take_along_axis(candidate_scores, order, axis=1)
+
+    def save(self, path: str) -> int:
+        """
+        Write the store to a snapshot file, atomically replacing any existing one.
+
+        Args:
+            path: Snapshot file path
+
+        Returns:
+            Size of the snapshot in bytes
+        """
+        with self._lock:
+            matrix = self._matrix[:self._size] if self._matrix is not None else np.zeros((0, 0), np.float32)
+            texts = [text.encode("utf-8") for text in self._texts[:self._size]]
+            metadatas = [json.dumps(metadata, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                         for metadata in self._metadatas[:self._size]]
+
+        text_offsets = self._offsets(texts)
+        metadata_offsets = self._offsets(metadatas)
+        header = self._HEADER.pack(self._MAGIC, self._VERSION, matrix.shape[1], len(matrix),
+                                   int(text_offsets[-1]), int(metadata_offsets[-1]))
+        parts = [
+            header.ljust(self._DATA_OFFSET, b"\0"),
+            np.ascontiguousarray(matrix, dtype="<f4").tobytes(),
+            text_offsets.astype("<i8").tobytes(),
+            metadata_offsets.astype("<i8").tobytes(),
+            b"".join(texts),
+            b"".join(metadatas),
+        ]
+
+        # Write atomically: processes with the old snapshot mapped keep reading the old file
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            for part in parts:
+                f.write(part)
+        os.replace(tmp_path, path)
+        return sum(len(part) for part in parts)
+
+    @classmethod
+    def load(cls, path: str, embedding: Any, **kwargs: Any) -> "NumpyVectorStore":
+        """
+        Open a snapshot written by save, memory-mapping it instead of reading it.
+
+        Args:
+            path: Snapshot file path
+            embedding: Embeddings object for queries and later additions; must be the
+                model the snapshot was built with
+            **kwargs: Other constructor arguments for the store
+
+        Returns:
+            NumpyVectorStore searching the mapped snapshot
+
+        Raises:
+            ValueError: If the file is not a valid snapshot
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < cls._DATA_OFFSET:
+                raise ValueError(f"Truncated vector store snapshot: {path}")
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, dim, count, text_length, metadata_length = cls._HEADER.unpack_from(data)
+        if magic != cls._MAGIC or version != cls._VERSION:
+            raise ValueError(f"Unknown vector store snapshot format: {path}")
+        position = cls._DATA_OFFSET
+        matrix = np.frombuffer(data, dtype="<f4", count=count * dim, offset=position).reshape(count, dim)
+        position += matrix.nbytes
+        text_offsets = np.frombuffer(data, dtype="<i8", count=count + 1, offset=position)
+        position += text_offsets.nbytes
+        metadata_offsets = np.frombuffer(data, dtype="<i8", count=count + 1, offset=position)
+        position += metadata_offsets.nbytes
+        if position + text_length + metadata_length != len(data):
+            raise ValueError(f"Truncated vector store snapshot: {path}")
+
+        buffer = memoryview(data)
+        store = cls(embedding, **kwargs)
+        store._matrix = matrix if count else None
+        store._size = count
+        store._texts = _EncodedStrings(buffer[position:position + text_length], text_offsets)
+        position += text_length
+        store._metadatas = _EncodedMetadatas(buffer[position:position + metadata_length], metadata_offsets)
+        return store
+
+    @staticmethod
+    def _offsets(encoded: List[bytes]) -> np.ndarray:
+        """len(encoded) + 1 offsets of each item in the concatenation of encoded."""
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(item) for item in encoded], out=offsets[1:])
+        return offsets
+
+    def _reserve(self, rows: int, dim: int) -> None:
+        """Grow the matrix to hold at least rows vectors, doubling capacity. Caller holds the lock."""
+        if self._matrix is None:
+            self._matrix = np.zeros((max(self.initial_capacity, rows), dim), dtype=np.float32)
+        elif rows > len(self._matrix) or not self._matrix.flags.writeable:
+            # A matrix mapped from a snapshot is read-only and copied on first growth
+            grown = np.zeros((max(rows, 2 * len(self._matrix)), dim), dtype=np.float32)
+            grown[:self._size] = self._matrix[:self._size]
+            self._matrix = grown
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> None:
+        """Scale rows to unit length in place; zero rows stay zero."""
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
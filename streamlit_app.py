@@ -116,6 +116,8 @@ if 'available_languages' not in st.session_state:
     st.session_state['available_languages'] = None
 if 'current_url' not in st.session_state:
     st.session_state['current_url'] = None
+if 'seek_time' not in st.session_state:
+    st.session_state['seek_time'] = None
 
 
 def extract_video_id(url: str) -> Optional[str]:
@@ -142,6 +144,20 @@ def extract_video_id(url: str) -> Optional[str]:
     return None
 
 
+def format_timestamp(seconds: float) -> str:
+    """Format seconds as m:ss or h:mm:ss."""
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
+
+
+def seek_video(seconds: float) -> None:
+    """Make the video player start at the given time on the next rerun."""
+    st.session_state['seek_time'] = int(seconds)
+
+
 def is_youtube_url(text: str) -> bool:
     """Check if text is a YouTube URL."""
     youtube_domains = ["youtube.com", "youtu.be", "www.youtube.com", "m.youtube.com"]
@@ -354,6 +370,7 @@ else:
 
                         if results:
                             st.session_state['lesson_data'] = results
+                            st.session_state['seek_time'] = None
                             st.session_state['video_id'] = video_id
                             st.session_state['current_language'] = language_code
                             st.success(f"✅ Lesson generated successfully in {language}!")
@@ -408,10 +425,12 @@ else:
         with lesson_col:
             # Video player
             st.markdown("### 🎥 Video")
+            seek_time = st.session_state.get('seek_time')
+            player_params = f"?start={seek_time}&autoplay=1" if seek_time is not None else ""
             st.markdown(
                 f'<iframe width="100%" height="315" '
-                f'src="https://www.youtube.com/embed/{st.session_state["video_id"]}" '
-                f'frameborder="0" allowfullscreen></iframe>',
+                f'src="https://www.youtube.com/embed/{st.session_state["video_id"]}{player_params}" '
+                f'frameborder="0" allow="autoplay" allowfullscreen></iframe>',
                 unsafe_allow_html=True
             )
 
@@ -428,6 +447,13 @@ else:
                         st.markdown("**Original Text**")
                         st.info(chunk.get('original', ''))
                         st.caption(f"Words: {len(chunk.get('original', '').split())}")
+                        if chunk.get('start_time') is not None:
+                            st.button(
+                                f"▶ Play from {format_timestamp(chunk['start_time'])}",
+                                key=f"seek_{i}",
+                                on_click=seek_video,
+                                args=(chunk['start_time'],)
+                            )
 
                     with col_b:
                         st.markdown(f"**Simplified ({level})**")
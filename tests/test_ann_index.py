@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from src.pipeline.ann_index import IVFVectorStore, spherical_kmeans
+from src.pipeline.vector_store import NumpyVectorStore
+
+
+def clustered_vectors(rng, n, dim=16, clusters=20):
+    """Points scattered around random centers, like embeddings of related chunks."""
+    centers = rng.standard_normal((clusters, dim))
+    return (centers[rng.integers(0, clusters, n)] + 0.3 * rng.standard_normal((n, dim))).astype(np.float32)
+
+
+def recall(approximate, exact):
+    return np.mean([len(set(a) & set(e)) / len(e) for a, e in zip(approximate.tolist(), exact.tolist())])
+
+
+class TestIVFVectorStore:
+    """Test suite for the approximate nearest-neighbor store."""
+
+    def test_small_store_searches_exactly(self):
+        """Test that stores below min_train_size are not indexed and match exact search."""
+        rng = np.random.default_rng(0)
+        vectors = clustered_vectors(rng, 100)
+        store = IVFVectorStore(embedding=None, min_train_size=1000)
+        exact = NumpyVectorStore(embedding=None)
+        store.add_vectors(vectors, [str(i) for i in range(100)])
+        exact.add_vectors(vectors, [str(i) for i in range(100)])
+
+        assert not store.trained
+        np.testing.assert_array_equal(store.top_k(vectors[:5], 3)[0], exact.top_k(vectors[:5], 3)[0])
+
+    def test_recall_improves_with_nprobe(self):
+        """Test recall against exact search, reaching exact results when every cluster is probed."""
+        rng = np.random.default_rng(1)
+        vectors = clustered_vectors(rng, 4000)
+        queries = clustered_vectors(rng, 50)
+        store = IVFVectorStore(embedding=None, nlist=32, nprobe=1, min_train_size=1000)
+        exact = NumpyVectorStore(embedding=None)
+        for store_ in (store, exact):
+            store_.add_vectors(vectors, [str(i) for i in range(4000)])
+        expected = exact.top_k(queries, 10)[0]
+
+        assert store.trained
+        low = recall(store.top_k(queries, 10)[0], expected)
+        store.nprobe = 8
+        assert recall(store.top_k(queries, 10)[0], expected) >= max(low, 0.9)
+        store.nprobe = 32
+        indices, scores = store.top_k(queries, 10)
+        np.testing.assert_array_equal(indices, expected)
+        assert np.all(np.diff(scores, axis=1) <= 0)
+
+    def test_incremental_inserts_are_searchable(self):
+        """Test that vectors added after training are assigned to clusters and found."""
+        rng = np.random.default_rng(2)
+        store = IVFVectorStore(embedding=None, nlist=16, nprobe=2, min_train_size=500, retrain_growth=100)
+        store.add_vectors(clustered_vectors(rng, 500), ["old"] * 500)
+        new = clustered_vectors(rng, 50)
+        store.add_vectors(new, [f"new {i}" for i in range(50)])
+
+        indices, scores = store.top_k(new, 1)
+
+        assert store._indexed == len(store) == 550 and store._list_sizes.sum() == 550
+        np.testing.assert_array_equal(indices[:, 0], np.arange(500, 550))
+        assert scores[:, 0] == pytest.approx(1.0)
+
+    def test_retrains_as_store_grows(self):
+        """Test that the cluster count follows the store size after enough growth."""
+        rng = np.random.default_rng(3)
+        store = IVFVectorStore(embedding=None, min_train_size=100, retrain_growth=4.0)
+        store.add_vectors(clustered_vectors(rng, 100), ["a"] * 100)
+        first = len(store._centroids)
+        store.add_vectors(clustered_vectors(rng, 300), ["b"] * 300)
+
+        assert store._trained_size == 400 and len(store._centroids) > first
+        assert store.top_k(clustered_vectors(rng, 3), 400)[0].shape == (3, 400)
+
+    def test_snapshot_load_rebuilds_index(self, tmp_path):
+        """Test that a loaded snapshot is indexed with the given options."""
+        rng = np.random.default_rng(4)
+        store = IVFVectorStore(embedding=None, nlist=8, min_train_size=200)
+        store.add_vectors(clustered_vectors(rng, 300), [str(i) for i in range(300)])
+        path = str(tmp_path / "index.nvs")
+        store.save(path)
+
+        loaded = IVFVectorStore.load(path, None, nlist=8, nprobe=8, min_train_size=200)
+
+        assert loaded.trained and len(loaded._centroids) == 8
+        store.nprobe = 8
+        np.testing.assert_array_equal(loaded.top_k(store._matrix[:5], 4)[0], store.top_k(store._matrix[:5], 4)[0])
+
+    def test_spherical_kmeans_returns_unit_centroids(self):
+        """Test that every centroid is normalized even when clusters empty out."""
+        rng = np.random.default_rng(5)
+        data = clustered_vectors(rng, 200, clusters=3)
+        NumpyVectorStore._normalize(data)
+
+        centroids = spherical_kmeans(data, 10, rng=rng)
+
+        assert centroids.shape == (10, 16)
+        np.testing.assert_allclose(np.linalg.norm(centroids, axis=1), 1.0, rtol=1e-5)
+        with pytest.raises(ValueError):
+            IVFVectorStore(embedding=None, nprobe=0)
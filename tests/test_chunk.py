@@ -0,0 +1,41 @@
+import hashlib
+
+import pytest
+
+from src.models.chunk import Chunk
+
+
+class TestChunk:
+    """Test suite for the Chunk model."""
+
+    def test_owned_and_lazy_chunks_are_equivalent(self):
+        """Test that a chunk slicing its parent text behaves like one holding a copy."""
+        text = "Hola amigos. Bienvenidos a la clase."
+        owned = Chunk("Bienvenidos a la clase.", video_id="dQw4w9WgXcQ", char_start=13, char_end=36)
+        lazy = Chunk(source=text, video_id="dQw4w9WgXcQ", char_start=13, char_end=36)
+
+        assert lazy.content == "Bienvenidos a la clase."
+        assert lazy == owned
+        assert lazy.content_hash == hashlib.sha256(b"Bienvenidos a la clase.").hexdigest()
+
+    def test_to_metadata_carries_provenance(self):
+        """Test the flat metadata dict handed to the vector store."""
+        chunk = Chunk("hola", video_id="dQw4w9WgXcQ", language="es", char_start=0, char_end=4,
+                      start_time=1.5, end_time=4.0, segment_start=0, segment_end=2)
+
+        assert chunk.duration == 2.5
+        assert chunk.to_metadata() == {
+            "video_id": "dQw4w9WgXcQ", "language": "es", "char_start": 0, "char_end": 4,
+            "start_time": 1.5, "end_time": 4.0, "segment_start": 0, "segment_end": 2,
+            "content_hash": chunk.content_hash,
+        }
+
+    def test_chunk_is_slotted_and_requires_text(self):
+        """Test that chunks have no per-instance dict and need content or a source range."""
+        chunk = Chunk("hola")
+        assert not hasattr(chunk, "__dict__")
+        assert chunk.duration is None
+        with pytest.raises(AttributeError):
+            chunk.extra = 1
+        with pytest.raises(ValueError):
+            Chunk(source="hola")
@@ -0,0 +1,92 @@
+import pytest
+
+from src.models.transcript import TranscriptSegments
+from src.pipeline.chunker import Chunker, estimate_tokens
+
+
+def make_segments(texts, duration=2.0):
+    """Build evenly spaced transcript lines."""
+    return TranscriptSegments.from_lines(
+        texts, [i * duration for i in range(len(texts))], [duration] * len(texts),
+        video_id="dQw4w9WgXcQ", language_code="en"
+    )
+
+
+class TestChunker:
+    """Test suite for Chunker."""
+
+    def test_chunk_splits_text_every_400_characters(self):
+        """Test fixed-size chunking of flat text."""
+        chunks = Chunker().chunk("a" * 1000)
+        assert [len(c.content) for c in chunks] == [400, 400, 200]
+        assert chunks[0].start_time is None and chunks[0].duration is None
+
+    def test_estimate_tokens_weights_dense_scripts(self):
+        """Test that CJK characters count as a token each and Latin text as four characters per token."""
+        assert estimate_tokens("abcdefgh") == 2
+        assert estimate_tokens("今日は") == 3
+        assert estimate_tokens("") == 0
+
+    def test_chunk_sentences_packs_whole_sentences(self):
+        """Test that sentences are never cut while they fit in the budget."""
+        text = "Hello there. How are you? I am fine! This is a test. Another sentence here."
+        chunks = Chunker().chunk_sentences(text, max_tokens=8)
+
+        assert [c.content for c in chunks] == [
+            "Hello there. How are you?", "I am fine! This is a test.", "Another sentence here."
+        ]
+        assert all(estimate_tokens(c.content) <= 8 for c in chunks)
+
+    def test_chunk_sentences_overlap_repeats_trailing_sentence(self):
+        """Test that overlap carries the last sentence into the next chunk."""
+        text = "One two three. Four five six. Seven eight nine. Ten eleven twelve."
+        chunks = Chunker().chunk_sentences(text, max_tokens=10, overlap_tokens=5)
+
+        assert [c.content for c in chunks] == [
+            "One two three. Four five six.", "Four five six. Seven eight nine.",
+            "Seven eight nine. Ten eleven twelve."
+        ]
+
+    def test_chunk_sentences_splits_unpunctuated_text_between_words(self):
+        """Test the fallback for auto-generated captions without punctuation, including CJK."""
+        words = " ".join(f"word{i}" for i in range(40))
+        chunks = Chunker().chunk_sentences(words, max_tokens=10)
+        assert " ".join(c.content for c in chunks) == words
+        assert all(estimate_tokens(c.content) <= 10 for c in chunks)
+
+        cjk = "今日はいい天気ですね明日は雨が降るでしょう"
+        chunks = Chunker().chunk_sentences(cjk, max_tokens=5)
+        assert "".join(c.content for c in chunks) == cjk
+        assert [len(c.content) for c in chunks[:-1]] == [5] * (len(chunks) - 1)
+
+    def test_chunk_sentences_maps_segments_to_time_ranges(self):
+        """Test that chunks of timed segments carry the range of lines they overlap."""
+        segments = make_segments(["so today we are", "going to cook pasta.", "It is easy.", "Let us start."])
+        chunks = Chunker().chunk_sentences(segments, max_tokens=10)
+
+        assert [c.content for c in chunks] == ["so today we are\ngoing to cook pasta.", "It is easy.\nLet us start."]
+        assert [(c.segment_start, c.segment_end) for c in chunks] == [(0, 2), (2, 4)]
+        assert [(c.start_time, c.end_time) for c in chunks] == [(0.0, 4.0), (4.0, 8.0)]
+
+        lazy = Chunker().chunk_sentences(segments, max_tokens=10, lazy=True)
+        assert lazy == chunks
+        assert all(segments.to_text()[c.char_start:c.char_end] == c.content for c in lazy)
+
+    def test_chunk_sentences_rejects_bad_budgets(self):
+        """Test validation of max_tokens and overlap_tokens."""
+        with pytest.raises(ValueError):
+            Chunker().chunk_sentences("text", max_tokens=0)
+        with pytest.raises(ValueError):
+            Chunker().chunk_sentences("text", max_tokens=10, overlap_tokens=10)
+        assert Chunker().chunk_sentences("") == []
+
+    def test_iter_chunks_is_lazy_and_matches_chunk_sentences(self):
+        """Test that iter_chunks yields the same chunks one at a time and validates eagerly."""
+        text = " ".join(f"Sentence number {i} is here." for i in range(100))
+        chunks = Chunker().iter_chunks(text, max_tokens=20)
+
+        first = next(chunks)
+        assert first.content.startswith("Sentence number 0")
+        assert [first] + list(chunks) == Chunker().chunk_sentences(text, max_tokens=20)
+        with pytest.raises(ValueError):
+            Chunker().iter_chunks(text, max_tokens=0)
@@ -0,0 +1,63 @@
+import pytest
+
+from src.models.chunk import Chunk
+from src.pipeline.dedup import ChunkDeduplicator, normalize_text, simhash
+
+SENTENCE = ("today we are going to learn how to cook a simple pasta with fresh tomatoes garlic "
+            "olive oil and basil it only takes twenty minutes and you need very few ingredients "
+            "so it is perfect for a quick dinner after work when you do not have much time")
+
+
+class TestChunkDeduplicator:
+    """Test suite for exact and near-duplicate chunk detection."""
+
+    def test_normalize_text_ignores_case_punctuation_and_spacing(self):
+        """Test that formatting differences normalize away."""
+        assert normalize_text("  [Music]  Hello,\nWORLD! ") == "music hello world"
+
+    def test_simhash_is_close_for_small_edits_and_far_for_unrelated_text(self):
+        """Test that fingerprint distance tracks text similarity."""
+        edited = SENTENCE.replace("twenty", "thirty")
+        unrelated = ("the football match last night ended in a draw after both teams scored twice "
+                     "in the second half and the fans were singing in the stadium until midnight")
+        distance = lambda a, b: bin(simhash(a) ^ simhash(b)).count("1")
+
+        assert distance(SENTENCE, SENTENCE) == 0
+        assert distance(SENTENCE, edited) <= 8
+        assert distance(SENTENCE, unrelated) > 8
+
+    def test_filter_drops_exact_and_near_duplicates(self):
+        """Test that only first occurrences are kept and savings are reported."""
+        chunks = [
+            Chunk(content="[Music]"),
+            Chunk(content=SENTENCE),
+            Chunk(content="[MUSIC]"),
+            Chunk(content=SENTENCE.replace("twenty", "thirty")),
+            Chunk(content="the end thanks for watching"),
+        ]
+        deduplicator = ChunkDeduplicator()
+
+        kept = list(deduplicator.filter(iter(chunks)))
+
+        assert [c.content for c in kept] == ["[Music]", SENTENCE, "the end thanks for watching"]
+        assert deduplicator.stats() == {
+            "seen": 5, "kept": 3, "exact_duplicates": 1, "near_duplicates": 1, "embeddings_saved": 2
+        }
+
+    def test_zero_distance_only_drops_exact_duplicates(self):
+        """Test that near-duplicate detection can be disabled."""
+        deduplicator = ChunkDeduplicator(max_distance=0)
+        assert not deduplicator.is_duplicate(SENTENCE)
+        assert not deduplicator.is_duplicate(SENTENCE.replace("twenty", "thirty"))
+        assert deduplicator.is_duplicate(SENTENCE.upper())
+
+    @pytest.mark.parametrize("max_distance", [3, 8, 20, 31])
+    def test_bands_cover_every_bit(self, max_distance):
+        """Test that max_distance + 1 disjoint bands cover the fingerprint, so no near-duplicate is missed."""
+        bands = ChunkDeduplicator(max_distance=max_distance)._bands
+        assert len(bands) == max_distance + 1
+        covered = 0
+        for shift, mask in bands:
+            assert covered & (mask << shift) == 0
+            covered |= mask << shift
+        assert covered == (1 << 64) - 1
@@ -0,0 +1,74 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.pipeline.embedding_cache import CachedEmbeddings, EmbeddingCache, embedding_key
+
+
+class CountingEmbeddings:
+    """Deterministic fake embedding model that records every text it embeds."""
+
+    def __init__(self):
+        self.calls = []
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text)), float(sum(map(ord, text)) % 97), 0.5] for text in texts]
+
+    def embed_query(self, text):
+        self.calls.append([text])
+        return [1.0, 2.0, 3.0]
+
+
+class TestEmbeddingCache:
+    """Test suite for the persistent embedding store and the caching wrapper."""
+
+    def test_only_misses_reach_the_model_in_batches(self, tmp_path):
+        """Test that repeated and already-cached texts are not embedded again."""
+        model = CountingEmbeddings()
+        embeddings = CachedEmbeddings(model, "test-model", cache=EmbeddingCache(str(tmp_path / "e.db")),
+                                      batch_size=2)
+
+        first = embeddings.embed_documents(["hola", "adiós", "hola", "gracias"])
+        second = embeddings.embed_documents(["gracias", "buenas", "hola"])
+
+        assert model.calls == [["hola", "adiós"], ["gracias"], ["buenas"]]
+        assert first[0] == first[2] == second[2]
+        assert first[3] == second[0]
+        assert embeddings.cache.stats()["entries"] == 4
+
+    def test_vectors_persist_across_instances(self, tmp_path):
+        """Test that a new store on the same file serves vectors from disk."""
+        path = str(tmp_path / "e.db")
+        expected = CachedEmbeddings(CountingEmbeddings(), "test-model", cache=EmbeddingCache(path)) \
+            .embed_documents(["hola"])
+
+        model = CountingEmbeddings()
+        cache = EmbeddingCache(path)
+        assert CachedEmbeddings(model, "test-model", cache=cache).embed_documents(["hola"]) == expected
+        assert model.calls == []
+        assert cache.stats()["disk_hits"] == 1
+
+    def test_keys_separate_models_and_queries(self, tmp_path):
+        """Test that models and query/document embeddings never share cache entries."""
+        assert len({embedding_key("a", "hola"), embedding_key("b", "hola"),
+                    embedding_key("a", "hola", kind="query")}) == 3
+
+        model = CountingEmbeddings()
+        embeddings = CachedEmbeddings(model, "test-model", cache=EmbeddingCache(":memory:"))
+        embeddings.embed_documents(["hola"])
+        assert embeddings.embed_query("hola") == [1.0, 2.0, 3.0]
+        assert asyncio.run(embeddings.aembed_query("hola")) == [1.0, 2.0, 3.0]
+        assert model.calls == [["hola"], ["hola"]]
+
+    def test_vectors_are_stored_as_float32(self, tmp_path):
+        """Test the on-disk representation and validation."""
+        cache = EmbeddingCache(":memory:")
+        cache.put_many({"k": [0.1, 0.2]})
+        vector = cache.get_many(["k", "missing"])["k"]
+        assert vector.dtype == np.float32
+        np.testing.assert_allclose(vector, [0.1, 0.2], rtol=1e-6)
+        assert cache.stats()["misses"] == 1
+        with pytest.raises(ValueError):
+            CachedEmbeddings(CountingEmbeddings(), "m", cache=cache, batch_size=0)
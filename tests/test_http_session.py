@@ -0,0 +1,91 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+
+import pytest
+from urllib3.util.retry import Retry
+
+from src.pipeline.http_session import build_session, JitteredRetry
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Keep-alive handler that rate-limits the first request to /flaky."""
+
+    protocol_version = "HTTP/1.1"
+    hits = []
+
+    def do_GET(self):
+        FlakyHandler.hits.append(self.path)
+        if self.path == "/flaky" and FlakyHandler.hits.count("/flaky") == 1:
+            self._reply(429, b"slow down", {"Retry-After": "0"})
+        else:
+            self._reply(200, b"ok")
+
+    def _reply(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Run a local HTTP server for the duration of a test."""
+    FlakyHandler.hits = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestHttpSession:
+    """Test suite for the shared session factory."""
+
+    def test_retries_rate_limited_requests(self, server):
+        """Test that a 429 is retried transparently."""
+        session = build_session(max_retries=2, backoff_factor=0)
+
+        response = session.get(f"{server}/flaky")
+
+        assert response.status_code == 200
+        assert FlakyHandler.hits == ["/flaky", "/flaky"]
+
+    def test_reports_connection_reuse(self, server):
+        """Test per-host keep-alive statistics."""
+        session = build_session()
+        adapter = session.get_adapter(server)
+
+        for _ in range(3):
+            session.get(f"{server}/ok").raise_for_status()
+
+        stats = adapter.connection_stats()["127.0.0.1"]
+        assert stats["requests"] == 3
+        assert stats["connections"] == 1
+        assert stats["reused"] == 2
+
+    def test_backoff_is_jittered(self):
+        """Test that backoff sleeps fall within [backoff / 2, backoff]."""
+        with patch.object(Retry, "get_backoff_time", return_value=4.0):
+            delays = {JitteredRetry(total=3).get_backoff_time() for _ in range(20)}
+
+        assert all(2.0 <= delay <= 4.0 for delay in delays)
+        assert len(delays) > 1
+
+    def test_retries_wait_on_rate_limiter(self, server):
+        """Test that a retried 429 takes a rate-limit token for every attempt."""
+        limiter = Mock()
+        session = build_session(max_retries=2, backoff_factor=0, rate_limiter=limiter)
+
+        response = session.get(f"{server}/flaky")
+
+        assert response.status_code == 200
+        assert FlakyHandler.hits == ["/flaky", "/flaky"]
+        assert limiter.acquire.call_count == 2
+        assert {call.args for call in limiter.acquire.call_args_list} == {(f"{server}/flaky", None)}
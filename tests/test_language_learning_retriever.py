@@ -0,0 +1,90 @@
+import zlib
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+pytest.importorskip("langchain_openai")
+
+from src.pipeline.language_learning_retriever import LanguageLearningRetriever
+from src.pipeline.namespace_index import namespace_for
+
+
+class HashedEmbeddings:
+    """Fake embedding model: a bag of hashed words, counting the texts it embeds."""
+
+    DIM = 64
+
+    def __init__(self):
+        self.embedded_documents = 0
+
+    def _embed(self, text):
+        vector = np.zeros(self.DIM)
+        for word in text.lower().split():
+            vector[zlib.crc32(word.encode()) % self.DIM] += 1.0
+        return vector.tolist()
+
+    def embed_documents(self, texts):
+        self.embedded_documents += len(texts)
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._embed(text)
+
+
+@pytest.fixture
+def make_retriever(monkeypatch):
+    """Build retrievers with fake embeddings and an LLM that echoes a fixed rewrite."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+    def make(**kwargs):
+        retriever = LanguageLearningRetriever(cache_embeddings=False, **kwargs)
+        retriever.embeddings = HashedEmbeddings()
+        retriever.llm = Mock()
+        retriever.llm.invoke.return_value = Mock(content="rewritten")
+        return retriever
+
+    return make
+
+
+class TestLanguageLearningRetriever:
+    """Test suite for the retriever's per-video namespaces and their snapshots."""
+
+    def test_namespaces_are_isolated_and_dropped_by_video(self, make_retriever):
+        """Test that searches stay in their namespace and dropping a video keeps the others."""
+        retriever = make_retriever(use_snapshots=False)
+        content = {
+            namespace_for("abc", "en"): ["the weather is sunny today", "rain is expected tomorrow"],
+            namespace_for("abc", "es"): ["hace sol hoy", "mañana va a llover"],
+            # Shares the "abc" prefix without being the same video
+            namespace_for("abcd", "en"): ["football scores from the weekend", "the weather ruined the match"],
+        }
+        for namespace, texts in content.items():
+            retriever.add_content(texts, metadatas=[{"namespace": namespace}] * len(texts), namespace=namespace)
+
+        results = retriever.search_and_rewrite("English", "weather", "B1", top_k=5, namespace="abcd:en")
+        assert {r["original"] for r in results} == set(content["abcd:en"])
+        assert {r["metadata"]["namespace"] for r in results} == {"abcd:en"}
+
+        assert retriever.drop("abc")
+
+        assert not retriever.has_content("abc:en") and not retriever.has_content("abc:es")
+        assert retriever.has_content("abcd:en")
+        results = retriever.search_and_rewrite("English", "weather", "B1", top_k=5, namespace="abcd:en")
+        assert {r["original"] for r in results} == set(content["abcd:en"])
+        with pytest.raises(ValueError):
+            retriever.search_and_rewrite("Spanish", "sol", "B1", namespace="abc:es")
+
+    def test_new_retriever_loads_snapshot_instead_of_embedding(self, make_retriever, tmp_path):
+        """Test that a namespace saved by one retriever is searched by another without re-embedding."""
+        texts = ["the weather is sunny today", "rain is expected tomorrow"]
+        first = make_retriever(snapshot_dir=str(tmp_path))
+        first.add_content(texts, metadatas=[{"start_time": 0.0}, {"start_time": 4.0}], namespace="abc:en")
+        assert first.save_snapshot("abc:en") is not None
+
+        second = make_retriever(snapshot_dir=str(tmp_path))
+
+        assert second.has_content("abc:en")
+        results = second.search_and_rewrite("English", "weather", "B1", top_k=2, namespace="abc:en")
+        assert second.embeddings.embedded_documents == 0
+        assert {(r["original"], r["metadata"]["start_time"]) for r in results} == {(texts[0], 0.0), (texts[1], 4.0)}
@@ -0,0 +1,65 @@
+import pytest
+
+from src.pipeline.namespace_index import NamespaceIndexes, namespace_for
+
+
+class TestNamespaceIndexes:
+    """Test suite for per-namespace indexes with LRU and size-budget eviction."""
+
+    def test_namespaces_are_independent(self):
+        """Test that each namespace gets its own store."""
+        indexes = NamespaceIndexes(list)
+        indexes.get_or_create(namespace_for("video1", "es")).append("hola")
+        indexes.get_or_create(namespace_for("video2", "es")).append("adiós")
+
+        assert indexes.get("video1:es") == ["hola"]
+        assert indexes.get("video2:es") == ["adiós"]
+        assert indexes.get("video3:es") is None
+        assert "video1:es" in indexes
+
+    def test_least_recently_used_namespace_is_evicted(self):
+        """Test eviction once there are more than max_namespaces."""
+        indexes = NamespaceIndexes(list, max_namespaces=2)
+        indexes.get_or_create("a")
+        indexes.get_or_create("b")
+        indexes.get("a")
+        indexes.get_or_create("c")
+
+        assert indexes.namespaces() == ["a", "c"]
+        assert indexes.stats()["evictions"] == 1
+
+    def test_entry_budget_evicts_other_namespaces_only(self):
+        """Test that growing past max_entries evicts older namespaces but never the one being filled."""
+        indexes = NamespaceIndexes(list, max_entries=100)
+        indexes.get_or_create("old")
+        indexes.record("old", 60)
+        indexes.get_or_create("new")
+        indexes.record("new", 50)
+
+        assert indexes.namespaces() == ["new"]
+        indexes.record("new", 500)
+        assert indexes.stats()["entries_by_namespace"] == {"new": 550}
+
+    def test_drop_frees_entries(self):
+        """Test explicit removal of a namespace."""
+        indexes = NamespaceIndexes(list)
+        indexes.get_or_create("a")
+        indexes.record("a", 10)
+
+        assert indexes.drop("a")
+        assert not indexes.drop("a")
+        assert indexes.stats()["entries"] == 0
+        with pytest.raises(ValueError):
+            NamespaceIndexes(list, max_namespaces=0)
+
+    def test_put_replaces_store_and_counts_entries(self):
+        """Test installing a filled store, e.g. one loaded from a snapshot."""
+        indexes = NamespaceIndexes(list, max_entries=100)
+        indexes.get_or_create("old")
+        indexes.record("old", 60)
+
+        indexes.put("new", ["loaded"], 30)
+        indexes.put("new", ["reloaded"], 50)
+
+        assert indexes.get("new") == ["reloaded"]
+        assert indexes.stats()["entries_by_namespace"] == {"new": 50}
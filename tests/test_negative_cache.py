@@ -0,0 +1,43 @@
+import time
+
+from youtube_transcript_api import RequestBlocked, TranscriptsDisabled, VideoUnavailable
+
+from src.pipeline.negative_cache import (
+    LANGUAGE_UNAVAILABLE, TRANSCRIPTS_DISABLED, VIDEO_UNAVAILABLE, NegativeCache, classify_error
+)
+
+
+class TestNegativeCache:
+    """Test suite for the negative cache of unavailable videos and languages."""
+
+    def test_classifies_only_permanent_errors(self):
+        """Test that transient failures such as IP blocks are never cached."""
+        assert classify_error(TranscriptsDisabled("dQw4w9WgXcQ")) == TRANSCRIPTS_DISABLED
+        assert classify_error(VideoUnavailable("dQw4w9WgXcQ")) == VIDEO_UNAVAILABLE
+        assert classify_error(RequestBlocked("dQw4w9WgXcQ")) is None
+        assert classify_error(ConnectionError("reset")) is None
+
+    def test_language_entries_keep_available_languages(self):
+        """Test language-level entries and that a video-level entry covers every language."""
+        cache = NegativeCache()
+        available = [{"language": "English", "language_code": "en"}]
+        cache.record_language("aaaaaaaaaaa", "es", available)
+        cache.record_video("bbbbbbbbbbb", TRANSCRIPTS_DISABLED, "disabled")
+
+        entry = cache.check_language("aaaaaaaaaaa", "es")
+
+        assert entry.reason == LANGUAGE_UNAVAILABLE
+        assert entry.available_languages == available
+        assert cache.check_language("aaaaaaaaaaa", "en") is None
+        assert cache.check_video("aaaaaaaaaaa") is None
+        assert cache.check_language("bbbbbbbbbbb", "fr").reason == TRANSCRIPTS_DISABLED
+        assert cache.stats()["hits_by_reason"] == {LANGUAGE_UNAVAILABLE: 1, TRANSCRIPTS_DISABLED: 1}
+        assert cache.stats()["misses"] == 2
+
+    def test_entries_expire(self):
+        """Test that failures are forgotten after the TTL."""
+        cache = NegativeCache(ttl_seconds=0.01)
+        cache.record_video("aaaaaaaaaaa", TRANSCRIPTS_DISABLED, "disabled")
+        time.sleep(0.02)
+
+        assert cache.check_video("aaaaaaaaaaa") is None
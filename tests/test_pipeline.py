@@ -0,0 +1,104 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+# The pipeline imports the OpenAI-backed retriever
+pytest.importorskip("langchain_openai")
+
+from src.models.chunk import Chunk
+from src.models.transcript import TranscriptSegments
+from src.pipeline.pipeline import Pipeline, PipelineError, RetrievalError
+from src.pipeline.transcript_cache import TranscriptCache
+
+
+class FakeRetriever:
+    """Retriever that records what the pipeline adds, optionally blocking or failing."""
+
+    def __init__(self, fail_on_call=None):
+        self.batches = []
+        self.dropped = []
+        self.saved = []
+        self.fail_on_call = fail_on_call
+        self.release = threading.Event()
+        self.release.set()
+
+    def add_content(self, texts, metadatas=None, namespace="default"):
+        self.release.wait()
+        self.batches.append((namespace, len(texts)))
+        if len(self.batches) == self.fail_on_call:
+            raise RuntimeError("embedding API unavailable")
+
+    def drop(self, namespace):
+        self.dropped.append(namespace)
+        return True
+
+    def save_snapshot(self, namespace):
+        self.saved.append(namespace)
+
+
+def make_chunks(n, produced=None):
+    """Generate n chunks, counting them in produced as they are pulled."""
+    for i in range(n):
+        if produced is not None:
+            produced.append(i)
+        yield Chunk(content=f"sentence {i}", char_start=i, char_end=i + 1)
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    """Pipeline wired to a fake retriever, without deduplication."""
+    pipeline = Pipeline(transcript_cache=TranscriptCache(cache_dir=str(tmp_path)), deduplicate=False)
+    pipeline.retriever = FakeRetriever()
+    return pipeline
+
+
+class TestPipelineIndexing:
+    """Test suite for streaming chunks into the retriever."""
+
+    def test_streams_chunks_in_embed_batches(self, pipeline):
+        """Test that chunks are added in EMBED_BATCH_SIZE batches, with the remainder last."""
+        size = Pipeline.EMBED_BATCH_SIZE
+
+        added = pipeline._index_chunks(make_chunks(3 * size + 5), "vid:en")
+
+        assert added == 3 * size + 5
+        assert pipeline.retriever.batches == [("vid:en", size)] * 3 + [("vid:en", 5)]
+
+    def test_chunking_waits_for_slow_embedding(self, pipeline):
+        """Test that at most one batch waits behind the one being embedded."""
+        size = Pipeline.EMBED_BATCH_SIZE
+        produced = []
+        pipeline.retriever.release.clear()
+        worker = threading.Thread(target=pipeline._index_chunks, args=(make_chunks(10 * size, produced), "vid:en"),
+                                  daemon=True)
+        worker.start()
+
+        try:
+            time.sleep(0.3)
+            # One batch embedding, one queued, and the next one built but not submitted
+            assert len(produced) == 3 * size
+        finally:
+            pipeline.retriever.release.set()
+            worker.join(timeout=5)
+
+        assert len(produced) == 10 * size
+        assert pipeline.retriever.batches == [("vid:en", size)] * 10
+
+    def test_failure_mid_stream_drops_partial_namespace(self, pipeline):
+        """Test that a failed batch drops what was indexed and surfaces as a PipelineError."""
+        pipeline.retriever = FakeRetriever(fail_on_call=2)
+        pipeline.yt_fetch = Mock()
+        pipeline.yt_fetch.transcribe_segments_from_list.return_value = TranscriptSegments.from_lines(
+            ["Hola."], [0.0], [1.0], video_id="vid", language_code="es"
+        )
+        pipeline.chunker = Mock()
+        pipeline.chunker.iter_chunks.return_value = make_chunks(5 * Pipeline.EMBED_BATCH_SIZE)
+
+        with pytest.raises(RetrievalError) as excinfo:
+            pipeline._index_transcript("https://www.youtube.com/watch?v=vid", Mock(), "es", "vid:es")
+
+        assert isinstance(excinfo.value, PipelineError)
+        assert pipeline.retriever.dropped == ["vid:es"]
+        assert pipeline.retriever.saved == []
@@ -0,0 +1,135 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.pipeline.http_session import RETRY_STATUS_CODES, configure_session
+from src.pipeline.proxy_pool import BLOCKED_STATUS_CODES, ProxyPool, ProxyPoolSession
+
+
+def make_proxy_handler(status):
+    """Build a handler that acts as a forward proxy answering every request with status."""
+
+    class ProxyHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        hits = []
+
+        def do_GET(self):
+            # A forward proxy receives the absolute URL as the request path
+            ProxyHandler.hits.append(self.path)
+            body = b"ok"
+            self.send_response(status)
+            if status == 429:
+                self.send_header("Retry-After", "1")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return ProxyHandler
+
+
+@pytest.fixture
+def proxies():
+    """Run one healthy and one rate-limited local proxy."""
+    servers = []
+    for status in (200, 429):
+        handler = make_proxy_handler(status)
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        servers.append((f"http://127.0.0.1:{httpd.server_address[1]}", handler, httpd))
+    yield [(url, handler) for url, handler, _ in servers]
+    for _, _, httpd in servers:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+class TestProxyPool:
+    """Test suite for proxy health scoring and rotation."""
+
+    def test_prefers_faster_proxy(self):
+        """Test that power-of-two choice favours the proxy with lower latency."""
+        pool = ProxyPool(["http://fast:1", "http://slow:1"])
+        pool.release(pool.acquire("http://fast:1"), 0.05, success=True)
+        pool.release(pool.acquire("http://slow:1"), 0.5, success=True)
+
+        picks = [pool.choose() for _ in range(20)]
+
+        assert picks == ["http://fast:1"] * 20
+
+    def test_ejects_after_consecutive_failures(self):
+        """Test that a failing proxy sits out its cooldown and then returns."""
+        pool = ProxyPool(["http://a:1", "http://b:1"], eject_after_failures=2, cooldown_seconds=0.05)
+        for _ in range(2):
+            pool.release(pool.acquire("http://a:1"), 0.1, success=False)
+
+        assert {pool.choose() for _ in range(20)} == {"http://b:1"}
+        assert pool.stats()[-1]["proxy"] == "http://a:1"
+        assert pool.stats()[-1]["healthy"] is False
+
+        time.sleep(0.06)
+        assert all(stat["healthy"] for stat in pool.stats())
+
+    def test_all_ejected_uses_soonest_available(self):
+        """Test that the pool keeps serving when every proxy is ejected."""
+        pool = ProxyPool(["http://a:1", "http://b:1"], cooldown_seconds=10)
+        pool.report_blocked("http://a:1")
+        time.sleep(0.01)
+        pool.report_blocked("http://b:1")
+
+        assert pool.choose() == "http://a:1"
+
+    def test_rejects_empty_pool(self):
+        """Test constructor validation."""
+        with pytest.raises(ValueError):
+            ProxyPool([])
+
+
+class TestProxyPoolSession:
+    """Test suite for the proxy-rotating session."""
+
+    def test_routes_requests_and_ejects_throttled_proxy(self, proxies):
+        """Test that 429s from one proxy move traffic to the other."""
+        (good_url, good_handler), (bad_url, bad_handler) = proxies
+        pool = ProxyPool([good_url, bad_url], eject_after_failures=1, cooldown_seconds=60)
+        session = ProxyPoolSession(pool)
+
+        statuses = [session.get("http://example.invalid/watch").status_code for _ in range(6)]
+
+        assert len(bad_handler.hits) == 1
+        assert statuses.count(200) == len(good_handler.hits) == 5
+        assert good_handler.hits[0] == "http://example.invalid/watch"
+
+    def test_lease_pins_one_proxy(self, proxies):
+        """Test that requests inside a lease all use the same proxy."""
+        (good_url, good_handler), (bad_url, bad_handler) = proxies
+        pool = ProxyPool([good_url, bad_url])
+        session = ProxyPoolSession(pool)
+
+        with session.lease() as proxy_url:
+            for _ in range(3):
+                session.get("http://example.invalid/watch")
+
+        used = good_handler if proxy_url == good_url else bad_handler
+        assert len(used.hits) == 3
+        assert len(good_handler.hits) + len(bad_handler.hits) == 3
+
+    def test_throttled_proxy_is_not_retried_by_adapter(self, proxies):
+        """Test that a 429 with Retry-After reaches the pool instead of being retried through the same proxy."""
+        (good_url, good_handler), (bad_url, bad_handler) = proxies
+        pool = ProxyPool([good_url, bad_url], eject_after_failures=1, cooldown_seconds=60)
+        session = ProxyPoolSession(pool)
+        # Mounted as YTFetch mounts pool sessions
+        configure_session(session, status_forcelist=RETRY_STATUS_CODES - BLOCKED_STATUS_CODES)
+        # Unmeasured proxies are tried first, so the first request goes to the throttled one
+        pool.release(pool.acquire(good_url), 0.01, success=True)
+
+        started = time.monotonic()
+        statuses = [session.get("http://example.invalid/watch").status_code for _ in range(2)]
+
+        assert statuses == [429, 200]
+        assert len(bad_handler.hits) == 1 and len(good_handler.hits) == 1
+        assert time.monotonic() - started < 1.0
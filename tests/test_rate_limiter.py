@@ -0,0 +1,61 @@
+import time
+
+import pytest
+
+from src.pipeline.rate_limiter import FileTokenBucket, RateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    """Test suite for the token bucket primitives."""
+
+    def test_paces_requests_after_burst(self):
+        """Test that requests beyond the burst wait for refill."""
+        bucket = TokenBucket(rate=100, burst=2)
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.01, abs=0.005)
+        assert waits[3] == pytest.approx(0.02, abs=0.005)
+
+    def test_file_bucket_is_shared_between_handles(self, tmp_path):
+        """Test that two handles on one state file draw from the same tokens."""
+        path = str(tmp_path / "youtube.bucket")
+        first = FileTokenBucket(path, rate=1, burst=2)
+        second = FileTokenBucket(path, rate=1, burst=2)
+
+        try:
+            assert first.reserve() == 0.0
+            assert second.reserve() == 0.0
+            assert first.reserve() > 0.5
+        finally:
+            first.close()
+            second.close()
+
+    def test_rejects_invalid_settings(self):
+        """Test constructor validation."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0, burst=1)
+        with pytest.raises(ValueError):
+            RateLimiter(rate=1, burst=0)
+
+
+class TestRateLimiter:
+    """Test suite for the per-host, per-proxy limiter."""
+
+    def test_keys_by_host_and_proxy_and_reports_wait(self):
+        """Test that each proxy gets its own bucket and queueing delay is recorded."""
+        limiter = RateLimiter(rate=50, burst=1)
+
+        start = time.monotonic()
+        limiter.acquire("https://www.youtube.com/watch?v=a")
+        limiter.acquire("https://www.youtube.com/watch?v=b", proxy="http://user:pw@proxy1:8080")
+        limiter.acquire("https://www.youtube.com/watch?v=c")
+        elapsed = time.monotonic() - start
+
+        stats = limiter.stats()
+        assert set(stats) == {"www.youtube.com", "www.youtube.com via proxy1:8080"}
+        assert stats["www.youtube.com"]["requests"] == 2
+        assert stats["www.youtube.com"]["delayed"] == 1
+        assert stats["www.youtube.com via proxy1:8080"]["total_wait"] == 0.0
+        assert elapsed >= stats["www.youtube.com"]["max_wait"] > 0
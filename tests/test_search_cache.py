@@ -0,0 +1,64 @@
+import threading
+import time
+
+from src.pipeline.search_cache import SearchCache, normalize_query
+
+RESULTS = [{"title": "Tortilla", "url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ", "video_id": "dQw4w9WgXcQ"}]
+
+
+class TestSearchCache:
+    """Test suite for the stale-while-revalidate search cache."""
+
+    def test_normalized_queries_share_an_entry(self):
+        """Test that case and whitespace differences hit the same entry."""
+        cache = SearchCache()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return RESULTS
+
+        first = cache.get_or_fetch("Spanish  Cooking", 5, fetch)
+        second = cache.get_or_fetch(" spanish cooking", 5, fetch)
+        cache.get_or_fetch("spanish cooking", 3, fetch)
+
+        assert first == second == RESULTS
+        assert len(calls) == 2
+        assert normalize_query("  French\tNEWS ") == "french news"
+
+    def test_returned_results_are_copies(self):
+        """Test that callers can't mutate cached results."""
+        cache = SearchCache()
+        cache.get_or_fetch("q", 5, lambda: RESULTS)[0]["title"] = "changed"
+
+        assert cache.get_or_fetch("q", 5, lambda: [])[0]["title"] == "Tortilla"
+
+    def test_stale_results_are_served_and_refreshed(self):
+        """Test that a stale entry is returned at once and refreshed in the background."""
+        cache = SearchCache(ttl_seconds=0.01, stale_seconds=60)
+        cache.get_or_fetch("q", 5, lambda: RESULTS)
+        time.sleep(0.02)
+        refreshed = threading.Event()
+        fresh = [dict(RESULTS[0], title="Tortilla 2")]
+
+        def slow_fetch():
+            refreshed.wait(1)
+            return fresh
+
+        stale = cache.get_or_fetch("q", 5, slow_fetch)
+        refreshed.set()
+        for _ in range(100):
+            if cache.stats()["refreshes"]:
+                break
+            time.sleep(0.01)
+
+        assert stale == RESULTS
+        assert cache.stats()["stale_hits"] == 1
+        assert cache.get_or_fetch("q", 5, lambda: []) == fresh
+
+    def test_empty_results_are_not_cached(self):
+        """Test that an empty page is fetched again next time."""
+        cache = SearchCache()
+        cache.get_or_fetch("q", 5, lambda: [])
+
+        assert cache.get_or_fetch("q", 5, lambda: RESULTS) == RESULTS
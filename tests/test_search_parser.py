@@ -0,0 +1,93 @@
+import json
+
+from src.pipeline.search_parser import (
+    parse_search_results, find_initial_data_offset, IncrementalSearchParser, UNKNOWN_TITLE
+)
+
+
+def make_page(video_ids, assignment="var ytInitialData = "):
+    """Build a search page embedding one videoRenderer per ID."""
+    data = {
+        "contents": {"twoColumnSearchResultsRenderer": {"primaryContents": {"sectionListRenderer": {"contents": [
+            {"itemSectionRenderer": {"contents": [
+                {"videoRenderer": {"videoId": video_id, "title": {"runs": [{"text": f"Title {video_id}"}]}}}
+                for video_id in video_ids
+            ]}}
+        ]}}}}
+    }
+    return f"<html><script>{assignment}{json.dumps(data)};</script></html>"
+
+
+class TestSearchParser:
+    """Test suite for the single-pass search results parser."""
+
+    def test_parses_initial_data(self):
+        """Test extraction from the ytInitialData blob."""
+        html = make_page(["aaaaaaaaaaa", "bbbbbbbbbbb"])
+
+        assert parse_search_results(html, 5) == [
+            ("aaaaaaaaaaa", "Title aaaaaaaaaaa"),
+            ("bbbbbbbbbbb", "Title bbbbbbbbbbb"),
+        ]
+
+    def test_window_assignment_and_max_results(self):
+        """Test the window["ytInitialData"] form and early stop at max_results."""
+        html = make_page(["aaaaaaaaaaa", "bbbbbbbbbbb", "ccccccccccc"], assignment='window["ytInitialData"] = ')
+
+        assert find_initial_data_offset(html) > 0
+        assert [video_id for video_id, _ in parse_search_results(html, 2)] == ["aaaaaaaaaaa", "bbbbbbbbbbb"]
+
+    def test_truncated_initial_data_still_yields_complete_renderers(self):
+        """Test that a cut-off blob still returns the renderers decoded before the cut."""
+        html = make_page(["aaaaaaaaaaa", "bbbbbbbbbbb"])
+        truncated = html[:html.index("bbbbbbbbbbb") + 5]
+
+        assert parse_search_results(truncated, 5) == [("aaaaaaaaaaa", "Title aaaaaaaaaaa")]
+
+    def test_fallback_finds_ids_and_titles(self):
+        """Test the fallback scan on pages without ytInitialData."""
+        html = (
+            '<a href="/watch?v=aaaaaaaaaaa" class="x">First video</a>'
+            '{"title":{"runs":[{"text":"Second video"}]},"videoId":"bbbbbbbbbbb"}'
+            '<img src="https://i.ytimg.com/vi/ccccccccccc/hq.jpg">'
+        )
+
+        assert parse_search_results(html, 5) == [
+            ("aaaaaaaaaaa", "First video"),
+            ("bbbbbbbbbbb", "Second video"),
+            ("ccccccccccc", UNKNOWN_TITLE),
+        ]
+
+    def test_no_results(self):
+        """Test pages without any video IDs."""
+        assert parse_search_results("<html><body>No results found</body></html>", 5) == []
+        assert parse_search_results(make_page(["aaaaaaaaaaa"]), 0) == []
+
+    def test_incremental_parser_matches_one_shot(self):
+        """Test that feeding a page in tiny chunks gives the same results as parsing it whole."""
+        html = make_page(["aaaaaaaaaaa", "bbbbbbbbbbb", "ccccccccccc"])
+        parser = IncrementalSearchParser(max_results=5)
+
+        for i in range(0, len(html), 7):
+            parser.feed(html[i:i + 7])
+
+        assert parser.close() == parse_search_results(html, 5)
+
+    def test_incremental_parser_reports_done(self):
+        """Test that the parser signals completion as soon as max_results are decoded."""
+        html = make_page(["aaaaaaaaaaa", "bbbbbbbbbbb"])
+        cut = html.index("bbbbbbbbbbb")
+        parser = IncrementalSearchParser(max_results=1)
+
+        assert parser.feed(html[:cut]) is True
+        assert parser.close() == [("aaaaaaaaaaa", "Title aaaaaaaaaaa")]
+
+    def test_incremental_parser_falls_back_on_close(self):
+        """Test that pages without ytInitialData use the fallback scan once complete."""
+        html = '<a href="/watch?v=aaaaaaaaaaa">First video</a>'
+        parser = IncrementalSearchParser(max_results=5)
+
+        for i in range(0, len(html), 5):
+            parser.feed(html[i:i + 5])
+
+        assert parser.close() == [("aaaaaaaaaaa", "First video")]
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from src.models.transcript import TranscriptSegments
+
+RAW = [
+    {"text": "Hola", "start": 0.0, "duration": 2.0},
+    {"text": "¿qué tal?", "start": 2.0, "duration": 1.5},
+    {"text": "muy bien\ngracias", "start": 4.0, "duration": 2.0},
+    {"text": "adiós", "start": 10.0, "duration": 1.0},
+]
+
+
+@pytest.fixture
+def segments():
+    return TranscriptSegments.from_raw_data(RAW, video_id="dQw4w9WgXcQ", language="Spanish",
+                                            language_code="es", is_generated=False)
+
+
+class TestTranscriptSegments:
+    """Test suite for the columnar transcript representation."""
+
+    def test_round_trips_raw_data_and_text(self, segments):
+        """Test compatibility with to_raw_data and TextFormatter output."""
+        assert len(segments) == 4
+        assert segments.to_raw_data() == RAW
+        assert segments.to_text() == "\n".join(entry["text"] for entry in RAW)
+        assert segments[-1] == RAW[-1]
+        assert list(segments) == RAW
+
+    def test_time_slice_is_a_zero_copy_view(self, segments):
+        """Test time-range slicing returns overlapping lines without copying."""
+        view = segments.time_slice(3.0, 10.0)
+
+        assert view.texts() == ["¿qué tal?", "muy bien\ngracias"]
+        assert view.to_text() == "¿qué tal?\nmuy bien\ngracias"
+        assert np.shares_memory(view.starts, segments.starts)
+        assert segments.time_slice(3.5, 3.9).texts() == []
+        assert segments[1:3] == view
+
+    def test_index_at_finds_line_playing(self, segments):
+        """Test timestamp lookups."""
+        assert segments.index_at(-1.0) == -1
+        assert segments.index_at(2.0) == 1
+        assert segments.index_at(7.0) == 2
+        assert segments.index_at(99.0) == 3
+
+    def test_bytes_round_trip(self, segments):
+        """Test serialization, including of a view."""
+        assert TranscriptSegments.from_bytes(segments.to_bytes()) == segments
+
+        view = segments[2:]
+        restored = TranscriptSegments.from_bytes(view.to_bytes())
+        assert restored == view
+        assert restored.language_code == "es"
+
+    def test_rejects_corrupt_bytes(self, segments):
+        """Test that truncated data is rejected."""
+        with pytest.raises(ValueError):
+            TranscriptSegments.from_bytes(segments.to_bytes()[:-3])
+
+    def test_empty_transcript(self):
+        """Test a transcript with no lines."""
+        empty = TranscriptSegments.from_raw_data([])
+
+        assert len(empty) == 0
+        assert empty.to_text() == ""
+        assert TranscriptSegments.from_bytes(empty.to_bytes()) == empty
@@ -0,0 +1,114 @@
+import os
+import time
+
+import pytest
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+
+from src.pipeline.transcript_cache import TranscriptCache, TranslationCache
+
+
+def make_transcript(video_id="dQw4w9WgXcQ", language_code="en", is_generated=False, lines=3):
+    """Build a small FetchedTranscript for cache tests."""
+    return FetchedTranscript(
+        snippets=[
+            FetchedTranscriptSnippet(text=f"línea {i}", start=float(i), duration=1.5)
+            for i in range(lines)
+        ],
+        video_id=video_id,
+        language="English",
+        language_code=language_code,
+        is_generated=is_generated,
+    )
+
+
+class TestTranscriptCache:
+    """Test suite for the on-disk transcript cache."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that a stored transcript comes back unchanged."""
+        cache = TranscriptCache(cache_dir=str(tmp_path))
+        transcript = make_transcript()
+        cache.put(transcript)
+
+        cached = cache.get("dQw4w9WgXcQ", "en", False)
+
+        assert cached == transcript
+        assert cache.get("dQw4w9WgXcQ", "en", True) is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_lookup_prefers_manual_transcripts(self, tmp_path):
+        """Test that lookup follows find_transcript priority."""
+        cache = TranscriptCache(cache_dir=str(tmp_path))
+        cache.put(make_transcript(is_generated=True, lines=1))
+        cache.put(make_transcript(is_generated=False, lines=2))
+
+        cached = cache.lookup("dQw4w9WgXcQ", ["es", "en"])
+
+        assert cached.is_generated is False
+        assert len(cached) == 2
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that a new cache instance sees entries written by a previous one."""
+        TranscriptCache(cache_dir=str(tmp_path)).put(make_transcript())
+
+        cache = TranscriptCache(cache_dir=str(tmp_path))
+
+        assert cache.stats()["entries"] == 1
+        assert cache.get("dQw4w9WgXcQ", "en", False) is not None
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        """Test that entries older than the TTL are dropped."""
+        cache = TranscriptCache(cache_dir=str(tmp_path), ttl_seconds=0.01)
+        cache.put(make_transcript())
+        time.sleep(0.05)
+
+        assert cache.get("dQw4w9WgXcQ", "en", False) is None
+        assert cache.stats()["entries"] == 0
+        assert os.listdir(tmp_path) == []
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test size-bounded LRU eviction."""
+        cache = TranscriptCache(cache_dir=str(tmp_path))
+        cache.put(make_transcript(video_id="aaaaaaaaaaa"))
+        entry_size = cache.stats()["bytes"]
+        cache.max_bytes = entry_size * 2
+
+        cache.put(make_transcript(video_id="bbbbbbbbbbb"))
+        # Touch the first entry so the second becomes least recently used
+        assert cache.get("aaaaaaaaaaa", "en", False) is not None
+        cache.put(make_transcript(video_id="ccccccccccc"))
+
+        assert cache.stats()["evictions"] == 1
+        assert cache.get("bbbbbbbbbbb", "en", False) is None
+        assert cache.get("aaaaaaaaaaa", "en", False) is not None
+        assert cache.get("ccccccccccc", "en", False) is not None
+
+    def test_corrupt_file_is_a_miss(self, tmp_path):
+        """Test that unreadable cache files are treated as misses and removed."""
+        cache = TranscriptCache(cache_dir=str(tmp_path))
+        cache.put(make_transcript())
+        (path,) = tmp_path.iterdir()
+        path.write_bytes(b"garbage")
+
+        assert cache.get("dQw4w9WgXcQ", "en", False) is None
+        assert not path.exists()
+
+    def test_rejects_non_positive_size(self, tmp_path):
+        """Test constructor validation."""
+        with pytest.raises(ValueError):
+            TranscriptCache(cache_dir=str(tmp_path), max_bytes=0)
+
+
+class TestTranslationCache:
+    """Test suite for the on-disk translation cache."""
+
+    def test_keys_by_source_and_target_language(self, tmp_path):
+        """Test that translations are keyed by source and target and don't collide with captions."""
+        cache = TranslationCache(cache_dir=str(tmp_path))
+        translation = make_transcript(language_code="es", is_generated=True)
+        cache.put_translation("en", translation)
+
+        assert cache.get_translation("dQw4w9WgXcQ", "en", "es") == translation
+        assert cache.get_translation("dQw4w9WgXcQ", "fr", "es") is None
+        assert cache.get("dQw4w9WgXcQ", "es", True) is None
@@ -0,0 +1,37 @@
+import time
+
+import pytest
+
+from src.pipeline.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    """Test suite for the in-memory TTL/LRU cache."""
+
+    def test_entries_expire(self):
+        """Test default and per-entry TTLs."""
+        cache = TTLCache(ttl_seconds=60)
+        cache.put("long", 1)
+        cache.put("short", 2, ttl_seconds=0.01)
+        time.sleep(0.02)
+
+        assert cache.get("long") == 1
+        assert cache.get("short") is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_evicts_least_recently_used(self):
+        """Test that reads refresh recency and the oldest entry is evicted."""
+        cache = TTLCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_rejects_empty_capacity(self):
+        """Test constructor validation."""
+        with pytest.raises(ValueError):
+            TTLCache(max_entries=0)
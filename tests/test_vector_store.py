@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from src.pipeline.vector_store import NumpyVectorStore
+
+
+class AxisEmbeddings:
+    """Fake embedding model mapping known words to fixed directions."""
+
+    VECTORS = {"hola": [1.0, 0.0, 0.0], "adiós": [0.0, 1.0, 0.0], "gracias": [0.0, 0.0, 1.0],
+               "hola adiós": [1.0, 1.0, 0.0]}
+
+    def embed_documents(self, texts):
+        return [self.VECTORS[text] for text in texts]
+
+    def embed_query(self, text):
+        return self.VECTORS[text]
+
+
+class TestNumpyVectorStore:
+    """Test suite for the matrix-backed vector store."""
+
+    def test_similarity_search_ranks_by_cosine(self):
+        """Test text search with metadata, ordered by similarity."""
+        store = NumpyVectorStore(AxisEmbeddings())
+        store.add_texts(["hola", "adiós", "hola adiós"], metadatas=[{"i": 0}, {"i": 1}, {"i": 2}])
+
+        results = store.similarity_search_with_score("hola", k=2)
+
+        assert [(doc.page_content, doc.metadata) for doc, _ in results] == [("hola", {"i": 0}), ("hola adiós", {"i": 2})]
+        assert results[0][1] == pytest.approx(1.0)
+        assert results[1][1] == pytest.approx(np.sqrt(0.5))
+        assert len(store.similarity_search("gracias", k=10)) == 3
+
+    def test_top_k_matches_brute_force_across_growth(self):
+        """Test that batched argpartition search equals a full sort after many resizes."""
+        rng = np.random.default_rng(0)
+        vectors = rng.standard_normal((500, 16)).astype(np.float32)
+        store = NumpyVectorStore(embedding=None, initial_capacity=4)
+        for i in range(0, 500, 37):
+            store.add_vectors(vectors[i:i + 37], [str(j) for j in range(i, min(i + 37, 500))])
+
+        queries = rng.standard_normal((5, 16))
+        indices, scores = store.top_k(queries, k=7)
+
+        normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        expected = np.argsort(-(queries @ normalized.T), axis=1)[:, :7]
+        # Capacity doubles, so it stays within 2x of the stored vectors
+        assert len(store) == 500 and 500 * 16 * 4 <= store.nbytes < 2 * 500 * 16 * 4
+        np.testing.assert_array_equal(indices, expected)
+        assert np.all(np.diff(scores, axis=1) <= 0)
+
+    def test_empty_store_and_validation(self):
+        """Test searching an empty store and rejecting mismatched input."""
+        store = NumpyVectorStore(AxisEmbeddings())
+        assert store.similarity_search("hola") == []
+        assert store.add_texts([]) == []
+
+        store.add_vectors([[1.0, 0.0]], ["a"])
+        with pytest.raises(ValueError):
+            store.add_vectors([[1.0, 0.0, 0.0]], ["b"])
+        with pytest.raises(ValueError):
+            store.add_vectors([[1.0, 0.0]], ["b", "c"])
+
+    def test_snapshot_round_trip_is_memory_mapped(self, tmp_path):
+        """Test that a loaded snapshot searches the mapped file and gives the same results."""
+        store = NumpyVectorStore(AxisEmbeddings())
+        store.add_texts(["hola", "adiós", "hola adiós"],
+                        metadatas=[{"start_time": 1.5, "video_id": "v"}, {"note": "ñ"}, {}])
+        path = str(tmp_path / "index.nvs")
+        size = store.save(path)
+
+        loaded = NumpyVectorStore.load(path, AxisEmbeddings())
+
+        assert size == (tmp_path / "index.nvs").stat().st_size
+        assert len(loaded) == 3 and loaded.dim == 3
+        assert not loaded._matrix.flags.writeable
+        assert loaded.similarity_search_with_score("hola", k=3) == store.similarity_search_with_score("hola", k=3)
+        assert loaded.similarity_search("adiós", k=1)[0].metadata == {"note": "ñ"}
+
+    def test_snapshot_accepts_additions_after_load(self, tmp_path):
+        """Test that adding to a loaded store copies the mapped data instead of writing to it."""
+        path = str(tmp_path / "index.nvs")
+        store = NumpyVectorStore(AxisEmbeddings())
+        store.add_texts(["hola", "adiós"])
+        store.save(path)
+
+        loaded = NumpyVectorStore.load(path, AxisEmbeddings())
+        loaded.add_texts(["gracias"], metadatas=[{"i": 2}])
+
+        assert len(loaded) == 3
+        assert [doc.page_content for doc in loaded.similarity_search("gracias", k=3)][0] == "gracias"
+        assert len(NumpyVectorStore.load(path, AxisEmbeddings())) == 2
+
+    def test_snapshot_rejects_invalid_files(self, tmp_path):
+        """Test that foreign and truncated files raise ValueError."""
+        store = NumpyVectorStore(AxisEmbeddings())
+        store.add_texts(["hola"])
+        path = tmp_path / "index.nvs"
+        store.save(str(path))
+
+        path.write_bytes(path.read_bytes()[:-1])
+        with pytest.raises(ValueError):
+            NumpyVectorStore.load(str(path), AxisEmbeddings())
+        path.write_bytes(b"not a snapshot")
+        with pytest.raises(ValueError):
+            NumpyVectorStore.load(str(path), AxisEmbeddings())
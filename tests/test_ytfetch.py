@@ -7,6 +7,27 @@ import json
 # from ytfetch import YTFetch, search_youtube_and_transcribe
 
 
+def make_transcript_list(video_id, language_code="en", fetched=None):
+    """Build a mock TranscriptList holding a single transcript."""
+    if fetched is None:
+        fetched = Mock()
+        fetched.video_id = video_id
+        fetched.to_raw_data.return_value = [{"text": "Hello", "start": 0.0, "duration": 1.0}]
+    
+    transcript = Mock()
+    transcript.language = "Language"
+    transcript.language_code = language_code
+    transcript.is_generated = False
+    transcript.is_translatable = True
+    transcript.fetch.return_value = fetched
+    
+    transcript_list = MagicMock()
+    transcript_list.video_id = video_id
+    transcript_list.__iter__.side_effect = lambda: iter([transcript])
+    transcript_list.find_transcript.return_value = transcript
+    return transcript_list
+
+
 class TestYTFetch:
     """Test suite for YTFetch with mocked YouTube interactions."""
     
@@ -157,6 +178,45 @@ class TestYTFetch:
             assert results[1]['video_id'] == 'jNQXAC9IVRw'
             assert results[2]['video_id'] == '9bZkp7q19f0'
     
+    def test_search_youtube_uses_search_cache(self, ytfetch_instance, mock_search_response):
+        """Test that a repeated search is served from the search cache."""
+        from src.pipeline.search_cache import SearchCache
+
+        ytfetch_instance.search_cache = SearchCache()
+
+        with patch.object(ytfetch_instance.session, 'get', return_value=mock_search_response) as mock_get:
+            first = ytfetch_instance._search_youtube("Spanish cooking", max_results=2)
+            second = ytfetch_instance._search_youtube("spanish  cooking", max_results=2)
+
+        assert first == second
+        assert len(first) == 2
+        assert mock_get.call_count == 1
+
+    def test_search_youtube_streaming_stops_early(self, ytfetch_instance, mock_search_response):
+        """Test that streaming search stops reading once max_results are found."""
+        body = mock_search_response.text.encode('utf-8')
+        chunks = [body[i:i + 64] for i in range(0, len(body), 64)]
+        chunks_read = []
+        
+        def iter_content(chunk_size=None):
+            for chunk in chunks:
+                chunks_read.append(chunk)
+                yield chunk
+        
+        streamed_response = MagicMock()
+        streamed_response.encoding = 'utf-8'
+        streamed_response.iter_content.side_effect = iter_content
+        streamed_response.__enter__.return_value = streamed_response
+        
+        with patch.object(ytfetch_instance.session, 'get', return_value=streamed_response) as mock_get:
+            results = ytfetch_instance._search_youtube("test query", max_results=1, stream=True)
+        
+        assert [r['video_id'] for r in results] == ['dQw4w9WgXcQ']
+        assert results[0]['title'] == 'Rick Astley - Never Gonna Give You Up'
+        assert mock_get.call_args.kwargs['stream'] is True
+        assert len(chunks_read) < len(chunks)
+        streamed_response.__exit__.assert_called_once()
+    
     def test_transcribe_single_video(self, ytfetch_instance):
         """Test transcribing a single video."""
         url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
@@ -215,7 +275,7 @@ class TestYTFetch:
     def test_transcribe_error_handling(self, ytfetch_instance, mock_transcript_api):
         """Test error handling when transcript is not available."""
         # Make the API raise an exception
-        mock_transcript_api.fetch.side_effect = Exception("No transcript available")
+        mock_transcript_api.list.side_effect = Exception("No transcript available")
         
         with pytest.raises(ValueError) as exc_info:
             ytfetch_instance.transcribe("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
@@ -226,17 +286,15 @@ class TestYTFetch:
         """Test search_and_transcribe when some videos fail."""
         # Make the API fail for the second video
         call_count = 0
-        def fetch_side_effect(*args, **kwargs):
+        def list_side_effect(video_id, *args, **kwargs):
             nonlocal call_count
             call_count += 1
             if call_count == 2:
                 raise Exception("No transcript available")
             else:
-                mock_transcript = Mock()
-                mock_transcript.to_raw_data.return_value = [{"text": "Success", "start": 0, "duration": 1}]
-                return mock_transcript
+                return make_transcript_list(video_id)
         
-        mock_transcript_api.fetch.side_effect = fetch_side_effect
+        mock_transcript_api.list.side_effect = list_side_effect
         
         with patch.object(ytfetch_instance.session, 'get', return_value=mock_search_response):
             results = ytfetch_instance.search_and_transcribe("test", k=2)
@@ -250,6 +308,539 @@ class TestYTFetch:
             assert results[1]['error'] is not None
             assert "No transcript available" in results[1]['error']
 
+    def test_search_and_transcribe_concurrent_keeps_rank_order(self, ytfetch_instance, mock_search_response):
+        """Test that concurrent transcription returns results in search-rank order."""
+        import time
+        
+        def list_side_effect(video_id):
+            # Make the top-ranked video finish last
+            time.sleep({'dQw4w9WgXcQ': 0.05, 'jNQXAC9IVRw': 0.02}.get(video_id, 0))
+            if video_id == 'jNQXAC9IVRw':
+                raise Exception("No transcript available")
+            return make_transcript_list(video_id)
+        
+        ytfetch_instance.api = Mock()
+        ytfetch_instance.api.list.side_effect = list_side_effect
+        
+        with patch.object(ytfetch_instance.session, 'get', return_value=mock_search_response):
+            results = ytfetch_instance.search_and_transcribe("test", k=3, max_concurrency=3)
+        
+        assert [r['video_id'] for r in results] == ['dQw4w9WgXcQ', 'jNQXAC9IVRw', '9bZkp7q19f0']
+        assert results[0]['error'] is None
+        assert "No transcript available" in results[1]['error']
+        assert results[2]['transcript'] is not None
+    
+    def test_transcribe_lists_once_when_falling_back(self, ytfetch_instance):
+        """Test that falling back to another language reuses the same transcript list."""
+        transcript_list = make_transcript_list("dQw4w9WgXcQ", language_code="en")
+        transcript_list.find_transcript.side_effect = Exception("No transcript found")
+        ytfetch_instance.api = Mock()
+        ytfetch_instance.api.list.return_value = transcript_list
+        
+        transcript = ytfetch_instance.transcribe(
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ", target_language='es', format_as_text=False
+        )
+        
+        assert transcript == [{"text": "Hello", "start": 0.0, "duration": 1.0}]
+        ytfetch_instance.api.list.assert_called_once_with("dQw4w9WgXcQ")
+        ytfetch_instance.api.fetch.assert_not_called()
+    
+    def test_list_transcripts_then_transcribe_from_list(self, ytfetch_instance):
+        """Test checking languages and fetching from a single listing."""
+        ytfetch_instance.api = Mock()
+        ytfetch_instance.api.list.return_value = make_transcript_list("dQw4w9WgXcQ", language_code="es")
+        
+        transcript_list = ytfetch_instance.list_transcripts("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+        languages = ytfetch_instance.describe_transcripts(transcript_list)
+        transcript = ytfetch_instance.transcribe_from_list(transcript_list, target_language='es', format_as_text=False)
+        
+        assert [lang['language_code'] for lang in languages] == ['es']
+        assert transcript == [{"text": "Hello", "start": 0.0, "duration": 1.0}]
+        assert ytfetch_instance.api.list.call_count == 1
+    
+    def test_transcribe_many_dedupes_and_isolates_errors(self, ytfetch_instance):
+        """Test batch transcription with duplicates, a failing video and an invalid URL."""
+        def list_side_effect(video_id):
+            if video_id == 'jNQXAC9IVRw':
+                raise Exception("Transcripts are disabled")
+            return make_transcript_list(video_id)
+        
+        ytfetch_instance.api = Mock()
+        ytfetch_instance.api.list.side_effect = list_side_effect
+        urls = [
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://www.youtube.com/watch?v=jNQXAC9IVRw",
+            "https://vimeo.com/123456",
+        ]
+        
+        results = list(ytfetch_instance.transcribe_many(urls, max_concurrency=3, format_as_text=False))
+        by_id = {r['video_id']: r for r in results}
+        
+        assert len(results) == 3
+        assert ytfetch_instance.api.list.call_count == 2
+        assert by_id['dQw4w9WgXcQ']['transcript'] == [{"text": "Hello", "start": 0.0, "duration": 1.0}]
+        assert "disabled" in by_id['jNQXAC9IVRw']['error']
+        assert by_id[None]['url'] == "https://vimeo.com/123456"
+    
+    def test_transcribe_many_resumes_from_checkpoint(self, ytfetch_instance, tmp_path):
+        """Test that completed IDs are checkpointed and skipped on the next run."""
+        ytfetch_instance.api = Mock()
+        ytfetch_instance.api.list.side_effect = make_transcript_list
+        checkpoint = tmp_path / "done.txt"
+        checkpoint.write_text("dQw4w9WgXcQ\n")
+        urls = [
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://www.youtube.com/watch?v=jNQXAC9IVRw",
+        ]
+        
+        first_run = list(ytfetch_instance.transcribe_many(urls, checkpoint_path=str(checkpoint)))
+        second_run = list(ytfetch_instance.transcribe_many(urls, checkpoint_path=str(checkpoint)))
+        
+        assert [r['video_id'] for r in first_run] == ['jNQXAC9IVRw']
+        assert second_run == []
+        assert checkpoint.read_text().split() == ['dQw4w9WgXcQ', 'jNQXAC9IVRw']
+    
+    def test_transcribe_uses_transcript_cache(self, ytfetch_instance, tmp_path):
+        """Test that a cached transcript is served without calling the API."""
+        from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+        from src.pipeline.transcript_cache import TranscriptCache
+        
+        fetched = FetchedTranscript(
+            snippets=[FetchedTranscriptSnippet(text="Hola", start=0.0, duration=1.0)],
+            video_id="dQw4w9WgXcQ", language="Spanish", language_code="es", is_generated=False
+        )
+        ytfetch_instance.api = Mock()
+        ytfetch_instance.api.list.return_value = make_transcript_list("dQw4w9WgXcQ", fetched=fetched)
+        ytfetch_instance.transcript_cache = TranscriptCache(cache_dir=str(tmp_path))
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        
+        first = ytfetch_instance.transcribe(url, target_language='es', format_as_text=False)
+        second = ytfetch_instance.transcribe(url, target_language='es', format_as_text=False)
+        
+        assert first == second == [{"text": "Hola", "start": 0.0, "duration": 1.0}]
+        assert ytfetch_instance.api.list.call_count == 1
+        assert ytfetch_instance.transcript_cache.stats()["hits"] == 1
+    
+    def test_transcribe_fallback_language_uses_transcript_cache(self, ytfetch_instance, tmp_path):
+        """Test that a transcript picked by the language fallback is fetched once and then cached."""
+        from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+        from src.pipeline.transcript_cache import TranscriptCache
+
+        fetched = FetchedTranscript(
+            snippets=[FetchedTranscriptSnippet(text="Hola", start=0.0, duration=1.0)],
+            video_id="dQw4w9WgXcQ", language="Spanish", language_code="es", is_generated=False
+        )
+        transcript_list = make_transcript_list("dQw4w9WgXcQ", language_code="es", fetched=fetched)
+        transcript_list.find_transcript.side_effect = Exception("No transcript in ['en']")
+        ytfetch_instance.api = Mock()
+        ytfetch_instance.api.list.return_value = transcript_list
+        ytfetch_instance.transcript_cache = TranscriptCache(cache_dir=str(tmp_path))
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+        results = [ytfetch_instance.transcribe(url, format_as_text=False) for _ in range(3)]
+
+        assert results == [[{"text": "Hola", "start": 0.0, "duration": 1.0}]] * 3
+        next(iter(transcript_list)).fetch.assert_called_once()
+        assert ytfetch_instance.transcript_cache.stats()["hits"] == 2
+
+    def test_transcribe_segments_from_fetch_and_cache(self, ytfetch_instance, tmp_path):
+        """Test columnar transcripts, served from the cache on repeat calls."""
+        from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+        from src.pipeline.transcript_cache import TranscriptCache
+
+        fetched = FetchedTranscript(
+            snippets=[FetchedTranscriptSnippet(text="Hola", start=0.0, duration=1.0),
+                      FetchedTranscriptSnippet(text="amigos", start=1.0, duration=2.0)],
+            video_id="dQw4w9WgXcQ", language="Spanish", language_code="es", is_generated=False
+        )
+        ytfetch_instance.api = Mock()
+        ytfetch_instance.api.list.return_value = make_transcript_list("dQw4w9WgXcQ", fetched=fetched)
+        ytfetch_instance.transcript_cache = TranscriptCache(cache_dir=str(tmp_path))
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+        first = ytfetch_instance.transcribe_segments(url, target_language='es')
+        second = ytfetch_instance.transcribe_segments(url, target_language='es')
+
+        assert first == second
+        assert first.to_raw_data() == fetched.to_raw_data()
+        assert second.time_slice(1.5, 2.0).texts() == ["amigos"]
+        assert ytfetch_instance.api.list.call_count == 1
+
+    def test_transcribe_segments_from_list_reuses_listing(self, ytfetch_instance):
+        """Test that timed segments are fetched from an existing transcript list."""
+        from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+
+        fetched = FetchedTranscript(
+            snippets=[FetchedTranscriptSnippet(text="Hola", start=3.0, duration=1.0)],
+            video_id="dQw4w9WgXcQ", language="Spanish", language_code="es", is_generated=False
+        )
+        ytfetch_instance.api = Mock()
+        transcript_list = make_transcript_list("dQw4w9WgXcQ", language_code="es", fetched=fetched)
+
+        segments = ytfetch_instance.transcribe_segments_from_list(transcript_list, target_language='es')
+
+        assert segments.to_raw_data() == fetched.to_raw_data()
+        assert segments.language_code == "es"
+        ytfetch_instance.api.list.assert_not_called()
+
+    def test_debug_transcript_access_probes_concurrently_with_timeout(self, ytfetch_instance):
+        """Test that probes run in parallel, are timed, and hung probes time out."""
+        import threading
+        import time
+
+        release = threading.Event()
+
+        def make_transcript(language_code, fetch):
+            transcript = Mock()
+            transcript.language = language_code
+            transcript.language_code = language_code
+            transcript.is_generated = True
+            transcript.is_translatable = False
+            transcript.fetch.side_effect = fetch
+            return transcript
+
+        fetched = Mock()
+        fetched.to_raw_data.return_value = [{"text": "olá", "start": 0.0, "duration": 1.0}] * 2
+
+        def fail():
+            raise Exception("Could not retrieve a transcript")
+
+        transcript_list = MagicMock()
+        transcript_list.__iter__.side_effect = lambda: iter([
+            make_transcript("pt", lambda: fetched),
+            make_transcript("de", fail),
+            make_transcript("ja", lambda: release.wait(5) and fetched),
+        ])
+        ytfetch_instance.api = Mock()
+        ytfetch_instance.api.list.return_value = transcript_list
+
+        start = time.perf_counter()
+        info = ytfetch_instance.debug_transcript_access(
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ", probe_timeout=0.2
+        )
+        elapsed = time.perf_counter() - start
+        release.set()
+
+        by_language = {t['language_code']: t for t in info['transcripts']}
+        assert elapsed < 2
+        assert by_language['pt']['fetch_success'] is True
+        assert by_language['pt']['entry_count'] == 2
+        assert by_language['pt']['byte_size'] == 8
+        assert by_language['pt']['latency'] is not None
+        assert "Could not retrieve" in by_language['de']['fetch_error']
+        assert "Timed out" in by_language['ja']['fetch_error']
+        assert by_language['ja']['fetch_success'] is False
+        assert len(info['errors']) == 2
+        assert info['latency_profile']['probes'] == 2
+
+    def test_debug_probe_queued_behind_fast_one_times_out_on_time(self, ytfetch_instance):
+        """Test that a hung probe starting while the loop waits still times out near probe_timeout."""
+        import threading
+        import time
+
+        release = threading.Event()
+
+        def make_transcript(language_code, fetch):
+            transcript = Mock()
+            transcript.language = language_code
+            transcript.language_code = language_code
+            transcript.is_generated = True
+            transcript.is_translatable = False
+            transcript.fetch.side_effect = fetch
+            return transcript
+
+        fetched = Mock()
+        fetched.to_raw_data.return_value = [{"text": "olá", "start": 0.0, "duration": 1.0}]
+
+        transcript_list = MagicMock()
+        transcript_list.__iter__.side_effect = lambda: iter([
+            make_transcript("pt", lambda: fetched),
+            make_transcript("ja", lambda: release.wait(5) and fetched),
+        ])
+        ytfetch_instance.api = Mock()
+        ytfetch_instance.api.list.return_value = transcript_list
+
+        start = time.perf_counter()
+        info = ytfetch_instance.debug_transcript_access(
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ", max_concurrency=1, probe_timeout=0.5
+        )
+        elapsed = time.perf_counter() - start
+        release.set()
+
+        by_language = {t['language_code']: t for t in info['transcripts']}
+        assert by_language['pt']['fetch_success'] is True
+        assert "Timed out" in by_language['ja']['fetch_error']
+        # Bounded by probe_timeout, not the give-up bound of 0.5 * (2 // 1 + 2) = 2s
+        assert elapsed < 1.0
+
+    def test_iter_search_and_transcribe_yields_every_rank(self, ytfetch_instance, mock_search_response):
+        """Test the completion-order iterator yields each search hit exactly once."""
+        ytfetch_instance.api = Mock()
+        ytfetch_instance.api.list.side_effect = make_transcript_list
+        
+        with patch.object(ytfetch_instance.session, 'get', return_value=mock_search_response):
+            completed = list(ytfetch_instance.iter_search_and_transcribe("test", k=3, max_concurrency=2))
+        
+        assert sorted(rank for rank, _ in completed) == [0, 1, 2]
+        for rank, result in completed:
+            assert result['error'] is None
+
+    def test_transcribe_translations_lists_once_and_caches(self, ytfetch_instance, tmp_path):
+        """Test multi-target translation from one listing, with cached repeats."""
+        from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+        from src.pipeline.transcript_cache import TranslationCache
+
+        def translate(language_code):
+            if language_code == 'xx':
+                raise Exception("Translation language not available")
+            translated = Mock()
+            translated.fetch.return_value = FetchedTranscript(
+                snippets=[FetchedTranscriptSnippet(text=f"Hello ({language_code})", start=0.0, duration=1.0)],
+                video_id="dQw4w9WgXcQ", language=language_code, language_code=language_code, is_generated=True
+            )
+            return translated
+
+        transcript_list = make_transcript_list("dQw4w9WgXcQ")
+        transcript_list.find_transcript.return_value.translate.side_effect = translate
+        ytfetch_instance.api = Mock()
+        ytfetch_instance.api.list.return_value = transcript_list
+        ytfetch_instance.translation_cache = TranslationCache(cache_dir=str(tmp_path))
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+        first = ytfetch_instance.transcribe_translations(
+            url, ['es', 'fr', 'xx', 'es'], format_as_text=False, max_concurrency=3
+        )
+        spanish = ytfetch_instance.transcribe_with_translation(url, 'es', format_as_text=False)
+
+        assert list(first) == ['es', 'fr', 'xx']
+        assert first['fr']['transcript'][0]['text'] == "Hello (fr)"
+        assert "not available" in first['xx']['error']
+        assert spanish[0]['text'] == "Hello (es)"
+        assert ytfetch_instance.api.list.call_count == 1
+        transcript_list.find_transcript.assert_called_once_with(['en'])
+
+    def test_transcribe_translations_fetches_concurrently_by_default(self, ytfetch_instance):
+        """Test that a default (max_concurrency=1) fetcher still overlaps translation fetches."""
+        import threading
+        import time
+        from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+
+        lock = threading.Lock()
+        spans = []
+
+        def translate(language_code):
+            def fetch():
+                started = time.perf_counter()
+                time.sleep(0.2)
+                with lock:
+                    spans.append((started, time.perf_counter()))
+                return FetchedTranscript(
+                    snippets=[FetchedTranscriptSnippet(text=language_code, start=0.0, duration=1.0)],
+                    video_id="dQw4w9WgXcQ", language=language_code, language_code=language_code, is_generated=True
+                )
+            translated = Mock()
+            translated.fetch.side_effect = fetch
+            return translated
+
+        transcript_list = make_transcript_list("dQw4w9WgXcQ")
+        transcript_list.find_transcript.return_value.translate.side_effect = translate
+        ytfetch_instance.api = Mock()
+        ytfetch_instance.api.list.return_value = transcript_list
+
+        results = ytfetch_instance.transcribe_translations(
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ", ['es', 'fr', 'de', 'it'], format_as_text=False
+        )
+
+        assert ytfetch_instance.max_concurrency == 1
+        assert all(result['error'] is None for result in results.values())
+        # Every fetch started before any of them finished
+        assert max(start for start, _ in spans) < min(end for _, end in spans)
+
+    def test_negative_cache_short_circuits_repeat_failures(self, ytfetch_instance):
+        """Test that disabled transcripts and missing languages are remembered."""
+        from youtube_transcript_api import TranscriptsDisabled
+        from src.pipeline.negative_cache import NegativeCache
+
+        def list_side_effect(video_id):
+            if video_id == 'jNQXAC9IVRw':
+                raise TranscriptsDisabled(video_id)
+            return make_transcript_list(video_id, language_code="en")
+
+        ytfetch_instance.negative_cache = NegativeCache()
+        ytfetch_instance.api = Mock()
+        ytfetch_instance.api.list.side_effect = list_side_effect
+        disabled_url = "https://www.youtube.com/watch?v=jNQXAC9IVRw"
+        english_url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Could not fetch transcript"):
+                ytfetch_instance.transcribe(disabled_url)
+        checks = [ytfetch_instance.check_language(english_url, 'es') for _ in range(2)]
+
+        assert ytfetch_instance.api.list.call_count == 2
+        assert [available for available, _, _ in checks] == [False, False]
+        assert checks[1][1][0]['language_code'] == 'en'
+        assert ytfetch_instance.negative_cache_stats()['hits'] == 2
+
+    def test_negative_cache_counts_each_request_once(self, ytfetch_instance):
+        """Test that check_language counts one lookup per call, including on a disabled video."""
+        from youtube_transcript_api import TranscriptsDisabled
+        from src.pipeline.negative_cache import NegativeCache
+
+        ytfetch_instance.negative_cache = NegativeCache()
+        ytfetch_instance.api = Mock()
+        ytfetch_instance.api.list.return_value = make_transcript_list("dQw4w9WgXcQ", language_code="en")
+        for _ in range(3):
+            ytfetch_instance.check_language("https://www.youtube.com/watch?v=dQw4w9WgXcQ", 'es')
+
+        assert ytfetch_instance.api.list.call_count == 1
+        stats = ytfetch_instance.negative_cache_stats()
+        assert (stats['hits'], stats['misses']) == (2, 1)
+
+        ytfetch_instance.negative_cache.clear()
+        ytfetch_instance.api.list.side_effect = TranscriptsDisabled("jNQXAC9IVRw")
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                ytfetch_instance.check_language("https://www.youtube.com/watch?v=jNQXAC9IVRw", 'en')
+
+        stats = ytfetch_instance.negative_cache_stats()
+        assert (stats['hits'], stats['misses']) == (2, 1)
+
+    def test_blocked_proxy_is_ejected_and_listing_retried(self, ytfetch_instance):
+        """Test that a listing blocked on one pool proxy is retried on another."""
+        from youtube_transcript_api import RequestBlocked
+        from src.pipeline.proxy_pool import ProxyPool, ProxyPoolSession
+
+        pool = ProxyPool(["http://a:1", "http://b:1"])
+        ytfetch_instance.proxy_pool = pool
+        ytfetch_instance.session = ProxyPoolSession(pool)
+        ytfetch_instance.api = Mock()
+        ytfetch_instance.api.list.side_effect = [
+            RequestBlocked("dQw4w9WgXcQ"), make_transcript_list("dQw4w9WgXcQ")
+        ]
+
+        transcript = ytfetch_instance.transcribe(
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ", format_as_text=False
+        )
+
+        assert transcript == [{"text": "Hello", "start": 0.0, "duration": 1.0}]
+        assert ytfetch_instance.api.list.call_count == 2
+        assert [stat["healthy"] for stat in ytfetch_instance.proxy_stats()] == [True, False]
+
+    def test_api_is_per_thread_on_shared_session(self):
+        """Test that each thread gets its own YouTubeTranscriptApi, all on the pooled session."""
+        import threading
+        from src.pipeline.yt_fetch import YTFetch
+
+        with patch('src.pipeline.yt_fetch.YouTubeTranscriptApi', side_effect=lambda **kwargs: Mock(**kwargs)):
+            fetcher = YTFetch()
+            apis = []
+            threads = [threading.Thread(target=lambda: apis.extend([fetcher.api] * 2)) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            main_api = fetcher.api
+
+        assert apis[0] is apis[1] and apis[2] is apis[3]
+        assert len({id(apis[0]), id(apis[2]), id(main_api)}) == 3
+        assert all(api.http_client is fetcher.session for api in apis)
+        assert fetcher.session.get_adapter("https://www.youtube.com") is fetcher.http_adapter
+
+    def test_rotating_proxy_bounds_blocked_attempts(self):
+        """Test that a permanently blocked listing makes exactly retries_when_blocked attempts, without backoff."""
+        from youtube_transcript_api import RequestBlocked
+        from src.pipeline.http_session import DEFAULT_MAX_RETRIES
+        from src.pipeline.yt_fetch import YTFetch
+
+        fetcher = YTFetch(webshare_username="user", webshare_password="pass")
+        fetcher.api = Mock()
+        fetcher.api.list.side_effect = RequestBlocked("dQw4w9WgXcQ")
+
+        with patch("time.sleep") as sleep, pytest.raises(ValueError):
+            fetcher.list_transcripts("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+
+        assert fetcher.api.list.call_count == fetcher.proxy_config.retries_when_blocked == 10
+        sleep.assert_not_called()
+        # The adapter keeps its own retry budget and leaves 429 to the listing retries
+        retry = fetcher.http_adapter.max_retries
+        assert retry.total == DEFAULT_MAX_RETRIES
+        assert 429 not in retry.status_forcelist and 503 in retry.status_forcelist
+
+    def test_proxy_pool_adapter_leaves_blocks_to_pool(self):
+        """Test that a pool session's adapter retries 5xx but not throttled responses."""
+        from src.pipeline.yt_fetch import YTFetch
+
+        fetcher = YTFetch.with_proxy_pool(["http://a:1", "http://b:1"])
+
+        retry = fetcher.session.get_adapter("https://www.youtube.com").max_retries
+        assert 429 not in retry.status_forcelist and 503 in retry.status_forcelist
+        assert not retry.is_retry("GET", 429, has_retry_after=True)
+
+    def test_blocked_listing_retried_for_rotating_proxy(self):
+        """Test that retries_when_blocked is honoured without a proxy config on the per-thread APIs."""
+        from youtube_transcript_api import RequestBlocked
+        from src.pipeline.yt_fetch import YTFetch
+
+        fetcher = YTFetch(webshare_username="user", webshare_password="pass")
+        fetcher.api = Mock()
+        fetcher.api.list.side_effect = [RequestBlocked("dQw4w9WgXcQ"), make_transcript_list("dQw4w9WgXcQ")]
+
+        fetcher.list_transcripts("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+
+        assert fetcher.api.list.call_count == 2
+        assert fetcher.session.get_adapter("https://www.youtube.com") is fetcher.http_adapter
+
+    def test_async_search_and_transcribe_bounds_concurrency(self, ytfetch_instance, mock_search_response):
+        """Test that AsyncYTFetch keeps rank order and never exceeds max_concurrency."""
+        import asyncio
+        import threading
+        import time
+        from src.pipeline.async_yt_fetch import AsyncYTFetch
+
+        lock = threading.Lock()
+        in_flight = []
+        peak = []
+
+        def list_side_effect(video_id):
+            with lock:
+                in_flight.append(video_id)
+                peak.append(len(in_flight))
+            time.sleep(0.02)
+            with lock:
+                in_flight.remove(video_id)
+            return make_transcript_list(video_id)
+
+        ytfetch_instance.api = Mock()
+        ytfetch_instance.api.list.side_effect = list_side_effect
+
+        async def run():
+            async with AsyncYTFetch(fetcher=ytfetch_instance, max_concurrency=2) as fetcher:
+                return await fetcher.search_and_transcribe("test", k=3)
+
+        with patch.object(ytfetch_instance.session, 'get', return_value=mock_search_response):
+            results = asyncio.run(run())
+
+        assert [r['video_id'] for r in results] == ['dQw4w9WgXcQ', 'jNQXAC9IVRw', '9bZkp7q19f0']
+        assert all(r['error'] is None for r in results)
+        assert max(peak) <= 2
+
+    def test_async_transcribe_propagates_errors(self, ytfetch_instance):
+        """Test that AsyncYTFetch raises the same errors as the sync client."""
+        import asyncio
+        from src.pipeline.async_yt_fetch import AsyncYTFetch
+
+        ytfetch_instance.api = Mock()
+        ytfetch_instance.api.list.side_effect = Exception("Transcripts are disabled")
+
+        async def run():
+            async with AsyncYTFetch(fetcher=ytfetch_instance, max_concurrency=1) as fetcher:
+                return await fetcher.transcribe("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+
+        with pytest.raises(ValueError, match="Could not fetch transcript"):
+            asyncio.run(run())
+
 
 class TestStandaloneFunction:
     """Test the standalone search_youtube_and_transcribe function."""